@@ -0,0 +1,17 @@
+"""Headless pad-eye design calculations used by the Streamlit tool.
+
+Importing the package only loads the standard-library core; the NumPy,
+pandas and PIL based modules (engine, schedule, selection, optimizer,
+reliability, diagram) are imported explicitly by the callers that need them.
+"""
+
+from padeye.data import (
+    F_BY_FACTOR, F_V_FACTOR, F_T_FACTOR, F_TE_FACTOR,
+    ALLOWABLE_WELD_STRESS, ALLOWABLE_VM_FACTOR, CONVERSION_FACTOR,
+    SHACKLE_SERIES, shackle_data,
+)
+from padeye.core import (
+    CHECK_NAMES, INPUT_FIELDS, shackle_properties, derive_geometry, shackle_clearances,
+    design_loads, run_checks, weld_applicable, check_design, design_constants,
+)
+from padeye.graph import DesignGraph
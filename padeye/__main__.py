@@ -0,0 +1,5 @@
+import sys
+
+from padeye.cli import main
+
+sys.exit(main())
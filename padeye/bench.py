@@ -0,0 +1,279 @@
+"""Benchmark suite for the design calculations, CLI cold start, the diagram and full page reruns.
+
+    python -m padeye.bench -o bench.json
+    python -m padeye.bench -o bench.json --baseline baseline.json --threshold 0.2
+
+Inputs are drawn from ``shackle_data`` with a fixed seed, so every run times
+the same cases. Results are written as JSON ({"meta": ..., "metrics": {name:
+{"value", "unit", "better"}}}); with ``--baseline`` each metric is compared
+to the stored one and the command exits with status 1 if any is worse by
+more than the threshold (a fraction, 0.2 = 20 %). Produce the baseline with
+``-o`` on the machine that gates the build; timings do not transfer between
+machines.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from padeye.core import check_design, derive_geometry, shackle_properties
+from padeye.data import shackle_data
+from padeye.schedule import evaluate_schedule
+
+BENCHMARKS = ("scalar", "batch", "coldstart", "diagram", "rerun")
+BATCH_SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+QUICK_BATCH_SIZES = {"1k": 1_000, "100k": 100_000}
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "updated_pad_eye.py")
+
+_FY_GRADES = (235.0, 275.0, 355.0, 420.0, 460.0)
+_WELD_SIZES = (0.0, 4.0, 6.0, 8.0, 10.0)
+
+
+def make_cases(n, seed=0):
+    """``n`` reproducible designs as a schedule DataFrame with the ``INPUT_FIELDS`` columns.
+
+    Loads are drawn between 20 % and 120 % of the shackle SWL so that both
+    passing and failing designs are timed.
+    """
+    rng = np.random.default_rng(seed)
+    keys = np.array(list(shackle_data), dtype=object)
+    shackle = keys[rng.integers(0, len(keys), n)]
+    swl_kn = np.array([shackle_data[k]["SWL"] for k in shackle], dtype=float) * 10
+    return pd.DataFrame({
+        "Ps": np.round(swl_kn * rng.uniform(0.2, 1.2, n), 2),
+        "DAF": np.round(rng.uniform(1.0, 2.0, n), 2),
+        "theta": np.round(rng.uniform(30.0, 90.0, n), 1),
+        "phi": np.round(rng.uniform(0.0, 15.0, n), 1),
+        "fop": np.round(rng.uniform(0.0, 10.0, n), 1),
+        "shackle": shackle,
+        "fy": rng.choice(_FY_GRADES, n),
+        "twc": rng.choice(_WELD_SIZES, n),
+        "dr": np.round(rng.uniform(0.0, 40.0, n), 1),
+        "min_spread": np.round(rng.uniform(0.0, 80.0, n), 1),
+    })
+
+
+def _median_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _metric(value, unit, better="lower"):
+    return {"value": value, "unit": unit, "better": better}
+
+
+def bench_scalar(seed, quick):
+    """Per-case latency of ``core.check_design``."""
+    n = 500 if quick else 2_000
+    designs = make_cases(n, seed).to_dict("records")
+
+    def run():
+        for design in designs:
+            check_design(**design)
+
+    return {"scalar_check": _metric(_median_time(run, 5) / n * 1e6, "us")}
+
+
+def bench_batch(seed, quick):
+    """Rows per second of the vectorized schedule evaluation."""
+    metrics = {}
+    for label, n in (QUICK_BATCH_SIZES if quick else BATCH_SIZES).items():
+        df = make_cases(n, seed)
+        seconds = _median_time(lambda: evaluate_schedule(df), 1 if n >= 1_000_000 else 3)
+        metrics[f"batch_{label}"] = _metric(n / seconds, "rows/s", "higher")
+    return metrics
+
+
+def bench_coldstart(seed, quick):
+    """Wall time of ``python -m padeye`` on a small CSV, and of a bare interpreter for reference.
+
+    Each run is a fresh process, so this covers interpreter start-up, the
+    imports the CLI pulls in and the checks themselves.
+    """
+    repeat = 5 if quick else 15
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "designs.csv")
+        make_cases(10, seed).to_csv(path, index=False)
+        cli = [sys.executable, "-m", "padeye", path, "-o", os.path.join(tmp, "results.json")]
+        bare = [sys.executable, "-c", "pass"]
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), os.environ.get("PYTHONPATH")])))
+        subprocess.run(cli, check=True, env=env)  # warm the OS file cache and bytecode
+        cli_time = _median_time(lambda: subprocess.run(cli, check=True, env=env), repeat)
+        bare_time = _median_time(lambda: subprocess.run(bare, check=True, env=env), repeat)
+    return {
+        "coldstart_cli": _metric(cli_time * 1e3, "ms"),
+        "coldstart_overhead": _metric((cli_time - bare_time) * 1e3, "ms"),
+    }
+
+
+def bench_diagram(seed, quick):
+    """Time to draw the schematic and to PNG-encode it, and to build the SVG, per drawing."""
+    import io
+
+    from padeye.diagram import draw_diagram
+    from padeye.svg import diagram_svg
+
+    keys = list(dict.fromkeys(make_cases(10 if quick else 40, seed)["shackle"]))
+    geometries = []
+    for key in keys:
+        _, A_val, B_val, C_val = shackle_properties(key)
+        geom = derive_geometry(A_val, B_val, C_val)
+        geometries.append((geom["R"], geom["dh"], geom["r_val"], geom["t_val"], geom["l_val"], geom["T"]))
+    images = [draw_diagram(*g) for g in geometries]
+
+    def encode():
+        for image in images:
+            image.save(io.BytesIO(), format="PNG")
+
+    draw = _median_time(lambda: [draw_diagram(*g) for g in geometries], 5)
+    svg = _median_time(lambda: [diagram_svg(*g) for g in geometries], 5)
+    return {
+        "diagram_draw": _metric(draw / len(geometries) * 1e3, "ms"),
+        "diagram_png_encode": _metric(_median_time(encode, 5) / len(images) * 1e3, "ms"),
+        "diagram_svg": _metric(svg / len(geometries) * 1e3, "ms"),
+    }
+
+
+def _set_number(at, label, value):
+    for widget in at.number_input:
+        if label in widget.label:
+            widget.set_value(value)
+
+
+def bench_rerun(seed, quick, app=DEFAULT_APP):
+    """First run and median rerun of the single-design page in Streamlit's headless ``AppTest``."""
+    from streamlit.testing.v1 import AppTest
+
+    design = make_cases(1, seed).iloc[0]
+    at = AppTest.from_file(app, default_timeout=120)
+    start = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - start
+
+    _set_number(at, "(Ps)", float(design["Ps"]))
+    _set_number(at, "DAF", float(design["DAF"]))
+    _set_number(at, "(θ)", float(design["theta"]))
+    _set_number(at, "(φ)", float(design["phi"]))
+    _set_number(at, "Yield Strength", float(design["fy"]))
+    at.selectbox[0].set_value(design["shackle"])
+    at.run()
+
+    # Each rerun changes the weld size and presses the compute button, as a user would
+    times = []
+    for i in range(5 if quick else 20):
+        _set_number(at, "(twc)", float(4 + i % 2))
+        at.button[0].click()
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(f"page raised: {at.exception[0].message}")
+    return {
+        "rerun_first": _metric(first * 1e3, "ms"),
+        "rerun": _metric(statistics.median(times) * 1e3, "ms"),
+    }
+
+
+def run_benchmarks(only=BENCHMARKS, seed=0, quick=False, app=DEFAULT_APP, progress=None):
+    """Run the selected benchmarks; returns {"meta": ..., "metrics": ...}."""
+    runners = {"scalar": bench_scalar, "batch": bench_batch, "coldstart": bench_coldstart, "diagram": bench_diagram,
+               "rerun": lambda s, q: bench_rerun(s, q, app)}
+    metrics = {}
+    for name in only:
+        if progress:
+            progress(name)
+        metrics.update(runners[name](seed, quick))
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "seed": seed,
+            "quick": quick,
+        },
+        "metrics": metrics,
+    }
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Compare metrics to a baseline; returns a list of rows with a "regressed" flag.
+
+    A metric regresses when it is worse than the baseline by more than
+    ``threshold`` (0.2 = 20 % slower or 20 % less throughput). Metrics missing
+    from either side are skipped.
+    """
+    rows = []
+    for name, metric in results["metrics"].items():
+        base = baseline.get("metrics", {}).get(name)
+        if base is None or not base["value"]:
+            continue
+        ratio = metric["value"] / base["value"]
+        worse = ratio if metric["better"] == "lower" else 1.0 / ratio if ratio else float("inf")
+        rows.append({"name": name, "value": metric["value"], "baseline": base["value"],
+                     "unit": metric["unit"], "change": ratio - 1.0, "regressed": worse > 1.0 + threshold})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m padeye.bench", description="Run the pad-eye benchmarks.")
+    parser.add_argument("-o", "--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"allowed slowdown as a fraction (default {DEFAULT_THRESHOLD})")
+    parser.add_argument("--only", default=",".join(BENCHMARKS),
+                        help=f"comma-separated subset of {', '.join(BENCHMARKS)}")
+    parser.add_argument("--quick", action="store_true", help="smaller inputs and fewer repeats (skips 1M rows)")
+    parser.add_argument("--seed", type=int, default=0, help="input generation seed (default 0)")
+    parser.add_argument("--app", default=DEFAULT_APP, help="Streamlit script for the rerun benchmark")
+    args = parser.parse_args(argv)
+
+    only = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = [name for name in only if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(unknown)}")
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            parser.exit(2, f"{parser.prog}: error: cannot read baseline: {e}\n")
+
+    results = run_benchmarks(only, args.seed, args.quick, args.app,
+                             progress=lambda name: print(f"running {name}...", file=sys.stderr))
+    for name, metric in results["metrics"].items():
+        print(f"{name:<22} {metric['value']:>14,.2f} {metric['unit']}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+    if baseline is None:
+        return 0
+    rows = compare(results, baseline, args.threshold)
+    print(f"\nagainst {args.baseline} (threshold {args.threshold:.0%}):")
+    for row in rows:
+        flag = "REGRESSED" if row["regressed"] else "ok"
+        print(f"{row['name']:<22} {row['change']:>+8.1%}  {flag}")
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
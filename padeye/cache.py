@@ -0,0 +1,154 @@
+"""Persistent SQLite cache of ``check_design`` results.
+
+Entries are keyed by a SHA-256 of the normalized design inputs together with
+the design constants (check factors, weld allowable, unit conversion, the
+shackle's catalogue entry and the core formula version). A change to any of
+those yields new keys, and the cache also clears itself when it is opened
+with a different set of constants than it was written with, so stale results
+are never returned. The least recently used entries are evicted once the
+cache grows past ``max_entries``.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from padeye.core import INPUT_FIELDS, check_design, design_constants
+from padeye.data import shackle_data
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    "PADEYE_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "padeye", "results.sqlite"))
+DEFAULT_MAX_ENTRIES = 100_000
+# Inputs are rounded before hashing so that float noise does not defeat the cache
+KEY_DECIMALS = 6
+
+_SQL_BATCH = 500
+
+
+def _fingerprint(obj):
+    return hashlib.sha256(json.dumps(obj, sort_keys=True).encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _shackle_fingerprint(shackle):
+    # Constants are bound at import, so they and each catalogue entry are hashed once per process
+    return _fingerprint({"shackle": shackle_data.get(shackle), "constants": design_constants()})
+
+
+def design_key(design):
+    """Cache key for a design dict with the fields in ``INPUT_FIELDS``."""
+    normalized = []
+    for field in INPUT_FIELDS:
+        value = design.get(field, 0.0)
+        normalized.append(str(value).strip() if field == "shackle" else repr(round(float(value), KEY_DECIMALS) + 0.0))
+    shackle = normalized[INPUT_FIELDS.index("shackle")]
+    text = "|".join([_shackle_fingerprint(shackle), *normalized])
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ResultCache:
+    """SQLite-backed ``check_design`` cache with LRU eviction and hit/miss counters.
+
+    Safe to share between threads; several processes may use the same file.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS results "
+                               "(key TEXT PRIMARY KEY, payload TEXT NOT NULL, last_used REAL NOT NULL)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+            constants = _fingerprint(design_constants())
+            row = self._conn.execute("SELECT value FROM meta WHERE name = 'constants'").fetchone()
+            if row is None or row[0] != constants:
+                self._conn.execute("DELETE FROM results")
+                self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('constants', ?)", (constants,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def stats(self):
+        """Hit, miss and eviction counters for this cache object."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+
+    def check_design(self, **design):
+        """``padeye.core.check_design`` through the cache."""
+        return self.check_designs([design])[0]
+
+    def check_designs(self, designs):
+        """Results for a list of design dicts, computing and storing only the misses."""
+        keys = [design_key(d) for d in designs]
+        found = self._get_many(keys)
+        results, new = [], {}
+        for key, design in zip(keys, designs):
+            if key in found:
+                results.append(found[key])
+            elif key in new:
+                results.append(new[key])
+            else:
+                new[key] = check_design(**{f: design[f] for f in INPUT_FIELDS if f in design})
+                results.append(new[key])
+        with self._lock:
+            self.hits += len(designs) - len(new)
+            self.misses += len(new)
+        if new:
+            self._put_many(new)
+        return results
+
+    def _get_many(self, keys):
+        now = time.time()
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock, self._conn:
+            for i in range(0, len(unique), _SQL_BATCH):
+                batch = unique[i:i + _SQL_BATCH]
+                marks = ",".join("?" * len(batch))
+                rows = self._conn.execute(f"SELECT key, payload FROM results WHERE key IN ({marks})", batch)
+                found.update((k, json.loads(p)) for k, p in rows)
+                self._conn.execute(f"UPDATE results SET last_used = ? WHERE key IN ({marks})", [now, *batch])
+        return found
+
+    def _put_many(self, results):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                                   ((k, json.dumps(r), now) for k, r in results.items()))
+            excess = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self._conn.execute("DELETE FROM results WHERE key IN "
+                                   "(SELECT key FROM results ORDER BY last_used LIMIT ?)", (excess,))
+                self.evictions += excess
@@ -0,0 +1,167 @@
+"""Command-line pad-eye verification: JSON/CSV designs in, JSON/CSV results out.
+
+    python -m padeye designs.csv -o results.json
+    echo '{"Ps": 100, "DAF": 1.3, "theta": 60, "phi": 5, "shackle": "G2140 - 12.5T", "fy": 355}' | python -m padeye
+
+Each design is an object (or CSV row) with the fields in ``INPUT_FIELDS``;
+fop, twc, dr and min_spread default to 0. A shackle given as a bare series
+name (e.g. "G2130") is auto-selected. With ``--cache`` results are looked
+up in and stored to the SQLite result cache. Only the standard library and
+``padeye.core`` are loaded unless auto-selection is needed, which keeps
+start-up short for cron jobs that spawn many processes.
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+from padeye.core import CHECK_NAMES, INPUT_FIELDS, check_design
+from padeye.data import SHACKLE_SERIES, shackle_data
+
+REQUIRED_FIELDS = ("Ps", "DAF", "theta", "phi", "shackle", "fy")
+
+
+def _read_designs(stream, fmt):
+    if fmt == "csv":
+        return list(csv.DictReader(stream)), False
+    data = json.load(stream)
+    if isinstance(data, dict):
+        return [data], True
+    if not isinstance(data, list):
+        raise ValueError(f"expected a design object or a list of them, got {type(data).__name__}")
+    return data, False
+
+
+def _parse_design(record, row):
+    if not isinstance(record, dict):
+        raise ValueError(f"design {row}: expected an object, got {record!r}")
+    record = {str(k).strip(): v for k, v in record.items()}
+    missing = [f for f in REQUIRED_FIELDS if record.get(f) in (None, "")]
+    if missing:
+        raise ValueError(f"design {row}: missing {', '.join(missing)}")
+    design = {}
+    for field in INPUT_FIELDS:
+        value = record.get(field)
+        if field == "shackle":
+            design[field] = str(value).strip()
+        else:
+            try:
+                design[field] = float(value) if value not in (None, "") else 0.0
+            except (TypeError, ValueError):
+                raise ValueError(f"design {row}: {field} must be a number, got {value!r}") from None
+    return design
+
+
+def _auto_select(designs):
+    auto = [d for d in designs if d["shackle"] in SHACKLE_SERIES]
+    if not auto:
+        return
+    from padeye.selection import select_shackles
+
+    picked = select_shackles([d["Ps"] for d in auto], [d["dr"] for d in auto],
+                             [d["min_spread"] for d in auto], [d["shackle"] for d in auto])
+    for design, key in zip(auto, picked):
+        if key is None:
+            raise ValueError(f"no {design['shackle']} shackle is adequate for Ps = {design['Ps']} kN")
+        design["shackle"] = key
+
+
+def evaluate_designs(records, cache=None):
+    """Parse raw design records and run ``check_design`` on each, through ``cache`` if given."""
+    designs = [_parse_design(record, row) for row, record in enumerate(records, start=1)]
+    _auto_select(designs)
+    for row, design in enumerate(designs, start=1):
+        if design["shackle"] not in shackle_data:
+            raise ValueError(f"design {row}: unknown shackle type {design['shackle']!r}")
+    if cache is not None:
+        results = cache.check_designs(designs)
+    else:
+        results = [check_design(**design) for design in designs]
+    return [dict(result, inputs=design) for result, design in zip(results, designs)]
+
+
+def design_passed(result):
+    """Overall verdict of a ``check_design`` result, as in schedules: checks, shackle SWL, clearance and spread."""
+    return result["all_passed"] and result["shackle_ok"] and result["clearance_ok"] and result["spread_ok"]
+
+
+def flatten_result(result):
+    """One flat CSV row for a ``check_design`` result."""
+    row = {field: result["inputs"][field] for field in INPUT_FIELDS}
+    row["Psh"] = result["Psh"]
+    row["Shackle OK"] = result["shackle_ok"]
+    for name in ("P", "Pv", "Ph", "Po"):
+        row[name] = result["loads"][name]
+    for name in CHECK_NAMES:
+        check = result["safety_checks"][name]
+        row[f"{name} Actual"] = check["actual"]
+        row[f"{name} Allowable"] = check["allowable"]
+        row[f"{name} Passed"] = check["passed"]
+    row["Clearance OK"] = result["clearance_ok"]
+    row["Spread %"] = result["clearances"]["actual_shackle_spread_pct"]
+    row["Spread OK"] = result["spread_ok"]
+    row["All Passed"] = design_passed(result)
+    return row
+
+
+def _write_results(results, stream, fmt, single):
+    if fmt == "csv":
+        rows = [flatten_result(r) for r in results]
+        writer = csv.DictWriter(stream, fieldnames=list(rows[0]) if rows else list(INPUT_FIELDS))
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        json.dump(results[0] if single else results, stream, indent=2)
+        stream.write("\n")
+
+
+def _format_for(path, explicit):
+    if explicit:
+        return explicit
+    return "csv" if path and str(path).lower().endswith(".csv") else "json"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m padeye", description="Run pad-eye design checks.")
+    parser.add_argument("input", nargs="?", default="-", help="JSON or CSV designs file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="results file (default: stdout)")
+    parser.add_argument("--input-format", choices=("json", "csv"), help="override input format detection")
+    parser.add_argument("--format", choices=("json", "csv"), help="output format (default: from output name, else json)")
+    parser.add_argument("--strict", action="store_true", help="exit with status 1 if any design fails")
+    parser.add_argument("--cache", nargs="?", const="", metavar="PATH",
+                        help="use the SQLite result cache (default path: $PADEYE_CACHE or ~/.cache/padeye)")
+    args = parser.parse_args(argv)
+
+    in_fmt = _format_for(None if args.input == "-" else args.input, args.input_format)
+    out_fmt = _format_for(None if args.output == "-" else args.output, args.format)
+    cache = None
+    try:
+        if args.cache is not None:
+            from padeye.cache import DEFAULT_CACHE_PATH, ResultCache
+
+            cache = ResultCache(args.cache or DEFAULT_CACHE_PATH)
+        if args.input == "-":
+            records, single = _read_designs(sys.stdin, in_fmt)
+        else:
+            with open(args.input, newline="", encoding="utf-8-sig") as f:
+                records, single = _read_designs(f, in_fmt)
+        results = evaluate_designs(records, cache)
+    except (OSError, ValueError) as e:
+        parser.exit(2, f"{parser.prog}: error: {e}\n")
+    finally:
+        if cache is not None:
+            cache.close()
+            stats = cache.stats()
+            print(f"cache: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions",
+                  file=sys.stderr)
+
+    if args.output == "-":
+        _write_results(results, sys.stdout, out_fmt, single)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            _write_results(results, f, out_fmt, single)
+
+    if args.strict and not all(design_passed(r) for r in results):
+        return 1
+    return 0
@@ -0,0 +1,347 @@
+"""Scalar pad-eye design formulas.
+
+This module depends only on the standard library so that batch jobs, tests
+and other services can import the design math without paying for NumPy,
+pandas, PIL or Streamlit. The single-design page and the CLI use it; the
+vectorized engine in ``padeye.engine`` mirrors these formulas for arrays.
+"""
+
+import math
+
+from padeye.data import (
+    F_BY_FACTOR, F_V_FACTOR, F_T_FACTOR, F_TE_FACTOR,
+    ALLOWABLE_WELD_STRESS, ALLOWABLE_VM_FACTOR, CONVERSION_FACTOR, shackle_data,
+)
+
+# Bump when a formula below changes so cached results are invalidated
+FORMULA_VERSION = 3
+
+CHECK_NAMES = ("Bearing", "Pull-Out Shear", "Tear Out", "Tensile", "Pad-Eye Base", "Weld")
+
+# Inputs describing one pad-eye, as used by the CLI and lift schedules
+INPUT_FIELDS = ("Ps", "DAF", "theta", "phi", "fop", "shackle", "fy", "twc", "dr", "min_spread")
+
+
+def design_constants():
+    """The constants and formula version every design result depends on, e.g. for cache keys."""
+    return {
+        "F_BY_FACTOR": F_BY_FACTOR,
+        "F_V_FACTOR": F_V_FACTOR,
+        "F_T_FACTOR": F_T_FACTOR,
+        "F_TE_FACTOR": F_TE_FACTOR,
+        "ALLOWABLE_WELD_STRESS": ALLOWABLE_WELD_STRESS,
+        "ALLOWABLE_VM_FACTOR": ALLOWABLE_VM_FACTOR,
+        "CONVERSION_FACTOR": CONVERSION_FACTOR,
+        "FORMULA_VERSION": FORMULA_VERSION,
+    }
+
+
+def shackle_properties(shackle):
+    """Return (Psh, A, B, C) for a ``shackle_data`` key: SWL in kN, jaw width, pin diameter, inside length in mm."""
+    data = shackle_data[shackle]
+    return (data["SWL"] * CONVERSION_FACTOR, data["Jaw Width"],
+            data["Pin Diameter"], data["Inside Length"])
+
+
+# Geometry. Each quantity below is also a ``padeye.graph`` node, whose
+# dependencies are the parameter names, so parameters use the node names.
+
+def hole_diameter(B_val):
+    """Pad-eye hole diameter dh: pin diameter plus 1.5 mm."""
+    return B_val + 1.5
+
+
+def main_plate_radius(C_val, dh):
+    """Radius R of the main plate."""
+    return C_val + (dh / 2)
+
+
+def cheek_plate_radius(R):
+    """Radius r of the cheek plate, equal to the main plate's."""
+    return R
+
+
+def main_plate_thickness(A_val):
+    """Thickness T of the main plate: 75 % of the jaw width, to 0.01 mm."""
+    return round(0.75 * A_val, 2)
+
+
+def cheek_plate_thickness(A_val, T):
+    """Thickness t of each cheek plate, filling the rest of the jaw width."""
+    return round((A_val - T)/2, 2)
+
+
+def base_length(R):
+    """Base length l of the pad-eye."""
+    return 2 * R
+
+
+def eccentricity(R):
+    """Eccentricity e of the hole from the base."""
+    return R
+
+
+def derive_geometry(A_val, B_val, C_val):
+    """Auto-calculated pad-eye dimensions from shackle jaw width A, pin B and inside length C."""
+    dh = hole_diameter(B_val)
+    R = main_plate_radius(C_val, dh)
+    T = main_plate_thickness(A_val)
+    return {
+        "dh": dh,
+        "R": R,
+        "r_val": cheek_plate_radius(R),
+        "T": T,
+        "t_val": cheek_plate_thickness(A_val, T),
+        "l_val": base_length(R),
+        "e_val": eccentricity(R),
+    }
+
+
+def min_inside_length(dr):
+    """Shackle inside length (mm) required for a rope of diameter ``dr``: 1.5 x dr."""
+    return 1.5 * dr
+
+
+def inside_length_ok(C_val, dr):
+    """Inside-length clearance: the shackle's inside length C is at least ``min_inside_length(dr)``.
+
+    This is the one definition used by the page, schedules, shackle selection
+    and the optimizer. It works on scalars and NumPy arrays alike.
+    """
+    return C_val >= min_inside_length(dr)
+
+
+def jaw_width_clearance(A_val, T, t_val):
+    """Jaw width left over by the main and cheek plates (mm)."""
+    return A_val - (T + 2*t_val)
+
+
+def shackle_spread_pct(A_val, T, t_val):
+    """Share of the jaw width filled by the main and cheek plates (%)."""
+    return ((T + 2*t_val) / A_val) * 100 if A_val != 0 else 0
+
+
+def shackle_ok(Ps, Psh):
+    """The static sling load is within the shackle SWL."""
+    return Ps <= Psh
+
+
+def spread_ok(actual_shackle_spread_pct, min_spread):
+    """The main and cheek plates fill at least ``min_spread`` % of the jaw width."""
+    return actual_shackle_spread_pct >= min_spread
+
+
+def shackle_clearances(A_val, C_val, geom, dr):
+    """Inside length required and provided, jaw-width clearance and shackle spread for a geometry."""
+    T, t_val = geom["T"], geom["t_val"]
+    return {
+        "min_inside_length_required": min_inside_length(dr),
+        "actual_inside_length": C_val,
+        "jaw_width_clearance": jaw_width_clearance(A_val, T, t_val),
+        "actual_shackle_spread_pct": shackle_spread_pct(A_val, T, t_val),
+    }
+
+
+# Loads (kN)
+
+def design_load(Ps, DAF):
+    """Design dynamic load P."""
+    return Ps * DAF
+
+
+def vertical_load(P, theta):
+    """In-plane vertical component Pv."""
+    return P * math.sin(math.radians(theta))
+
+
+def horizontal_load(P, theta, phi):
+    """In-plane horizontal component Ph."""
+    return P * math.cos(math.radians(theta)) * math.cos(math.radians(phi))
+
+
+def out_of_plane_load(P, theta, phi, fop):
+    """Out-of-plane component Po, including the additional fop % of P."""
+    return P * math.cos(math.radians(theta)) * math.sin(math.radians(phi)) + (fop / 100.0) * P
+
+
+def max_force(Pv, Ph, Po):
+    """Largest load component."""
+    return max(abs(Pv), abs(Ph), abs(Po))
+
+
+def design_loads(Ps, DAF, theta, phi, fop):
+    """Decompose the static sling load into P, Pv, Ph, Po and the maximum component (kN)."""
+    P = design_load(Ps, DAF)
+    Pv = vertical_load(P, theta)
+    Ph = horizontal_load(P, theta, phi)
+    Po = out_of_plane_load(P, theta, phi, fop)
+    return {"P": P, "Pv": Pv, "Ph": Ph, "Po": Po, "max_force": max_force(Pv, Ph, Po)}
+
+
+# Checks. Each is split into areas and section moduli (mm², mm³), an
+# allowable and an actual stress (MPa), and a ``verdict``, so that e.g. a new
+# fy only changes the allowables in ``padeye.graph``.
+
+def verdict(actual, allowable):
+    """A check result: {"passed", "allowable", "actual"}."""
+    return {"passed": actual <= allowable, "allowable": allowable, "actual": actual}
+
+
+# 2.1 Bearing
+
+def bearing_area(B_val, T, t_val):
+    return B_val * (T + 2*t_val)
+
+
+def bearing_allowable(fy):
+    return F_BY_FACTOR * fy
+
+
+def bearing_stress(Pv, Ab):
+    return Pv * 1000 / Ab
+
+
+# 2.2 Pull-Out Shear
+
+def shear_area(R, dh, T, r_val, t_val):
+    return 2 * (((R - dh/2) * T) + (2 * (r_val - dh/2) * t_val))
+
+
+def shear_allowable(fy):
+    return F_V_FACTOR * fy
+
+
+def shear_stress(Ph, Av):
+    return Ph * 1000 / Av
+
+
+# 2.3 Tear Out
+
+def tear_out_area(R, dh, T, r_val, t_val):
+    return (2 * R - dh) * T + 2 * (2 * r_val - dh) * t_val
+
+
+def tear_out_allowable(fy):
+    return F_T_FACTOR * fy
+
+
+def tear_out_stress(Po, At):
+    return Po * 1000 / At
+
+
+# 2.4 Tensile, under the largest load component
+
+def tensile_area(R, T):
+    return 2 * R * T
+
+
+def tensile_allowable(fy):
+    return F_TE_FACTOR * fy
+
+
+def tensile_stress(max_force, Ate):
+    return max_force * 1000 / Ate
+
+
+# 2.6 Pad-Eye Base (simplified calculation)
+
+def base_area(l_val, T):
+    return l_val * T
+
+
+def in_plane_modulus(T, l_val):
+    I_ip = (T * (l_val * l_val * l_val)) / 12.0
+    return I_ip / (l_val/2.0) if l_val != 0 else float('inf')
+
+
+def out_of_plane_modulus(l_val, T):
+    I_op = (l_val * (T * T * T)) / 12.0
+    return I_op / (T/2.0) if T != 0 else float('inf')
+
+
+def base_allowable(fy):
+    return ALLOWABLE_VM_FACTOR * fy
+
+
+def base_stress(Pv, Ph, Po, e_val, Aba, Zip, Zop):
+    """Von Mises combination of axial, in- and out-of-plane bending and shear stresses."""
+    fa = (Pv * 1000.0) / Aba
+    fbip = (Ph * 1000.0 * e_val) / Zip if Zip != 0 else float('inf')
+    fbop = (Po * 1000.0 * e_val) / Zop if Zop != 0 else float('inf')
+    tau_ip = (Ph * 1000.0) / Aba
+    tau_op = (Po * 1000.0) / Aba
+    tau_combined = tau_ip + tau_op
+    return math.sqrt(fa*fa + fbip*fbip + fbop*fbop + tau_combined*tau_combined)
+
+
+# 2.7 Weld between pad-eye and cheek plate
+
+def weld_applicable(r_val, twc):
+    """The weld check only applies with a positive cheek radius and weld size."""
+    return r_val > 0 and twc > 0
+
+
+def cheek_plate_load(P, T, t_val):
+    """Share Pc of the design load carried by one cheek plate."""
+    return P * (t_val / (T + 2*t_val)) if (T + 2*t_val) != 0 else 0
+
+
+def weld_stress(Pc, r_val, twc):
+    """Weld shear stress, or None where the weld check does not apply."""
+    if not weld_applicable(r_val, twc):
+        return None
+    Awc = 0.5 * (2 * math.pi * r_val) * (0.707 * twc)
+    return (Pc * 1000.0) / Awc
+
+
+def weld_verdict(tau_wc):
+    """Weld check result; passes with zero stresses where the check does not apply."""
+    if tau_wc is None:
+        return {"passed": True, "allowable": 0, "actual": 0}
+    return verdict(tau_wc, ALLOWABLE_WELD_STRESS)
+
+
+def run_checks(geom, loads, B_val, fy, twc):
+    """Run the six design checks; returns {name: {"passed", "allowable", "actual"}} with stresses in MPa."""
+    dh, R, r_val, T = geom["dh"], geom["R"], geom["r_val"], geom["T"]
+    t_val, l_val, e_val = geom["t_val"], geom["l_val"], geom["e_val"]
+    P, Pv, Ph, Po = loads["P"], loads["Pv"], loads["Ph"], loads["Po"]
+    return {
+        "Bearing": verdict(bearing_stress(Pv, bearing_area(B_val, T, t_val)), bearing_allowable(fy)),
+        "Pull-Out Shear": verdict(shear_stress(Ph, shear_area(R, dh, T, r_val, t_val)), shear_allowable(fy)),
+        "Tear Out": verdict(tear_out_stress(Po, tear_out_area(R, dh, T, r_val, t_val)), tear_out_allowable(fy)),
+        "Tensile": verdict(tensile_stress(loads["max_force"], tensile_area(R, T)), tensile_allowable(fy)),
+        "Pad-Eye Base": verdict(base_stress(Pv, Ph, Po, e_val, base_area(l_val, T), in_plane_modulus(T, l_val),
+                                            out_of_plane_modulus(l_val, T)), base_allowable(fy)),
+        "Weld": weld_verdict(weld_stress(cheek_plate_load(P, T, t_val), r_val, twc)),
+    }
+
+
+def check_design(Ps, DAF, theta, phi, fop, shackle, fy, twc, dr=0.0, min_spread=0.0):
+    """Full single-design evaluation, as on the page.
+
+    Returns a dict with the shackle properties ("Psh", "A_val", "B_val",
+    "C_val"), "geometry", "clearances", "loads", "safety_checks",
+    "shackle_ok" (Ps <= Psh), "clearance_ok" (``inside_length_ok``),
+    "spread_ok" and "all_passed" (all applicable checks pass).
+    """
+    Psh, A_val, B_val, C_val = shackle_properties(shackle)
+    geom = derive_geometry(A_val, B_val, C_val)
+    clearances = shackle_clearances(A_val, C_val, geom, dr)
+    loads = design_loads(Ps, DAF, theta, phi, fop)
+    checks = run_checks(geom, loads, B_val, fy, twc)
+    return {
+        "shackle": shackle,
+        "Psh": Psh,
+        "A_val": A_val,
+        "B_val": B_val,
+        "C_val": C_val,
+        "geometry": geom,
+        "clearances": clearances,
+        "loads": loads,
+        "safety_checks": checks,
+        "shackle_ok": shackle_ok(Ps, Psh),
+        "clearance_ok": inside_length_ok(C_val, dr),
+        "spread_ok": spread_ok(clearances["actual_shackle_spread_pct"], min_spread),
+        "all_passed": all(check["passed"] for check in checks.values()),
+    }
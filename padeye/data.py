@@ -0,0 +1,97 @@
+"""Design constants and shackle catalogue shared by the UI and batch tools."""
+
+# Constants for calculations
+F_BY_FACTOR = 0.9   # Bearing stress factor
+F_V_FACTOR = 0.4    # Pull-out shear stress factor
+F_T_FACTOR = 0.45   # Tear-out stress factor
+F_TE_FACTOR = 0.6   # Tensile stress factor
+ALLOWABLE_WELD_STRESS = 0.3 * 70 * 6.895  # Approximately 144.8 MPa
+ALLOWABLE_VM_FACTOR = 0.7   # Pad-eye base von Mises factor
+
+# Conversion factor: 1 metric ton (MT) = 10 kN
+CONVERSION_FACTOR = 10
+
+SHACKLE_SERIES = ("G209", "G213", "G2130", "G2140")
+
+shackle_data = {
+    # G213 series (15 entries)
+    "G213 - 1/2T":   {"SWL": 0.50,  "Jaw Width": 11.9,   "Pin Diameter": 7.9,   "Inside Length": 28.7},
+    "G213 - 3/4T":   {"SWL": 0.75,  "Jaw Width": 13.5,   "Pin Diameter": 9.7,   "Inside Length": 31.0},
+    "G213 - 1T":     {"SWL": 1,     "Jaw Width": 16.8,   "Pin Diameter": 11.2,  "Inside Length": 36.6},
+    "G213 - 1-1/2T": {"SWL": 1.50,  "Jaw Width": 19.1,   "Pin Diameter": 12.7,  "Inside Length": 42.9},
+    "G213 - 2T":     {"SWL": 2,     "Jaw Width": 20.6,   "Pin Diameter": 16,    "Inside Length": 47.8},
+    "G213 - 3-1/4T": {"SWL": 3.25,  "Jaw Width": 26.9,   "Pin Diameter": 19.1,  "Inside Length": 60.5},
+    "G213 - 4-3/4T": {"SWL": 4.75,  "Jaw Width": 31.8,   "Pin Diameter": 22.4,  "Inside Length": 71.5},
+    "G213 - 6-1/2T": {"SWL": 6.50,  "Jaw Width": 36.6,   "Pin Diameter": 25.4,  "Inside Length": 84},
+    "G213 - 8-1/2T": {"SWL": 8.50,  "Jaw Width": 42.9,   "Pin Diameter": 28.7,  "Inside Length": 95.5},
+    "G213 - 9-1/2T": {"SWL": 9.50,  "Jaw Width": 46.0,   "Pin Diameter": 31.8,  "Inside Length": 108},
+    "G213 - 12T":    {"SWL": 12,    "Jaw Width": 51.5,   "Pin Diameter": 35.1,  "Inside Length": 119},
+    "G213 - 13-1/2T":{"SWL": 13.50, "Jaw Width": 57,     "Pin Diameter": 38.1,  "Inside Length": 133},
+    "G213 - 17T":    {"SWL": 17,    "Jaw Width": 60.5,   "Pin Diameter": 41.4,  "Inside Length": 146},
+    "G213 - 25T":    {"SWL": 25,    "Jaw Width": 73,     "Pin Diameter": 51,    "Inside Length": 178},
+    "G213 - 35T":    {"SWL": 35,    "Jaw Width": 82.5,   "Pin Diameter": 57,    "Inside Length": 197},
+
+    # G209 series (17 entries)
+    "G209 - 1/3T":   {"SWL": 0.33,  "Jaw Width": 9.65,   "Pin Diameter": 6.35,  "Inside Length": 22.4},
+    "G209 - 1/2T":   {"SWL": 0.50,  "Jaw Width": 11.9,   "Pin Diameter": 7.85,  "Inside Length": 28.7},
+    "G209 - 3/4T":   {"SWL": 0.75,  "Jaw Width": 13.5,   "Pin Diameter": 9.65,  "Inside Length": 31},
+    "G209 - 1T":     {"SWL": 1,     "Jaw Width": 16.8,   "Pin Diameter": 11.2,  "Inside Length": 36.6},
+    "G209 - 1-1/2T": {"SWL": 1.50,  "Jaw Width": 19.1,   "Pin Diameter": 12.7,  "Inside Length": 42.9},
+    "G209 - 2T":     {"SWL": 2,     "Jaw Width": 20.6,   "Pin Diameter": 16,    "Inside Length": 47.8},
+    "G209 - 3-1/4T": {"SWL": 3.25,  "Jaw Width": 26.9,   "Pin Diameter": 19.1,  "Inside Length": 60.5},
+    "G209 - 4-3/4T": {"SWL": 4.75,  "Jaw Width": 31.8,   "Pin Diameter": 22.4,  "Inside Length": 71.5},
+    "G209 - 6-1/2T": {"SWL": 6.50,  "Jaw Width": 36.6,   "Pin Diameter": 25.4,  "Inside Length": 84},
+    "G209 - 8-1/2T": {"SWL": 8.50,  "Jaw Width": 42.9,   "Pin Diameter": 28.7,  "Inside Length": 95.5},
+    "G209 - 9-1/2T": {"SWL": 9.50,  "Jaw Width": 46.0,   "Pin Diameter": 31.8,  "Inside Length": 108},
+    "G209 - 12T":    {"SWL": 12,    "Jaw Width": 51.5,   "Pin Diameter": 35.1,  "Inside Length": 119},
+    "G209 - 13-1/2T":{"SWL": 13.50, "Jaw Width": 57,     "Pin Diameter": 38.1,  "Inside Length": 133},
+    "G209 - 17T":    {"SWL": 17,    "Jaw Width": 60.5,   "Pin Diameter": 41.4,  "Inside Length": 146},
+    "G209 - 25T":    {"SWL": 25,    "Jaw Width": 73,     "Pin Diameter": 51,    "Inside Length": 178},
+    "G209 - 35T":    {"SWL": 35,    "Jaw Width": 82.5,   "Pin Diameter": 57,    "Inside Length": 197},
+    "G209 - 55T":    {"SWL": 55,    "Jaw Width": 105,    "Pin Diameter": 70,    "Inside Length": 267},
+
+    # G2130 series (20 entries)
+    "G2130 - 1/3T":   {"SWL": 0.33,  "Jaw Width": 9.65,  "Pin Diameter": 6.35,  "Inside Length": 22.4},
+    "G2130 - 1/2T":   {"SWL": 0.50,  "Jaw Width": 11.9,  "Pin Diameter": 7.85,  "Inside Length": 28.7},
+    "G2130 - 3/4T":   {"SWL": 0.75,  "Jaw Width": 13.5,  "Pin Diameter": 9.65,  "Inside Length": 31},
+    "G2130 - 1T":     {"SWL": 1,     "Jaw Width": 16.8,  "Pin Diameter": 11.2,  "Inside Length": 36.6},
+    "G2130 - 1-1/2T": {"SWL": 1.50,  "Jaw Width": 19.1,  "Pin Diameter": 12.7,  "Inside Length": 42.9},
+    "G2130 - 2T":     {"SWL": 2,     "Jaw Width": 20.6,  "Pin Diameter": 16,    "Inside Length": 47.8},
+    "G2130 - 3-1/4T": {"SWL": 3.25,  "Jaw Width": 26.9,  "Pin Diameter": 19.1,  "Inside Length": 60.5},
+    "G2130 - 4-3/4T": {"SWL": 4.75,  "Jaw Width": 31.8,  "Pin Diameter": 22.4,  "Inside Length": 71.5},
+    "G2130 - 6-1/2T": {"SWL": 6.50,  "Jaw Width": 36.6,  "Pin Diameter": 25.4,  "Inside Length": 84},
+    "G2130 - 8-1/2T": {"SWL": 8.50,  "Jaw Width": 42.9,  "Pin Diameter": 28.7,  "Inside Length": 95.5},
+    "G2130 - 9-1/2T": {"SWL": 9.50,  "Jaw Width": 46,    "Pin Diameter": 31.8,  "Inside Length": 108},
+    "G2130 - 12T":    {"SWL": 12,    "Jaw Width": 51.5,  "Pin Diameter": 35.1,  "Inside Length": 119},
+    "G2130 - 13-1/2T":{"SWL": 13.50, "Jaw Width": 57,    "Pin Diameter": 38.1,  "Inside Length": 133},
+    "G2130 - 17T":    {"SWL": 17,    "Jaw Width": 60.5,  "Pin Diameter": 41.4,  "Inside Length": 146},
+    "G2130 - 25T":    {"SWL": 25,    "Jaw Width": 73,    "Pin Diameter": 51,    "Inside Length": 178},
+    "G2130 - 35T":    {"SWL": 35,    "Jaw Width": 82.5,  "Pin Diameter": 57,    "Inside Length": 197},
+    "G2130 - 55T":    {"SWL": 55,    "Jaw Width": 105,   "Pin Diameter": 70,    "Inside Length": 267},
+    "G2130 - 85T":    {"SWL": 85,    "Jaw Width": 127,   "Pin Diameter": 82.5,  "Inside Length": 330},
+    "G2130 - 120T":   {"SWL": 120,   "Jaw Width": 133,   "Pin Diameter": 95.5,  "Inside Length": 372},
+    "G2130 - 150T":   {"SWL": 150,   "Jaw Width": 140,   "Pin Diameter": 108,   "Inside Length": 368},
+
+    # G2140 series (21 entries)
+    "G2140 - 2T":      {"SWL": 2,     "Jaw Width": 16.8,  "Pin Diameter": 11.2,  "Inside Length": 36.6},
+    "G2140 - 2.67T":   {"SWL": 2.67,  "Jaw Width": 19.1,  "Pin Diameter": 12.7,  "Inside Length": 42.9},
+    "G2140 - 3.33T":   {"SWL": 3.33,  "Jaw Width": 20.6,  "Pin Diameter": 16.3,  "Inside Length": 47.8},
+    "G2140 - 5T":      {"SWL": 5,     "Jaw Width": 26.9,  "Pin Diameter": 19.6,  "Inside Length": 60.5},
+    "G2140 - 7T":      {"SWL": 7,     "Jaw Width": 31.8,  "Pin Diameter": 22.6,  "Inside Length": 71.4},
+    "G2140 - 9.5T":    {"SWL": 9.5,   "Jaw Width": 36.6,  "Pin Diameter": 25.9,  "Inside Length": 84.1},
+    "G2140 - 12.5T":   {"SWL": 12.5,  "Jaw Width": 42.9,  "Pin Diameter": 29.2,  "Inside Length": 95.3},
+    "G2140 - 15T":     {"SWL": 15,    "Jaw Width": 46,    "Pin Diameter": 31.8,  "Inside Length": 108},
+    "G2140 - 18T":     {"SWL": 18,    "Jaw Width": 51.6,  "Pin Diameter": 35.6,  "Inside Length": 119.1},
+    "G2140 - 21T":     {"SWL": 21,    "Jaw Width": 57.2,  "Pin Diameter": 38.9,  "Inside Length": 133.4},
+    "G2140 - 30T":     {"SWL": 30,    "Jaw Width": 60.5,  "Pin Diameter": 41.4,  "Inside Length": 146},
+    "G2140 - 40T":     {"SWL": 40,    "Jaw Width": 73.2,  "Pin Diameter": 50.8,  "Inside Length": 178},
+    "G2140 - 55T":     {"SWL": 55,    "Jaw Width": 82.6,  "Pin Diameter": 57.2,  "Inside Length": 197},
+    "G2140 - 85T":     {"SWL": 85,    "Jaw Width": 105,   "Pin Diameter": 69.9,  "Inside Length": 267},
+    "G2140 - 120T":    {"SWL": 120,   "Jaw Width": 127,   "Pin Diameter": 82.6,  "Inside Length": 330},
+    "G2140 - 150T":    {"SWL": 150,   "Jaw Width": 133,   "Pin Diameter": 95.3,  "Inside Length": 372},
+    "G2140 - 175T":    {"SWL": 175,   "Jaw Width": 140,   "Pin Diameter": 108,   "Inside Length": 368},
+    "G2140 - 200T":    {"SWL": 200,   "Jaw Width": 184,   "Pin Diameter": 121,   "Inside Length": 386},
+    "G2140 - 250T":    {"SWL": 250,   "Jaw Width": 216,   "Pin Diameter": 127,   "Inside Length": 470},
+    "G2140 - 300T":    {"SWL": 300,   "Jaw Width": 213,   "Pin Diameter": 152,   "Inside Length": 475},
+    "G2140 - 400T":    {"SWL": 400,   "Jaw Width": 210,   "Pin Diameter": 178,   "Inside Length": 572}
+}
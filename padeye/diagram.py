@@ -0,0 +1,77 @@
+"""Pad-eye schematic rendering."""
+
+import io
+
+from PIL import Image, ImageDraw, ImageFont
+
+DIAGRAM_SIZE = (500, 400)
+DIAGRAM_SCALE = 2
+# Geometry is rounded to this many decimals (mm) before rendering, so that
+# float noise does not defeat caching of identical drawings
+DIAGRAM_KEY_DECIMALS = 3
+
+_font = None
+
+
+def _default_font():
+    global _font
+    if _font is None:
+        _font = ImageFont.load_default()
+    return _font
+
+
+def diagram_key(R, dh, r_val, t_val, l_val, T):
+    """Rounded geometry tuple identifying a drawing; pass it to ``render_diagram_png``."""
+    return tuple(round(float(v), DIAGRAM_KEY_DECIMALS) for v in (R, dh, r_val, t_val, l_val, T))
+
+
+def draw_diagram(R, dh, r_val, t_val, l_val, T):
+    """Draw the pad-eye schematic and return it as a PIL image."""
+    diagram = Image.new('RGB', DIAGRAM_SIZE, 'white')
+    draw = ImageDraw.Draw(diagram)
+    scale = DIAGRAM_SCALE
+    center_x, center_y = DIAGRAM_SIZE[0] // 2, DIAGRAM_SIZE[1] // 2
+
+    # Main plate
+    draw.ellipse([(center_x - R * scale, center_y - R * scale),
+                  (center_x + R * scale, center_y + R * scale)],
+                 outline='black', width=2)
+
+    # Hole
+    draw.ellipse([(center_x - dh / 2 * scale, center_y - dh / 2 * scale),
+                  (center_x + dh / 2 * scale, center_y + dh / 2 * scale)],
+                 fill='gray', outline='black')
+
+    # Cheek plates
+    cheek_height = r_val * scale * 2
+    draw.rectangle([(center_x - R * scale - t_val * scale, center_y - cheek_height / 2),
+                    (center_x - R * scale, center_y + cheek_height / 2)],
+                   outline='blue', width=2)
+    draw.rectangle([(center_x + R * scale, center_y - cheek_height / 2),
+                    (center_x + R * scale + t_val * scale, center_y + cheek_height / 2)],
+                   outline='blue', width=2)
+
+    # Base plate
+    draw.rectangle([(center_x - l_val / 2 * scale, center_y + R * scale),
+                    (center_x + l_val / 2 * scale, center_y + R * scale + T * scale)],
+                   fill='lightgray', outline='black')
+
+    # Texts
+    font = _default_font()
+    draw.text((center_x - R * scale, center_y + R * scale + 5), f'R: {R}', fill='black', font=font)
+    draw.text((center_x - dh / 2 * scale, center_y + 25), f'dh: {dh}', fill='black', font=font)
+    draw.text((center_x - l_val / 2 * scale, center_y + R * scale + T * scale + 5), f'l: {l_val}', fill='black', font=font)
+    draw.text((center_x - R * scale - t_val * scale - 15, center_y - cheek_height / 2), f't: {t_val}', fill='black', font=font)
+    return diagram
+
+
+def encode_png(image):
+    """PNG bytes of a PIL image."""
+    img_bytes = io.BytesIO()
+    image.save(img_bytes, format='PNG')
+    return img_bytes.getvalue()
+
+
+def render_diagram_png(key):
+    """PNG bytes of the schematic for a ``diagram_key`` tuple."""
+    return encode_png(draw_diagram(*key))
@@ -0,0 +1,191 @@
+"""Vectorized pad-eye design checks.
+
+Every function here takes NumPy arrays (or scalars, which are broadcast) and
+evaluates the same formulas as the scalar ``padeye.core`` for a whole lift
+schedule in one call. Both spell powers out as products, which NumPy and
+libm round alike, where ``**`` would go through libm ``pow`` on one side
+only. The results then match the scalar code bit for bit wherever
+``np.sin``/``np.cos`` return the same bits as ``math.sin``/``math.cos``. That
+holds for NumPy builds that call libm, but SIMD-dispatched builds may differ
+by an ulp in the load components and so in the stresses. Pass/fail verdicts
+agree except for a design sitting within rounding of an allowable.
+"""
+
+import math
+
+import numpy as np
+
+from padeye.core import CHECK_NAMES, inside_length_ok, min_inside_length
+from padeye.data import (
+    F_BY_FACTOR, F_V_FACTOR, F_T_FACTOR, F_TE_FACTOR,
+    ALLOWABLE_WELD_STRESS, ALLOWABLE_VM_FACTOR, CONVERSION_FACTOR, shackle_data,
+)
+
+# Shackle catalogue as parallel arrays, indexed by position in SHACKLE_KEYS
+SHACKLE_KEYS = tuple(shackle_data.keys())
+_SHACKLE_INDEX = {key: i for i, key in enumerate(SHACKLE_KEYS)}
+SHACKLE_SWL = np.array([shackle_data[k]["SWL"] for k in SHACKLE_KEYS], dtype=float)
+SHACKLE_JAW_WIDTH = np.array([shackle_data[k]["Jaw Width"] for k in SHACKLE_KEYS], dtype=float)
+SHACKLE_PIN_DIAMETER = np.array([shackle_data[k]["Pin Diameter"] for k in SHACKLE_KEYS], dtype=float)
+SHACKLE_INSIDE_LENGTH = np.array([shackle_data[k]["Inside Length"] for k in SHACKLE_KEYS], dtype=float)
+
+
+def shackle_indices(keys):
+    """Map shackle keys to positions in ``SHACKLE_KEYS``; raises KeyError on unknown keys."""
+    return np.fromiter((_SHACKLE_INDEX[k] for k in keys), dtype=np.intp)
+
+
+def shackle_dimensions(keys):
+    """Return (Psh, A, B, C) arrays for a sequence of shackle keys.
+
+    Psh is the SWL in kN; A, B and C are jaw width, pin diameter and inside
+    length in mm.
+    """
+    idx = shackle_indices(keys)
+    return (SHACKLE_SWL[idx] * CONVERSION_FACTOR, SHACKLE_JAW_WIDTH[idx],
+            SHACKLE_PIN_DIAMETER[idx], SHACKLE_INSIDE_LENGTH[idx])
+
+
+def _round2(values):
+    # Python's round() and np.round() disagree on some half-way cases, so
+    # round each distinct value with round() to match the scalar page exactly.
+    uniq, inverse = np.unique(values, return_inverse=True)
+    rounded = np.array([round(v, 2) for v in uniq.tolist()], dtype=float)
+    return rounded[inverse].reshape(values.shape)
+
+
+def derive_geometry(A, B, C):
+    """Auto-calculated pad-eye dimensions from shackle jaw width A, pin B and inside length C."""
+    A, B, C = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (A, B, C)))
+    dh = B + 1.5                  # Pad-eye hole diameter
+    R = C + (dh / 2)              # Radius of main plate
+    T = _round2(0.75 * A)         # Thickness of main plate
+    t_val = _round2((A - T) / 2)  # Thickness of cheek plate
+    return {
+        "dh": dh,
+        "R": R,
+        "r_val": R,               # Radius of cheek plate
+        "T": T,
+        "t_val": t_val,
+        "l_val": 2 * R,           # Base length of pad-eye
+        "e_val": R,               # Eccentricity from base
+    }
+
+
+def design_loads(Ps, DAF, theta, phi, fop):
+    """Decompose the static sling load into P, Pv, Ph, Po and the maximum component (kN)."""
+    Ps, DAF, theta, phi, fop = (np.asarray(v, dtype=float) for v in (Ps, DAF, theta, phi, fop))
+    rad_theta = theta * (math.pi / 180.0)
+    rad_phi = phi * (math.pi / 180.0)
+    P = Ps * DAF
+    Pv = P * np.sin(rad_theta)
+    Ph = P * np.cos(rad_theta) * np.cos(rad_phi)
+    Po = P * np.cos(rad_theta) * np.sin(rad_phi) + (fop / 100.0) * P
+    max_force = np.maximum(np.maximum(np.abs(Pv), np.abs(Ph)), np.abs(Po))
+    return {"P": P, "Pv": Pv, "Ph": Ph, "Po": Po, "max_force": max_force}
+
+
+def evaluate_checks(Ps, DAF, theta, phi, fop, A, B, C, fy, twc):
+    """Run all six design checks over broadcastable input arrays.
+
+    Returns a dict with the load components ("P", "Pv", "Ph", "Po",
+    "max_force"), a "checks" dict shaped like the page's ``safety_checks``
+    (each entry holding "passed", "allowable" and "actual" arrays), a
+    "weld_applicable" mask and an "all_passed" flag that ignores the weld
+    check where it does not apply.
+    """
+    Ps, DAF, theta, phi, fop, A, B, C, fy, twc = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (Ps, DAF, theta, phi, fop, A, B, C, fy, twc)))
+    geom = derive_geometry(A, B, C)
+    loads = design_loads(Ps, DAF, theta, phi, fop)
+    return checks_from_geometry(geom, loads, B, fy, twc)
+
+
+def checks_from_geometry(geom, loads, B_val, fy, twc):
+    """Evaluate the checks for precomputed ``derive_geometry`` and ``design_loads`` dicts.
+
+    Lets callers that already hold geometry or loads (schedules, optimizers)
+    skip recomputing them; the result has the same layout as ``evaluate_checks``.
+    """
+    dh, R, r_val, T = geom["dh"], geom["R"], geom["r_val"], geom["T"]
+    t_val, l_val, e_val = geom["t_val"], geom["l_val"], geom["e_val"]
+    P, Pv, Ph, Po = loads["P"], loads["Pv"], loads["Ph"], loads["Po"]
+    checks = {}
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 2.1 Bearing Check
+        Ab = B_val * (T + 2*t_val)
+        fby = F_BY_FACTOR * fy
+        actual = Pv * 1000 / Ab
+        checks["Bearing"] = {"passed": actual <= fby, "allowable": fby, "actual": actual}
+
+        # 2.2 Pull-Out Shear Check
+        Av = 2 * (((R - dh/2) * T) + (2 * (r_val - dh/2) * t_val))
+        fv = F_V_FACTOR * fy
+        actual = Ph * 1000 / Av
+        checks["Pull-Out Shear"] = {"passed": actual <= fv, "allowable": fv, "actual": actual}
+
+        # 2.3 Tear Out Stress Check
+        At = (2 * R - dh) * T + 2 * (2 * r_val - dh) * t_val
+        ft = F_T_FACTOR * fy
+        actual = Po * 1000 / At
+        checks["Tear Out"] = {"passed": actual <= ft, "allowable": ft, "actual": actual}
+
+        # 2.4 Tensile Stress Check
+        Ate = 2 * R * T
+        fte = F_TE_FACTOR * fy
+        actual = loads["max_force"] * 1000 / Ate
+        checks["Tensile"] = {"passed": actual <= fte, "allowable": fte, "actual": actual}
+
+        # 2.6 Pad-Eye Base Check
+        Aba = l_val * T
+        I_ip = (T * (l_val * l_val * l_val)) / 12.0
+        I_op = (l_val * (T * T * T)) / 12.0
+        Zip = np.where(l_val != 0, I_ip / (l_val/2.0), np.inf)
+        Zop = np.where(T != 0, I_op / (T/2.0), np.inf)
+        fa = (Pv * 1000.0) / Aba
+        fbip = np.where(Zip != 0, (Ph * 1000.0 * e_val) / Zip, np.inf)
+        fbop = np.where(Zop != 0, (Po * 1000.0 * e_val) / Zop, np.inf)
+        tau_combined = (Ph * 1000.0) / Aba + (Po * 1000.0) / Aba
+        sigma_vm = np.sqrt(fa*fa + fbip*fbip + fbop*fbop + tau_combined*tau_combined)
+        allowable_vm = ALLOWABLE_VM_FACTOR * fy
+        checks["Pad-Eye Base"] = {"passed": sigma_vm <= allowable_vm,
+                                  "allowable": allowable_vm, "actual": sigma_vm}
+
+        # 2.7 Weld Check Between Pad-Eye and Cheek Plate
+        spread = T + 2*t_val
+        Pc = np.where(spread != 0, P * (t_val / spread), 0.0)
+        weld_applicable = (r_val > 0) & (twc > 0)
+        Awc = 0.5 * (2 * math.pi * r_val) * (0.707 * twc)
+        tau_wc = np.where(weld_applicable, (Pc * 1000.0) / Awc, 0.0)
+        checks["Weld"] = {
+            "passed": np.where(weld_applicable, tau_wc <= ALLOWABLE_WELD_STRESS, True),
+            "allowable": np.where(weld_applicable, ALLOWABLE_WELD_STRESS, 0.0),
+            "actual": tau_wc,
+        }
+
+    all_passed = np.ones(np.shape(P), dtype=bool)
+    for name in CHECK_NAMES:
+        all_passed &= checks[name]["passed"]
+
+    result = dict(loads)
+    result["checks"] = checks
+    result["weld_applicable"] = weld_applicable
+    result["all_passed"] = all_passed
+    return result
+
+
+def shackle_compatibility(A, C, geom, dr, min_spread):
+    """Derived clearance and spread quantities from the page's "Derived Geometry" section."""
+    T, t_val = geom["T"], geom["t_val"]
+    A, C, dr = (np.asarray(v, dtype=float) for v in (A, C, dr))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        spread_pct = np.where(A != 0, ((T + 2*t_val) / A) * 100, 0.0)
+    return {
+        "min_inside_length_required": min_inside_length(dr),
+        "actual_inside_length": C,
+        "jaw_width_clearance": A - (T + 2*t_val),
+        "actual_shackle_spread_pct": spread_pct,
+        "clearance_ok": inside_length_ok(C, dr),
+        "spread_ok": spread_pct >= np.asarray(min_spread, dtype=float),
+    }
@@ -0,0 +1,248 @@
+"""Precomputed capacity envelopes: the largest design load each shackle's pad-eye carries.
+
+Every check stress is proportional to the design load P = Ps·DAF, so the
+allowable P for a check is simply its allowable stress divided by the stress
+per kN. ``build_envelope`` evaluates that with the vectorized engine for every
+``shackle_data`` entry and every cell of a θ×φ grid, and writes the result to
+a compact binary file (a JSON header followed by a float32 array) that
+``load_envelope`` memory-maps instead of rebuilding it.
+
+Capacities are conservative: a query never returns a load that fails
+``check_design``. Each load component (Pv ∝ sin θ, Ph ∝ cos θ·cos φ,
+Po ∝ cos θ·sin φ + fop) is monotone in θ and in φ, so its largest value over
+a cell is at one of the cell's corners, and every check stress grows with
+each component. A cell's capacity is therefore evaluated at the corner
+maxima of the components, and stored rounded down. Within a cell the
+capacity is constant; on the default 1° grid it is typically about 1 % and
+at most about 8 % below the exact value.
+
+All allowables except the weld one are proportional to fy and the weld
+allowable does not depend on fy, so capacities are stored per MPa of fy and
+the weld capacity per mm of weld size, and both are scaled at query time.
+fop is fixed when a table is built.
+"""
+
+import json
+import os
+import struct
+
+import numpy as np
+
+from padeye.core import CHECK_NAMES, design_constants
+from padeye.engine import (
+    SHACKLE_KEYS, SHACKLE_SWL, SHACKLE_JAW_WIDTH, SHACKLE_PIN_DIAMETER, SHACKLE_INSIDE_LENGTH,
+    checks_from_geometry, derive_geometry, design_loads,
+)
+from padeye.data import CONVERSION_FACTOR, shackle_data
+
+DEFAULT_ENVELOPE_DIR = os.environ.get(
+    "PADEYE_ENVELOPE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "padeye"))
+# Degrees, for both θ and φ over 0-90°. The default table is about 14 MB.
+DEFAULT_ANGLE_STEP = 1.0
+SHACKLE_LIMIT = "Shackle SWL"
+
+_MAGIC = b"PADEYE-ENVELOPE\x00"
+_FORMAT_VERSION = 2
+_ALIGN = 64
+_WELD = CHECK_NAMES.index("Weld")
+
+
+def envelope_path(fop=0.0, directory=DEFAULT_ENVELOPE_DIR):
+    """Default table file for a given additional out-of-plane load percentage."""
+    return os.path.join(directory, f"envelope_fop{float(fop):g}.bin")
+
+
+def _angle_grid(step):
+    n = int(round(90.0 / step)) + 1
+    if n < 2 or abs((n - 1) * step - 90.0) > 1e-9:
+        raise ValueError(f"Angle step must divide 90°, got {step}")
+    return n
+
+
+def _cell_max(values):
+    # Largest of the four corners of every grid cell, over the last two axes
+    return np.maximum(np.maximum(values[..., :-1, :-1], values[..., :-1, 1:]),
+                      np.maximum(values[..., 1:, :-1], values[..., 1:, 1:]))
+
+
+def build_envelope(path, theta_step=DEFAULT_ANGLE_STEP, phi_step=DEFAULT_ANGLE_STEP, fop=0.0):
+    """Compute the capacity table and write it to ``path``; returns the loaded ``CapacityEnvelope``."""
+    if fop < 0:
+        raise ValueError("fop must not be negative")
+    n_theta, n_phi = _angle_grid(theta_step), _angle_grid(phi_step)
+    theta = np.linspace(0.0, 90.0, n_theta)
+    phi = np.linspace(0.0, 90.0, n_phi)
+
+    # Unit design load (Ps = 1 kN, DAF = 1) at the grid points, then the
+    # largest component over each cell's corners
+    shape = (len(SHACKLE_KEYS), n_theta - 1, n_phi - 1)
+    corners = design_loads(1.0, 1.0, theta[:, None], phi[None, :], fop)
+    loads = {name: np.broadcast_to(_cell_max(np.broadcast_to(corners[name], (n_theta, n_phi))), shape)
+             for name in ("Pv", "Ph", "Po")}
+    loads["P"] = np.ones(shape)
+    loads["max_force"] = np.maximum(np.maximum(loads["Pv"], loads["Ph"]), loads["Po"])
+
+    # fy = 1 MPa and a 1 mm weld, broadcast over shackle × θ cell × φ cell
+    A, B, C = (v[:, None, None] for v in (SHACKLE_JAW_WIDTH, SHACKLE_PIN_DIAMETER, SHACKLE_INSIDE_LENGTH))
+    result = checks_from_geometry(derive_geometry(A, B, C), loads, B, 1.0, 1.0)
+    shape += (len(CHECK_NAMES),)
+    table = np.empty(shape, dtype="<f4")
+    for k, name in enumerate(CHECK_NAMES):
+        check = result["checks"][name]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            capacity = np.where(check["actual"] > 0, check["allowable"] / check["actual"], np.inf)
+        # One float32 step down, so rounding at query time cannot tip a capacity into a failure
+        capacity = capacity.astype("<f4")
+        table[..., k] = np.where(np.isfinite(capacity), np.nextafter(capacity, np.float32(0)), capacity)
+
+    header = {
+        "format": _FORMAT_VERSION,
+        "shape": list(table.shape),
+        "shackles": list(SHACKLE_KEYS),
+        "checks": list(CHECK_NAMES),
+        "theta_step": float(theta_step),
+        "phi_step": float(phi_step),
+        "fop": float(fop),
+        "constants": design_constants(),
+    }
+    raw = json.dumps(header).encode()
+    offset = len(_MAGIC) + 4 + len(raw)
+    raw += b" " * (-offset % _ALIGN)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_MAGIC)
+        f.write(struct.pack("<I", len(raw)))
+        f.write(raw)
+        f.write(table.tobytes())
+    os.replace(tmp, path)
+    return CapacityEnvelope(path)
+
+
+def _is_current(header, fop):
+    return (header.get("format") == _FORMAT_VERSION
+            and header.get("shackles") == list(SHACKLE_KEYS)
+            and header.get("checks") == list(CHECK_NAMES)
+            and header.get("constants") == design_constants()
+            and header.get("fop") == float(fop))
+
+
+def load_envelope(path=None, fop=0.0, **build_options):
+    """Memory-map the table at ``path``, building it first if it is missing or stale.
+
+    A table is stale when its format, the shackle catalogue, the check list,
+    the design constants or fop differ from the ones it was built with.
+    """
+    path = path or envelope_path(fop)
+    try:
+        envelope = CapacityEnvelope(path)
+    except (OSError, ValueError):
+        envelope = None
+    if envelope is None or not _is_current(envelope.header, fop):
+        envelope = build_envelope(path, fop=fop, **build_options)
+    return envelope
+
+
+def _all_scalars(*values):
+    # Plain Python numbers take the scalar fast path; anything else is treated as an array
+    return all(isinstance(v, (int, float)) for v in values)
+
+
+def _cell(values, step, n, name):
+    # Index of the grid cell holding each angle; 90° falls in the last cell
+    u = np.asarray(values, dtype=float) / step
+    if np.any(~((u >= 0) & (u <= n))):
+        raise ValueError(f"{name} must be between 0 and 90 degrees")
+    return np.minimum(u.astype(np.intp), n - 1)
+
+
+class CapacityEnvelope:
+    """A memory-mapped capacity table written by ``build_envelope``."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path} is not a capacity envelope file")
+            (length,) = struct.unpack("<I", f.read(4))
+            self.header = json.loads(f.read(length))
+        self.path = path
+        self.table = np.memmap(path, dtype="<f4", mode="r", offset=len(_MAGIC) + 4 + length,
+                               shape=tuple(self.header["shape"]))
+        # Plain ndarray view of the mapping; indexing a memmap subclass is several times slower
+        self._values = self.table.view(np.ndarray)
+        self.fop = self.header["fop"]
+        self.theta = np.linspace(0.0, 90.0, self.table.shape[1] + 1)
+        self.phi = np.linspace(0.0, 90.0, self.table.shape[2] + 1)
+        self._shackle_index = {key: i for i, key in enumerate(self.header["shackles"])}
+
+    def capacities(self, shackle, fy, theta, phi, twc=0.0):
+        """Allowable design load P (kN) per check, from the table cell holding (θ, φ).
+
+        ``shackle`` is a key or a sequence of keys; the numeric arguments
+        broadcast against it. The weld check is not applicable, and its
+        capacity infinite, where twc <= 0.
+        """
+        if isinstance(shackle, str) and _all_scalars(fy, theta, phi, twc):
+            return self._scalar_capacities(shackle, float(fy), float(theta), float(phi), float(twc))
+        if isinstance(shackle, str):
+            s = self._shackle_index[shackle]
+        else:
+            s = np.fromiter((self._shackle_index[k] for k in shackle), dtype=np.intp)
+        fy = np.asarray(fy, dtype=float)
+        if np.any(~(fy >= 0)):
+            raise ValueError("fy must not be negative")
+        i = _cell(theta, self.header["theta_step"], self._values.shape[1], "θ")
+        j = _cell(phi, self.header["phi_step"], self._values.shape[2], "φ")
+        s, i, j = np.broadcast_arrays(s, i, j)
+
+        twc = np.asarray(twc, dtype=float)[..., None]
+        # Per MPa of fy, except the weld capacity which is per mm of weld size
+        caps = self._values[s, i, j] * np.where(np.arange(len(CHECK_NAMES)) == _WELD, twc, fy[..., None])
+        caps[..., _WELD] = np.where(twc[..., 0] > 0, caps[..., _WELD], np.inf)
+        return {name: caps[..., k] for k, name in enumerate(CHECK_NAMES)}
+
+    def _scalar_capacities(self, shackle, fy, theta, phi, twc):
+        # Same lookup as ``capacities`` for one table cell
+        if not fy >= 0:
+            raise ValueError("fy must not be negative")
+        if not (0.0 <= theta <= 90.0 and 0.0 <= phi <= 90.0):
+            raise ValueError("θ and φ must be between 0 and 90 degrees")
+        _, n_theta, n_phi, _ = self._values.shape
+        i = min(int(theta / self.header["theta_step"]), n_theta - 1)
+        j = min(int(phi / self.header["phi_step"]), n_phi - 1)
+        cell = self._values[self._shackle_index[shackle], i, j].tolist()
+        caps = {name: cap * fy for name, cap in zip(CHECK_NAMES, cell)}
+        caps["Weld"] = cell[_WELD] * twc if twc > 0 else float("inf")
+        return caps
+
+    def max_static_load(self, shackle, fy, theta, phi, DAF, twc=0.0):
+        """Largest static sling load Ps (kN) and the governing limit.
+
+        Returns (max_Ps, governing, limits) where ``limits`` maps each check
+        and "Shackle SWL" to its own Ps limit. Scalar inputs give a float and
+        a string; array inputs give arrays. Raises ValueError unless DAF > 0.
+        """
+        if not (DAF > 0 if isinstance(DAF, (int, float)) else np.all(np.asarray(DAF, dtype=float) > 0)):
+            raise ValueError("DAF must be positive")
+        caps = self.capacities(shackle, fy, theta, phi, twc)
+        if isinstance(shackle, str) and _all_scalars(fy, theta, phi, twc, DAF):
+            limits = {name: cap / DAF for name, cap in caps.items()}
+            limits[SHACKLE_LIMIT] = float(shackle_data[shackle]["SWL"] * CONVERSION_FACTOR)
+            governing = min(limits, key=limits.get)
+            return limits[governing], governing, limits
+        DAF = np.asarray(DAF, dtype=float)
+        limits = {name: cap / DAF for name, cap in caps.items()}
+        if isinstance(shackle, str):
+            swl = SHACKLE_SWL[SHACKLE_KEYS.index(shackle)]
+        else:
+            swl = SHACKLE_SWL[[SHACKLE_KEYS.index(k) for k in shackle]]
+        names = list(limits)
+        stacked = np.stack(np.broadcast_arrays(*limits.values()), axis=-1)
+        limits[SHACKLE_LIMIT] = np.broadcast_to(swl * CONVERSION_FACTOR, stacked.shape[:-1]).astype(float)
+        names.append(SHACKLE_LIMIT)
+        stacked = np.concatenate([stacked, limits[SHACKLE_LIMIT][..., None]], axis=-1)
+        best = np.argmin(stacked, axis=-1)
+        max_Ps = np.take_along_axis(stacked, best[..., None], axis=-1)[..., 0]
+        governing = np.asarray(names)[best]
+        return max_Ps, governing, limits
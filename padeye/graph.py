@@ -0,0 +1,185 @@
+"""Incremental single-design calculation as a dependency graph of named quantities.
+
+Each node is a function of other nodes or of the inputs in
+``INPUT_FIELDS``; its dependencies are the function's parameter names unless
+listed explicitly. The nodes are the per-quantity functions of
+``padeye.core`` that ``check_design`` is built from (dh, R, T, P, Pv, the
+areas Ab, Av, At, Ate, Aba, the moduli Zip, Zop, the allowables fby, fv, ft,
+fte, allowable_vm, the actual stresses and each check's verdict), so a
+``DesignGraph`` gives the same numbers without a second copy of the formulas.
+
+Nodes are evaluated lazily and remembered between calls. After an input
+changes, reading a node only recomputes it if one of its dependencies
+changed value, so e.g. a new twc recomputes the weld nodes and reuses the
+geometry, loads and other checks, a new fy recomputes only the allowables
+and verdicts, and a recomputed node whose value comes
+out unchanged does not invalidate the nodes below it. The page keeps one
+graph in ``st.session_state`` across reruns.
+"""
+
+from padeye import core
+from padeye.core import CHECK_NAMES, INPUT_FIELDS
+
+# (name, function[, dependencies]) in dependency order; the functions are those of
+# ``padeye.core``. Dependencies default to the function's parameter names.
+NODES = (
+    ("shackle_properties", core.shackle_properties),
+    ("Psh", lambda shackle_properties: shackle_properties[0]),
+    ("A_val", lambda shackle_properties: shackle_properties[1]),
+    ("B_val", lambda shackle_properties: shackle_properties[2]),
+    ("C_val", lambda shackle_properties: shackle_properties[3]),
+    # Geometry
+    ("dh", core.hole_diameter),
+    ("R", core.main_plate_radius),
+    ("r_val", core.cheek_plate_radius),
+    ("T", core.main_plate_thickness),
+    ("t_val", core.cheek_plate_thickness),
+    ("l_val", core.base_length),
+    ("e_val", core.eccentricity),
+    # Shackle compatibility
+    ("min_inside_length_required", core.min_inside_length),
+    ("actual_inside_length", lambda C_val: C_val),
+    ("jaw_width_clearance", core.jaw_width_clearance),
+    ("actual_shackle_spread_pct", core.shackle_spread_pct),
+    ("shackle_ok", core.shackle_ok),
+    ("clearance_ok", core.inside_length_ok),
+    ("spread_ok", core.spread_ok),
+    # Loads
+    ("P", core.design_load),
+    ("Pv", core.vertical_load),
+    ("Ph", core.horizontal_load),
+    ("Po", core.out_of_plane_load),
+    ("max_force", core.max_force),
+    # 2.1 Bearing
+    ("Ab", core.bearing_area),
+    ("fby", core.bearing_allowable),
+    ("bearing_stress", core.bearing_stress),
+    ("Bearing", core.verdict, ("bearing_stress", "fby")),
+    # 2.2 Pull-Out Shear
+    ("Av", core.shear_area),
+    ("fv", core.shear_allowable),
+    ("shear_stress", core.shear_stress),
+    ("Pull-Out Shear", core.verdict, ("shear_stress", "fv")),
+    # 2.3 Tear Out
+    ("At", core.tear_out_area),
+    ("ft", core.tear_out_allowable),
+    ("tear_out_stress", core.tear_out_stress),
+    ("Tear Out", core.verdict, ("tear_out_stress", "ft")),
+    # 2.4 Tensile
+    ("Ate", core.tensile_area),
+    ("fte", core.tensile_allowable),
+    ("tensile_stress", core.tensile_stress),
+    ("Tensile", core.verdict, ("tensile_stress", "fte")),
+    # 2.6 Pad-Eye Base
+    ("Aba", core.base_area),
+    ("Zip", core.in_plane_modulus),
+    ("Zop", core.out_of_plane_modulus),
+    ("allowable_vm", core.base_allowable),
+    ("sigma_vm", core.base_stress),
+    ("Pad-Eye Base", core.verdict, ("sigma_vm", "allowable_vm")),
+    # 2.7 Weld
+    ("weld_applicable", core.weld_applicable),
+    ("Pc", core.cheek_plate_load),
+    ("tau_wc", core.weld_stress),
+    ("Weld", core.weld_verdict),
+    ("all_passed", lambda *checks: all(check["passed"] for check in checks), CHECK_NAMES),
+)
+
+GEOMETRY_NODES = ("dh", "R", "r_val", "T", "t_val", "l_val", "e_val")
+CLEARANCE_NODES = ("min_inside_length_required", "actual_inside_length",
+                   "jaw_width_clearance", "actual_shackle_spread_pct")
+LOAD_NODES = ("P", "Pv", "Ph", "Po", "max_force")
+
+
+def _dependencies(func):
+    code = func.__code__
+    return code.co_varnames[:code.co_argcount]
+
+
+def _same(old, new):
+    return type(old) is type(new) and old == new
+
+
+class DesignGraph:
+    """Lazily evaluated, memoized ``NODES`` for one design.
+
+    Set inputs with ``set_inputs`` and read quantities with ``graph[name]``.
+    ``take_report`` lists the nodes recomputed and reused since it was last
+    called.
+    """
+
+    def __init__(self):
+        self._nodes = {name: (deps[0] if deps else _dependencies(func), func) for name, func, *deps in NODES}
+        self._values = {}
+        self._changed = {}   # revision at which each value last changed
+        self._verified = {}  # revision at which each node was last brought up to date
+        self.revision = 0
+        self._recomputed = {}
+        self._reused = {}
+
+    def set_inputs(self, **inputs):
+        """Update any of the ``INPUT_FIELDS``; unchanged values invalidate nothing."""
+        for name, value in inputs.items():
+            if name not in INPUT_FIELDS:
+                raise KeyError(f"Unknown design input '{name}'")
+            if name in self._values and _same(self._values[name], value):
+                continue
+            self.revision += 1
+            self._values[name] = value
+            self._changed[name] = self.revision
+
+    def __getitem__(self, name):
+        if name in INPUT_FIELDS:
+            return self._values[name]
+        if self._verified.get(name) == self.revision:
+            self._reused[name] = None
+            return self._values[name]
+        deps, func = self._nodes[name]
+        args = [self[dep] for dep in deps]
+        if name in self._values and all(self._changed[dep] <= self._verified[name] for dep in deps):
+            self._reused[name] = None
+        else:
+            value = func(*args)
+            self._recomputed[name] = None
+            if name not in self._values or not _same(self._values[name], value):
+                self._values[name] = value
+                self._changed[name] = self.revision
+        self._verified[name] = self.revision
+        return self._values[name]
+
+    def take_report(self):
+        """{"recomputed": [...], "reused": [...]} node names since the last call, then reset."""
+        recomputed = list(self._recomputed)
+        reused = [name for name in self._reused if name not in self._recomputed]
+        self._recomputed, self._reused = {}, {}
+        return {"recomputed": recomputed, "reused": reused}
+
+    def geometry(self):
+        return {name: self[name] for name in GEOMETRY_NODES}
+
+    def clearances(self):
+        return {name: self[name] for name in CLEARANCE_NODES}
+
+    def loads(self):
+        return {name: self[name] for name in LOAD_NODES}
+
+    def safety_checks(self):
+        return {name: self[name] for name in CHECK_NAMES}
+
+    def result(self):
+        """The same dict as ``padeye.core.check_design`` for the current inputs."""
+        return {
+            "shackle": self["shackle"],
+            "Psh": self["Psh"],
+            "A_val": self["A_val"],
+            "B_val": self["B_val"],
+            "C_val": self["C_val"],
+            "geometry": self.geometry(),
+            "clearances": self.clearances(),
+            "loads": self.loads(),
+            "safety_checks": self.safety_checks(),
+            "shackle_ok": self["shackle_ok"],
+            "clearance_ok": self["clearance_ok"],
+            "spread_ok": self["spread_ok"],
+            "all_passed": self["all_passed"],
+        }
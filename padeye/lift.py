@@ -0,0 +1,177 @@
+"""Sling loads of 2- and 4-point lifts, over whole COG/hook-height envelopes.
+
+A freely hanging lift has its hook vertically above the centre of gravity,
+so every sling runs from its pad-eye to the point (COG x, COG y, hook
+height) and only force equilibrium remains to be solved:
+
+* 2-point lift: vertical balance and balance along the line between the
+  pad-eyes. Any COG offset from that line shows up as an unbalanced
+  horizontal force (the load would rotate until the COG is under the line).
+* 4-point lift: the three force equations are completed with the usual
+  rigid-body assumption that the two diagonals (pad-eyes 1-3 and 2-4, listed
+  around the perimeter) carry equal vertical load.
+
+Each case is a small linear system; all cases are solved in one batched
+``numpy.linalg.solve`` call, so thousands of COG/hook-height permutations
+cost one pass. The resulting sling tension, θ (sling angle with the
+horizontal) and φ (out-of-plane angle with the pad-eye plate) feed the
+vectorized checks as Ps, theta and phi. Coordinates may be in any length
+unit as long as they are consistent; the weight is in kN.
+"""
+
+import numpy as np
+
+from padeye.core import CHECK_NAMES
+from padeye.engine import evaluate_checks, shackle_dimensions
+
+LIFT_POINTS = (2, 4)
+
+
+def cog_envelope(cog, shift=(0.0, 0.0), steps=5, hook_heights=None):
+    """COG positions on a ``steps``×``steps`` grid of ± ``shift`` around ``cog``, times each hook height.
+
+    Returns (cogs, hooks) arrays of shape (n, 2) and (n,). The exact nominal
+    COG always comes first at every hook height, so case 0 is the nominal
+    lift at the first hook height; an even ``steps`` grid, which does not
+    contain it, gains it as one extra position.
+    """
+    cx, cy = (float(v) for v in cog)
+    dx, dy = (float(v) for v in shift)
+    hooks = np.atleast_1d(np.asarray(hook_heights, dtype=float))
+    offsets = np.linspace(-1.0, 1.0, steps) if steps > 1 else np.zeros(1)
+    gx, gy = np.meshgrid(cx + dx * offsets, cy + dy * offsets, indexing="ij")
+    grid = np.column_stack([gx.ravel(), gy.ravel()])
+    nominal = np.array([[cx, cy]])
+    grid = np.concatenate([nominal, grid[~np.all(np.isclose(grid, nominal), axis=1)]])
+    cogs = np.tile(grid, (len(hooks), 1))
+    return cogs, np.repeat(hooks, len(grid))
+
+
+def padeye_orientations(padeyes, cog):
+    """Plan direction (degrees) of each pad-eye plate, aligned with the sling at the given COG."""
+    padeyes = np.asarray(padeyes, dtype=float)
+    return np.degrees(np.arctan2(cog[1] - padeyes[:, 1], cog[0] - padeyes[:, 0]))
+
+
+def solve_lift(padeyes, weight, cog, hook_height, orientation=None):
+    """Sling tensions and angles for every lift case.
+
+    ``padeyes`` is a (k, 2) or (k, 3) array of pad-eye x, y[, z] with k = 2
+    or 4; ``cog`` is (2,) or (n, 2) and ``hook_height`` scalar or (n,), the
+    hook's z. ``orientation`` is each plate's plan direction in degrees
+    (default: aligned with the slings at the mean COG). Returns a dict of
+    (n, k) arrays "tension" (kN), "theta" and "phi" (degrees), plus per case
+    "unbalanced" (horizontal force the slings cannot balance, kN) and
+    "slack" (some sling would need to push).
+    """
+    padeyes = np.asarray(padeyes, dtype=float)
+    if padeyes.ndim != 2 or padeyes.shape[0] not in LIFT_POINTS or padeyes.shape[1] not in (2, 3):
+        raise ValueError("Pad-eyes must be 2 or 4 rows of x, y[, z] coordinates")
+    if padeyes.shape[1] == 2:
+        padeyes = np.column_stack([padeyes, np.zeros(len(padeyes))])
+    k = len(padeyes)
+    cog = np.atleast_2d(np.asarray(cog, dtype=float))
+    hook = np.asarray(hook_height, dtype=float)
+    n = max(len(cog), hook.size)
+    cog = np.broadcast_to(cog, (n, 2))
+    hook = np.broadcast_to(hook.reshape(-1), (n,))
+    if np.any(hook <= padeyes[:, 2].max()):
+        raise ValueError("Hook height must be above every pad-eye")
+
+    # Unit vectors from each pad-eye to the hook, shape (n, k, 3)
+    d = np.stack([cog[:, None, 0] - padeyes[None, :, 0],
+                  cog[:, None, 1] - padeyes[None, :, 1],
+                  hook[:, None] - padeyes[None, :, 2]], axis=-1)
+    u = d / np.linalg.norm(d, axis=-1, keepdims=True)
+
+    rhs = np.zeros((n, k))
+    if k == 2:
+        axis = padeyes[1, :2] - padeyes[0, :2]
+        length = np.linalg.norm(axis)
+        if length == 0:
+            raise ValueError("Pad-eye arrangement is degenerate (coincident pad-eyes)")
+        axis /= length
+        side = np.array([-axis[1], axis[0]])
+        A = np.stack([u[..., :2] @ axis, u[..., 2]], axis=1)
+        rhs[:, 1] = weight
+    else:
+        diagonal = np.array([1.0, -1.0, 1.0, -1.0])
+        A = np.stack([u[..., 0], u[..., 1], u[..., 2], u[..., 2] * diagonal], axis=1)
+        rhs[:, 2] = weight
+    try:
+        tension = np.linalg.solve(A, rhs[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        raise ValueError("Pad-eye arrangement is degenerate (coincident or collinear pad-eyes)") from None
+
+    horizontal = np.einsum("nk,nkj->nj", tension, u[..., :2])
+    unbalanced = np.abs(horizontal @ side) if k == 2 else np.linalg.norm(horizontal, axis=-1)
+
+    if orientation is None:
+        orientation = padeye_orientations(padeyes, cog.mean(axis=0))
+    azimuth = np.arctan2(d[..., 1], d[..., 0]) - np.radians(np.asarray(orientation, dtype=float))
+    return {
+        "tension": tension,
+        "theta": np.degrees(np.arcsin(np.clip(u[..., 2], -1.0, 1.0))),
+        "phi": np.degrees(np.abs(np.arcsin(np.sin(azimuth)))),
+        "unbalanced": unbalanced,
+        "slack": np.any(tension < 0, axis=1),
+    }
+
+
+def check_lift(padeyes, weight, cog, hook_height, DAF, fop, shackles, fy, twc, orientation=None):
+    """Solve a lift and run the design checks on every pad-eye of every case.
+
+    ``shackles`` lists each pad-eye's shackle key; ``fy`` and ``twc`` are
+    scalars or per pad-eye. Returns the ``solve_lift`` dict plus the
+    engine's "checks" and "weld_applicable", and (n, k) arrays
+    "utilisation" (largest actual/allowable ratio), "governing" (its check),
+    "shackle_ok" and "all_passed" (all checks, shackle SWL and no slack
+    sling).
+    """
+    lift = solve_lift(padeyes, weight, cog, hook_height, orientation)
+    Psh, A, B, C = shackle_dimensions(shackles)
+    result = evaluate_checks(lift["tension"], DAF, lift["theta"], lift["phi"], fop, A, B, C, fy, twc)
+
+    checks = result["checks"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.stack([np.where(checks[name]["allowable"] > 0,
+                                    checks[name]["actual"] / checks[name]["allowable"], np.inf)
+                           for name in CHECK_NAMES], axis=-1)
+    # The weld check never governs where it does not apply
+    weld = CHECK_NAMES.index("Weld")
+    ratios[..., weld] = np.where(result["weld_applicable"], ratios[..., weld], 0.0)
+    governing = np.argmax(ratios, axis=-1)
+    shackle_ok = lift["tension"] <= Psh
+    lift.update({
+        "checks": checks,
+        "weld_applicable": result["weld_applicable"],
+        "utilisation": np.take_along_axis(ratios, governing[..., None], axis=-1)[..., 0],
+        "governing": np.asarray(CHECK_NAMES)[governing],
+        "shackle_ok": shackle_ok,
+        "all_passed": result["all_passed"] & shackle_ok & ~lift["slack"][:, None],
+    })
+    return lift
+
+
+def envelope_summary(result):
+    """Worst case per pad-eye over all lift cases of a ``check_lift`` result.
+
+    Returns a list of dicts with "max_tension", "min_theta", "max_phi",
+    "max_utilisation", "governing" (at the worst case), "worst_case" (its
+    index; the highest sling load among equally utilised cases) and
+    "failing_cases".
+    """
+    summary = []
+    for i in range(result["tension"].shape[1]):
+        # Vertical reactions do not depend on hook height, so ties are common; take the largest tension
+        case = int(np.lexsort((result["tension"][:, i], result["utilisation"][:, i].round(9)))[-1])
+        summary.append({
+            "max_tension": float(result["tension"][:, i].max()),
+            "min_theta": float(result["theta"][:, i].min()),
+            "max_phi": float(result["phi"][:, i].max()),
+            "max_utilisation": float(result["utilisation"][case, i]),
+            "governing": str(result["governing"][case, i]),
+            "worst_case": case,
+            "failing_cases": int(np.count_nonzero(~result["all_passed"][:, i])),
+        })
+    return summary
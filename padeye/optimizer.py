@@ -0,0 +1,229 @@
+"""Minimum-weight pad-eye search over shackle, plate thickness, radius, base length and weld size.
+
+The search leans on how each check responds to the geometry:
+
+* bearing depends only on the combined thickness T + 2t;
+* pull-out shear, tear-out, tensile and weld only improve as R grows;
+* the base check improves as l grows but worsens with R (eccentricity e = R).
+
+Weight grows with every dimension, so for a given (shackle, T, t) the
+lightest design is the smallest R passing the R-monotone checks, followed by
+the smallest l >= 2R passing the base check. Both are found by bisection
+instead of walking the grid, (T, t) pairs that fail at the most favourable
+corner are dropped outright, and shackles whose lower-bound weight already
+exceeds the best design found so far are skipped.
+"""
+
+import math
+import time
+
+import numpy as np
+
+from padeye.core import inside_length_ok
+from padeye.data import CONVERSION_FACTOR, ALLOWABLE_WELD_STRESS
+from padeye.engine import (
+    SHACKLE_KEYS, SHACKLE_SWL, SHACKLE_JAW_WIDTH, SHACKLE_PIN_DIAMETER,
+    SHACKLE_INSIDE_LENGTH, CHECK_NAMES, design_loads, checks_from_geometry,
+)
+from padeye.selection import shackle_series
+
+STEEL_DENSITY = 7.85e-6  # kg/mm³
+
+# Search grids (mm)
+PLATE_THICKNESSES = (6, 8, 10, 12, 15, 16, 20, 25, 30, 35, 40, 45, 50, 55, 60,
+                     65, 70, 75, 80, 90, 100, 110, 120, 130, 140, 150)
+CHEEK_THICKNESSES = (0,) + PLATE_THICKNESSES
+WELD_SIZES = (3, 4, 5, 6, 8, 10, 12, 14, 16)
+R_STEP = 1.0
+L_STEP = 5.0
+L_MAX_FACTOR = 3.0  # Base length searched from 2R up to L_MAX_FACTOR * 2R
+
+_R_CHECKS = ("Bearing", "Pull-Out Shear", "Tear Out", "Tensile", "Weld")
+
+
+def plate_weight(R, dh, T, t_val, l_val):
+    """Approximate steel weight (kg) of the main plate and both cheek plates.
+
+    The main plate is a half-disc of radius R over an l x R base block, less
+    the hole; each cheek plate is a full disc of radius R less the hole.
+    """
+    hole = math.pi * (dh / 2) ** 2
+    main = (l_val * R + math.pi * R**2 / 2 - hole) * T
+    cheeks = 2 * (math.pi * R**2 - hole) * t_val
+    return (main + cheeks) * STEEL_DENSITY
+
+
+def _evaluate(loads, B_val, dh, T, t_val, R, l_val, fy, twc):
+    geom = {"dh": dh, "R": R, "r_val": R, "T": T, "t_val": t_val, "l_val": l_val, "e_val": R}
+    shape = np.shape(T)
+    loads = {k: np.broadcast_to(v, shape) for k, v in loads.items()}
+    return checks_from_geometry(geom, loads, B_val, fy, np.broadcast_to(twc, shape))["checks"]
+
+
+def _passes(checks, names):
+    ok = True
+    for name in names:
+        ok = ok & checks[name]["passed"]
+    return ok
+
+
+def _bisect_first(n_points, evaluate):
+    """Smallest passing index per candidate, given that the last index passes.
+
+    ``n_points`` holds the grid length per candidate and ``evaluate(idx)``
+    returns a pass mask for the candidates at those indices.
+    """
+    lo = np.zeros_like(n_points)
+    hi = n_points - 1
+    while True:
+        active = lo < hi
+        if not active.any():
+            return lo
+        mid = (lo + hi) // 2
+        ok = evaluate(mid)
+        hi = np.where(active & ok, mid, hi)
+        lo = np.where(active & ~ok, mid + 1, lo)
+
+
+def _optimize_shackle(i, loads, P, fy, min_spread, best_weight, stats):
+    A, B_val, C = SHACKLE_JAW_WIDTH[i], SHACKLE_PIN_DIAMETER[i], SHACKLE_INSIDE_LENGTH[i]
+    dh = B_val + 1.5
+    R_min = dh / 2 + R_STEP
+    # Up to the rule-of-thumb radius R = C + dh/2, where the plate reaches the shackle bow
+    R_max = C + dh / 2
+    n_R = int(math.floor((R_max - R_min) / R_STEP)) + 1 if R_max >= R_min else 0
+
+    T, t_val = (g.ravel() for g in np.meshgrid(PLATE_THICKNESSES, CHEEK_THICKNESSES, indexing="ij"))
+    T, t_val = T.astype(float), t_val.astype(float)
+    fits = (T + 2*t_val <= A) & ((T + 2*t_val) / A * 100 >= min_spread)
+    n_L = int((L_MAX_FACTOR - 1) * 2 * R_max / L_STEP) + 1 if n_R else 0
+    # Grid points of one (T, t) pair: every R, l and weld size
+    family = n_R * n_L * len(WELD_SIZES)
+    stats["grid_size"] += len(T) * family
+    stats["pruned"] += int(np.count_nonzero(~fits)) * family
+    if n_R == 0 or not fits.any():
+        return None
+    T, t_val = T[fits], t_val[fits]
+
+    # Bound: nothing in this (T, t) family is lighter than its smallest R and l
+    lower_bound = plate_weight(R_min, dh, T, t_val, 2 * R_min)
+    keep = lower_bound < best_weight
+    stats["pruned"] += int(np.count_nonzero(~keep)) * family
+    if not keep.any():
+        return None
+    T, t_val = T[keep], t_val[keep]
+    n = len(T)
+
+    # Most favourable corner for the R-monotone checks; pairs failing here fail everywhere
+    twc_max = np.where(t_val > 0, WELD_SIZES[-1], 0.0)
+    ok = _passes(_evaluate(loads, B_val, dh, T, t_val, np.full(n, R_max), np.full(n, 2 * R_max), fy, twc_max),
+                 _R_CHECKS)
+    stats["evaluated"] += n
+    stats["pruned"] += int(np.count_nonzero(~ok)) * family
+    if not ok.any():
+        return None
+    T, t_val, twc_max = T[ok], t_val[ok], twc_max[ok]
+    n = len(T)
+    stats["searched"] += n * family
+    R_grid = R_min + R_STEP * np.arange(n_R)
+
+    def r_passes(idx):
+        stats["evaluated"] += n
+        R = R_grid[idx]
+        return _passes(_evaluate(loads, B_val, dh, T, t_val, R, 2 * R, fy, twc_max), _R_CHECKS)
+
+    R = R_grid[_bisect_first(np.full(n, n_R), r_passes)]
+
+    # Base check: drop pairs that fail even at the longest base, then bisect l
+    n_l = ((L_MAX_FACTOR - 1) * 2 * R / L_STEP).astype(int) + 1
+    l_max = 2 * R + L_STEP * (n_l - 1)
+    ok = _evaluate(loads, B_val, dh, T, t_val, R, l_max, fy, twc_max)["Pad-Eye Base"]["passed"]
+    stats["evaluated"] += n
+    if not ok.any():
+        return None
+    T, t_val, twc_max, R, n_l = T[ok], t_val[ok], twc_max[ok], R[ok], n_l[ok]
+    n = len(T)
+
+    def l_passes(idx):
+        stats["evaluated"] += n
+        checks = _evaluate(loads, B_val, dh, T, t_val, R, 2 * R + L_STEP * idx, fy, twc_max)
+        return checks["Pad-Eye Base"]["passed"]
+
+    l_val = 2 * R + L_STEP * _bisect_first(n_l, l_passes)
+
+    weight = plate_weight(R, dh, T, t_val, l_val)
+    j = int(np.argmin(weight))
+    if weight[j] >= best_weight:
+        return None
+
+    # Smallest weld that passes at the chosen radius (no weld without cheek plates)
+    twc = 0.0
+    if t_val[j] > 0:
+        Pc = P * (t_val[j] / (T[j] + 2*t_val[j]))
+        required = (Pc * 1000.0) / (0.5 * (2 * math.pi * R[j]) * 0.707 * ALLOWABLE_WELD_STRESS)
+        twc = float(WELD_SIZES[min(np.searchsorted(WELD_SIZES, required), len(WELD_SIZES) - 1)])
+    return {
+        "shackle": SHACKLE_KEYS[i],
+        "dh": float(dh),
+        "T": float(T[j]),
+        "t_val": float(t_val[j]),
+        "R": float(R[j]),
+        "l_val": float(l_val[j]),
+        "twc": twc,
+        "weight_kg": float(weight[j]),
+    }
+
+
+def optimize_padeye(Ps, DAF, theta, phi, fop, fy, dr=0.0, min_spread=0.0, series=None):
+    """Find the lightest pad-eye geometry that passes every design check.
+
+    Shackles are restricted to those whose SWL covers ``Ps``, whose inside
+    length clears the rope (``core.inside_length_ok``) and, if given, to the
+    listed ``series`` (one name or several). Returns a dict with the winning
+    "design" (None if nothing passes), its "safety_checks" in the page's
+    layout, and the search statistics: "grid_size" (points of the full 5-D
+    grid), "pruned" (grid points ruled out wholesale by the fit, weight-bound
+    and best-corner tests), "searched" (grid points of the (T, t) families
+    resolved by bisection), "evaluated" (check evaluations, bisection steps
+    included) and "seconds".
+    """
+    start = time.perf_counter()
+    loads = design_loads(Ps, DAF, theta, phi, fop)
+    P = float(loads["P"])
+    fy = float(fy)
+    if series is not None:
+        series = {series} if isinstance(series, str) else set(series)
+    stats = {"grid_size": 0, "evaluated": 0, "pruned": 0, "searched": 0}
+
+    candidates = [i for i, key in enumerate(SHACKLE_KEYS)
+                  if SHACKLE_SWL[i] * CONVERSION_FACTOR >= Ps
+                  and inside_length_ok(SHACKLE_INSIDE_LENGTH[i], dr)
+                  and (series is None or shackle_series(key) in series)]
+    # Lightest shackles first so the incumbent tightens the bound early
+    candidates.sort(key=lambda i: (SHACKLE_JAW_WIDTH[i], SHACKLE_PIN_DIAMETER[i]))
+
+    best = None
+    for i in candidates:
+        design = _optimize_shackle(i, loads, P, fy, min_spread,
+                                   best["weight_kg"] if best else math.inf, stats)
+        if design is not None:
+            best = design
+
+    safety_checks = None
+    if best is not None:
+        i = SHACKLE_KEYS.index(best["shackle"])
+        checks = _evaluate(loads, SHACKLE_PIN_DIAMETER[i], best["dh"], np.array(best["T"]),
+                           best["t_val"], best["R"], best["l_val"], fy, best["twc"])
+        stats["evaluated"] += 1
+        safety_checks = {name: {k: (bool(v) if k == "passed" else float(v)) for k, v in checks[name].items()}
+                         for name in CHECK_NAMES}
+
+    return {
+        "design": best,
+        "safety_checks": safety_checks,
+        "grid_size": stats["grid_size"],
+        "evaluated": stats["evaluated"],
+        "pruned": stats["pruned"],
+        "searched": stats["searched"],
+        "seconds": time.perf_counter() - start,
+    }
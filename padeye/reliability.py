@@ -0,0 +1,141 @@
+"""Monte Carlo reliability analysis of a pad-eye design.
+
+The random inputs (Ps, DAF, θ, φ, fop, fy) are sampled in fixed-size chunks,
+each chunk is checked with the vectorized engine in a worker process, and
+only the per-check failure counts come back. Memory is bounded by the chunk
+size, not the sample count, and every chunk has its own seed spawned from
+one ``SeedSequence`` so results are reproducible for a given seed whatever
+the number of workers.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from padeye.engine import CHECK_NAMES, derive_geometry, design_loads, shackle_dimensions, checks_from_geometry
+
+VARIABLES = ("Ps", "DAF", "theta", "phi", "fop", "fy")
+DISTRIBUTIONS = ("fixed", "normal", "lognormal", "uniform")
+DEFAULT_CHUNK_SIZE = 250_000
+
+# Physical bounds applied after sampling (angles are limited as on the input page)
+_BOUNDS = {"theta": (0.0, 90.0), "phi": (0.0, 90.0)}
+
+
+def _validate(distributions):
+    missing = [v for v in VARIABLES if v not in distributions]
+    if missing:
+        raise ValueError(f"Missing distribution for: {', '.join(missing)}")
+    for name in VARIABLES:
+        kind, *params = distributions[name]
+        if kind not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution '{kind}' for {name}")
+        if len(params) != (1 if kind == "fixed" else 2):
+            raise ValueError(f"Wrong number of parameters for {kind} distribution of {name}")
+        if kind == "lognormal" and params[0] <= 0:
+            raise ValueError(f"Lognormal mean for {name} must be positive")
+
+
+def _sample(rng, spec, n):
+    kind, *params = spec
+    if kind == "fixed":
+        return np.full(n, float(params[0]))
+    if kind == "normal":
+        return rng.normal(params[0], params[1], n)
+    if kind == "lognormal":
+        # Parameterised by the mean and standard deviation of the variable itself
+        mean, std = params
+        sigma2 = math.log1p((std / mean) ** 2)
+        return rng.lognormal(math.log(mean) - sigma2 / 2, math.sqrt(sigma2), n)
+    return rng.uniform(params[0], params[1], n)
+
+
+def _run_chunk(task):
+    distributions, shackle, twc, n, seed = task
+    rng = np.random.default_rng(seed)
+    values = {}
+    for name in VARIABLES:
+        low, high = _BOUNDS.get(name, (0.0, np.inf))
+        values[name] = np.clip(_sample(rng, distributions[name], n), low, high)
+
+    _, A, B, C = shackle_dimensions([shackle])
+    geom = derive_geometry(A[0], B[0], C[0])
+    loads = design_loads(values["Ps"], values["DAF"], values["theta"], values["phi"], values["fop"])
+    result = checks_from_geometry(geom, loads, B[0], values["fy"], twc)
+
+    failures = {name: int(np.count_nonzero(~result["checks"][name]["passed"])) for name in CHECK_NAMES}
+    failures["Any"] = int(np.count_nonzero(~result["all_passed"]))
+    return n, failures
+
+
+def wilson_interval(failures, n, confidence=0.95):
+    """Wilson score interval for a failure probability estimated from ``failures`` out of ``n``."""
+    if n == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = failures / n
+    denom = 1 + z**2 / n
+    centre = (p + z**2 / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z**2 / (4 * n**2)) / denom
+    lower = 0.0 if failures == 0 else max(0.0, centre - half)
+    upper = 1.0 if failures == n else min(1.0, centre + half)
+    return lower, upper
+
+
+def run_reliability(distributions, shackle, twc, n_samples=1_000_000, chunk_size=DEFAULT_CHUNK_SIZE,
+                    workers=None, seed=None, confidence=0.95, progress=None):
+    """Estimate the probability of failure of each design check.
+
+    ``distributions`` maps every name in ``VARIABLES`` to a tuple
+    ``("fixed", value)``, ``("normal", mean, std)``, ``("lognormal", mean, std)``
+    or ``("uniform", low, high)``. ``shackle`` is a ``shackle_data`` key and
+    ``twc`` the cheek-plate weld size. ``workers`` defaults to the CPU count;
+    1 runs in-process. ``progress``, if given, is called with the number of
+    samples tallied so far.
+
+    Returns a dict with "samples", "seconds", and per check (plus "Any" for
+    failure of at least one check) "failures", "pf" and "ci" (lower, upper).
+    """
+    _validate(distributions)
+    if n_samples < 1:
+        raise ValueError("Number of samples must be at least 1")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    shackle_dimensions([shackle])  # Fail fast on an unknown key
+    workers = workers or os.cpu_count() or 1
+    n_chunks = max(1, math.ceil(n_samples / chunk_size))
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    sizes = [chunk_size] * (n_chunks - 1) + [n_samples - chunk_size * (n_chunks - 1)]
+    tasks = [(distributions, shackle, float(twc), size, s) for size, s in zip(sizes, seeds)]
+
+    start = time.perf_counter()
+    samples = 0
+    failures = {name: 0 for name in CHECK_NAMES + ("Any",)}
+    if workers == 1:
+        results = map(_run_chunk, tasks)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=min(workers, n_chunks))
+        results = pool.map(_run_chunk, tasks)
+    try:
+        for n, counts in results:
+            samples += n
+            for name, count in counts.items():
+                failures[name] += count
+            if progress is not None:
+                progress(samples)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    return {
+        "samples": samples,
+        "seconds": time.perf_counter() - start,
+        "failures": failures,
+        "pf": {name: count / samples for name, count in failures.items()},
+        "ci": {name: wilson_interval(count, samples, confidence) for name, count in failures.items()},
+    }
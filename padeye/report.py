@@ -0,0 +1,235 @@
+"""Bulk calculation reports for a whole lift schedule.
+
+The schedule is read and checked chunk by chunk as in ``padeye.schedule``
+and written straight to disk, either as
+
+* a zip with one HTML calculation sheet per pad-eye plus the schematics
+  (PNG, or SVG from ``padeye.svg``), or
+* a write-only workbook with a "Summary" sheet (one row per pad-eye) and a
+  "Diagrams" sheet holding each schematic once.
+
+Pad-eye geometry follows from the shackle, so many rows share a drawing.
+Each distinct ``diagram_key`` is rendered and PNG-encoded once, in a process
+pool, while later chunks are still being checked; every pad-eye with that
+geometry then refers to the same image. There is at most one drawing per
+catalogue shackle, so they are held until the end and written in id order.
+"""
+
+import html
+import io
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from openpyxl import Workbook
+from openpyxl.drawing.image import Image as XLImage
+
+from padeye.core import CHECK_NAMES
+from padeye.diagram import diagram_key, render_diagram_png
+from padeye.schedule import DEFAULT_CHUNKSIZE, GEOMETRY_COLUMNS, iter_schedule_chunks, evaluate_schedule
+from padeye.svg import render_diagram_svg
+
+REPORT_FORMATS = ("zip", "xlsx")
+DIAGRAM_FORMATS = ("png", "svg")
+# Rows between diagrams on the "Diagrams" sheet, enough for a half-size image
+_DIAGRAM_ROWS = 12
+
+
+def report_format(output, explicit=None):
+    """"zip" or "xlsx" for an output path or file, from ``explicit`` or the name's suffix."""
+    if explicit:
+        if explicit not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format '{explicit}'")
+        return explicit
+    return "zip" if str(getattr(output, "name", output)).lower().endswith(".zip") else "xlsx"
+
+
+def _safe_name(text):
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", text).strip("_") or "padeye"
+
+
+def _fmt(value, unit=""):
+    if isinstance(value, (bool, np.bool_)):
+        return "PASS" if value else "FAIL"
+    if isinstance(value, (float, np.floating)):
+        return "—" if np.isnan(value) else f"{value:,.2f}{unit}"
+    return html.escape(str(value))
+
+
+def _render_svg(key):
+    return render_diagram_svg(key).encode()
+
+
+def _sheet_html(padeye, row, diagram, ext):
+    """One pad-eye's calculation sheet as a standalone HTML page."""
+    def table(rows):
+        cells = "".join(f"<tr><th>{html.escape(label)}</th><td>{value}</td></tr>" for label, value in rows)
+        return f"<table>{cells}</table>"
+
+    checks = "".join(
+        f"<tr><td>{name}</td><td>{_fmt(row[f'{name} Actual'])}</td><td>{_fmt(row[f'{name} Allowable'])}</td>"
+        f"<td class='{'ok' if row[f'{name} Passed'] else 'fail'}'>{_fmt(row[f'{name} Passed'])}</td></tr>"
+        for name in CHECK_NAMES)
+    image = (f"<img src='../diagrams/{diagram}.{ext}' alt='Pad-eye schematic' width='500'>"
+             if diagram else "<p>No schematic: no adequate shackle.</p>")
+    status = "ALL DESIGN CHECKS PASSED" if row["All Passed"] else "DESIGN CHECKS FAILED"
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Pad-Eye {html.escape(padeye)}</title>
+<style>body{{font-family:sans-serif}} th,td{{padding:2px 10px;text-align:left}}
+.ok{{color:green}} .fail{{color:#b00}}</style></head><body>
+<h1>Pad-Eye {html.escape(padeye)}</h1>
+<h2>Loading Inputs</h2>
+{table([("Static sling load Ps", _fmt(row["Ps"], " kN")), ("DAF", _fmt(row["DAF"])),
+        ("θ", _fmt(row["theta"], "°")), ("φ", _fmt(row["phi"], "°")), ("fop", _fmt(row["fop"], " %"))])}
+<h2>Shackle and Pad-Eye</h2>
+{table([("Shackle", _fmt(row["Shackle"]) + (" (auto-selected)" if row["Auto-Selected"] else "")),
+        ("SWL", _fmt(row["Psh"], " kN")), ("fy", _fmt(row["fy"], " MPa")), ("twc", _fmt(row["twc"], " mm")),
+        *((f"{label}", _fmt(row[label], " mm")) for label in GEOMETRY_COLUMNS.values())])}
+<h2>Design Loads</h2>
+{table([(name, _fmt(row[name], " kN")) for name in ("P", "Pv", "Ph", "Po")])}
+<h2>Design Checks</h2>
+<table><tr><th>Check</th><th>Actual</th><th>Allowable</th><th>Status</th></tr>{checks}</table>
+{table([("Shackle SWL", _fmt(row["Shackle OK"])), ("Inside length clearance", _fmt(row["Clearance OK"])),
+        ("Shackle spread", _fmt(row["Spread %"], " %") + " " + _fmt(row["Spread OK"]))])}
+<h2 class="{'ok' if row["All Passed"] else 'fail'}">{status}</h2>
+{image}
+</body></html>
+"""
+
+
+class _DiagramPool:
+    """Renders each distinct diagram key once, in worker processes when ``workers`` > 1."""
+
+    def __init__(self, workers, render=render_diagram_png):
+        self._render = render
+        self._pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        self.ids = {}       # diagram key -> id
+        self.keys = {}      # id -> diagram key
+        self.uses = {}      # id -> number of pad-eyes
+        self._pending = {}  # id -> future or None (render inline)
+
+    def id_for(self, key):
+        diagram = self.ids.get(key)
+        if diagram is None:
+            diagram = self.ids[key] = f"diagram_{len(self.ids) + 1:04d}"
+            self.keys[diagram] = key
+            self.uses[diagram] = 0
+            self._pending[diagram] = self._pool.submit(self._render, key) if self._pool else None
+        self.uses[diagram] += 1
+        return diagram
+
+    def finished(self, wait=False):
+        """Yield (id, png) for rendered diagrams, all of them if ``wait``, and forget them."""
+        for diagram, future in list(self._pending.items()):
+            if future is None:
+                png = self._render(self.keys[diagram]) if wait else None
+            elif wait or future.done():
+                png = future.result()
+            else:
+                png = None
+            if png is not None:
+                del self._pending[diagram]
+                yield diagram, png
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+
+def run_report(source, output, fmt=None, chunksize=DEFAULT_CHUNKSIZE, filename=None, workers=None,
+               diagram_format="png", progress=None):
+    """Write calculation reports for every pad-eye of a schedule to ``output``.
+
+    ``output`` is a path or writable binary file; ``fmt`` is "zip" or
+    "xlsx" (default: from the output name, else xlsx). ``workers`` is the
+    size of the diagram rendering pool (default: CPU count; 1 renders in
+    this process). ``diagram_format`` "svg" is only available for zip
+    reports; SVG drawings are cheap enough to build in this process.
+    ``progress``, if given, is called with the running row
+    count. Returns a stats dict with "rows", "failed", "diagrams" (distinct
+    schematics rendered), "diagrams_reused" and "seconds".
+    """
+    fmt = report_format(output, fmt)
+    if diagram_format not in DIAGRAM_FORMATS:
+        raise ValueError(f"Unknown diagram format '{diagram_format}'")
+    if diagram_format == "svg" and fmt != "zip":
+        raise ValueError("SVG diagrams are only available in zip reports")
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    if diagram_format == "svg":
+        diagrams = _DiagramPool(1, _render_svg)
+    else:
+        diagrams = _DiagramPool(workers)
+    # PNGs are already compressed; store them as they are
+    compress = zipfile.ZIP_STORED if diagram_format == "png" else None
+    rows = failed = 0
+    try:
+        if fmt == "zip":
+            archive = zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED)
+        else:
+            wb = Workbook(write_only=True)
+            summary = wb.create_sheet("Summary")
+            images = {}
+
+        for chunk in iter_schedule_chunks(source, chunksize, filename):
+            results = evaluate_schedule(chunk, geometry=True)
+            found = (results["Shackle"] != "").to_numpy()
+            ids = np.full(len(results), None, dtype=object)
+            # Rows of a chunk sharing a geometry are keyed once
+            geometry = results.loc[found, ["R", "dh", "r", "t", "l", "T"]].to_numpy()
+            unique, inverse = np.unique(geometry, axis=0, return_inverse=True)
+            keys = [diagram_key(*g) for g in unique.tolist()]
+            ids[found] = [diagrams.id_for(keys[k]) for k in inverse.ravel()]
+            results["Diagram"] = ids
+            if "Pad-Eye" not in results.columns:
+                results.insert(0, "Pad-Eye", [f"PE-{rows + i + 1:05d}" for i in range(len(results))])
+
+            if fmt == "zip":
+                for i, row in enumerate(results.to_dict("records")):
+                    name = f"reports/{rows + i + 1:05d}_{_safe_name(str(row['Pad-Eye']))}.html"
+                    archive.writestr(name, _sheet_html(str(row["Pad-Eye"]), row, row["Diagram"], diagram_format))
+            else:
+                if rows == 0:
+                    summary.append(list(results.columns))
+                cells = results.astype(object).where(results.notna(), None)
+                for row in cells.itertuples(index=False, name=None):
+                    summary.append(row)
+                images.update(diagrams.finished())
+
+            rows += len(results)
+            failed += int(np.count_nonzero(~results["All Passed"].to_numpy()))
+            if progress is not None:
+                progress(rows)
+
+        if fmt == "zip":
+            # Diagrams go last, in id order, so the archive does not depend on which render finished first
+            for diagram, png in sorted(diagrams.finished(wait=True)):
+                archive.writestr(f"diagrams/{diagram}.{diagram_format}", png, compress_type=compress)
+            archive.close()
+        else:
+            images.update(diagrams.finished(wait=True))
+            sheet = wb.create_sheet("Diagrams")
+            sheet.append(["Diagram", "Pad-Eyes", "R", "dh", "r", "t", "l", "T"])
+            for n, (diagram, key) in enumerate(diagrams.keys.items()):
+                sheet.append([diagram, diagrams.uses[diagram], *key])
+                image = XLImage(io.BytesIO(images[diagram]))
+                image.width, image.height = image.width // 2, image.height // 2
+                image.anchor = f"J{2 + n * _DIAGRAM_ROWS}"
+                sheet.add_image(image)
+                for _ in range(_DIAGRAM_ROWS - 1):
+                    sheet.append([])
+            wb.save(output)
+    finally:
+        diagrams.close()
+
+    unique = len(diagrams.keys)
+    return {
+        "rows": rows,
+        "failed": failed,
+        "diagrams": unique,
+        "diagrams_reused": sum(diagrams.uses.values()) - unique,
+        "seconds": time.perf_counter() - start,
+    }
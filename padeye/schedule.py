@@ -0,0 +1,217 @@
+"""Streaming lift-schedule ingestion and results workbook export.
+
+A schedule has one row per pad-eye with the columns in ``SCHEDULE_COLUMNS``
+(an optional ``padeye`` column is carried through as an identifier). A
+``shackle`` cell holding just a series name (e.g. ``G2130``) asks for the
+smallest adequate shackle of that series to be selected automatically. Files
+are read in chunks, each chunk is checked with the vectorized engine and the
+results are appended to a write-only workbook, so memory stays flat however
+long the schedule is. A blank required cell or a cell that is not a number
+stops the run with the offending row numbers rather than being read as 0.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+
+from padeye.core import INPUT_FIELDS
+from padeye.engine import (
+    CHECK_NAMES, SHACKLE_KEYS, derive_geometry, design_loads, shackle_compatibility,
+    shackle_dimensions, checks_from_geometry,
+)
+from padeye.selection import SHACKLE_SERIES, select_shackle_indices
+
+SCHEDULE_COLUMNS = INPUT_FIELDS
+REQUIRED_COLUMNS = ("Ps", "DAF", "theta", "phi", "shackle", "fy")
+ID_COLUMN = "padeye"
+# derive_geometry names and the result columns they are reported under
+GEOMETRY_COLUMNS = {"dh": "dh", "R": "R", "r_val": "r", "T": "T", "t_val": "t", "l_val": "l", "e_val": "e"}
+DEFAULT_CHUNKSIZE = 10_000
+
+_CANONICAL = {name.lower(): name for name in SCHEDULE_COLUMNS + (ID_COLUMN,)}
+
+
+def _normalise_columns(df):
+    df = df.rename(columns=lambda c: _CANONICAL.get(str(c).strip().lower(), c))
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Schedule is missing required column(s): {', '.join(missing)}")
+    for name in SCHEDULE_COLUMNS:
+        if name not in df.columns:
+            df[name] = 0.0
+    return df
+
+
+def _is_excel(name):
+    return str(name).lower().endswith((".xlsx", ".xlsm"))
+
+
+def _iter_excel(source, chunksize):
+    wb = load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        header = [str(h) if h is not None else "" for h in header]
+        # Index rows from 0 at sheet row 2, as read_csv does, so errors can name the row
+        batch, index = [], []
+        for number, row in enumerate(rows):
+            if all(v is None for v in row):
+                continue
+            batch.append(row)
+            index.append(number)
+            if len(batch) == chunksize:
+                yield pd.DataFrame(batch, columns=header, index=index)
+                batch, index = [], []
+        if batch:
+            yield pd.DataFrame(batch, columns=header, index=index)
+    finally:
+        wb.close()
+
+
+def iter_schedule_chunks(source, chunksize=DEFAULT_CHUNKSIZE, filename=None):
+    """Yield normalised DataFrame chunks from a CSV or Excel schedule.
+
+    ``source`` may be a path or a file-like object; ``filename`` decides the
+    format when ``source`` has no usable name (e.g. an upload buffer).
+    """
+    name = filename or getattr(source, "name", source)
+    if _is_excel(name):
+        chunks = _iter_excel(source, chunksize)
+    else:
+        chunks = pd.read_csv(source, chunksize=chunksize, skipinitialspace=True)
+    for chunk in chunks:
+        yield _normalise_columns(chunk)
+
+
+def _bad_rows(df, mask):
+    # Index 0 is the first row under the header, i.e. line/sheet row 2
+    rows = [str(i + 2) for i in df.index[mask][:5]]
+    more = int(mask.sum()) - len(rows)
+    return ", ".join(rows) + (f" and {more} more" if more > 0 else "")
+
+
+def _numeric_inputs(df):
+    """Numeric schedule columns as float arrays; blank optional cells read as 0.
+
+    A blank required cell, or any cell that is not a number, raises
+    ValueError naming the rows, so bad input can never read as a passing
+    design.
+    """
+    num = {}
+    for c in SCHEDULE_COLUMNS:
+        if c == "shackle":
+            continue
+        raw = df[c]
+        values = pd.to_numeric(raw, errors="coerce")
+        invalid = values.isna().to_numpy()
+        if invalid.any() and c not in REQUIRED_COLUMNS:
+            # Blank optional cells default to 0, like a missing optional column
+            invalid = invalid & ~(raw.isna() | raw.astype(str).str.strip().eq("")).to_numpy()
+        if invalid.any():
+            raise ValueError(f"Schedule row(s) {_bad_rows(df, invalid)}: {c} is missing or not a number")
+        num[c] = values.fillna(0.0).to_numpy(dtype=float)
+    return num
+
+
+def evaluate_schedule(df, geometry=False):
+    """Run the design checks for a schedule chunk and return a results DataFrame.
+
+    With ``geometry`` the pad-eye dimensions are included as the
+    ``GEOMETRY_COLUMNS`` (NaN where no adequate shackle was found). Raises
+    ValueError for a missing or non-numeric input cell and for an
+    unknown shackle type.
+    """
+    num = _numeric_inputs(df)
+    keys = df["shackle"].astype(str).str.strip()
+    blank = (df["shackle"].isna() | keys.eq("")).to_numpy()
+    if blank.any():
+        raise ValueError(f"Schedule row(s) {_bad_rows(df, blank)}: missing shackle")
+    keys = keys.to_numpy(dtype=object)
+    auto = np.isin(keys, SHACKLE_SERIES)
+    if auto.any():
+        picked = select_shackle_indices(num["Ps"][auto], num["dr"][auto], num["min_spread"][auto], keys[auto])
+        keys[auto] = [SHACKLE_KEYS[i] if i >= 0 else "" for i in picked]
+    found = keys != ""
+    try:
+        Psh, A, B, C = (np.full(len(keys), np.nan) for _ in range(4))
+        Psh[found], A[found], B[found], C[found] = shackle_dimensions(keys[found])
+    except KeyError as e:
+        raise ValueError(f"Unknown shackle type in schedule: {e.args[0]}") from None
+
+    geom = derive_geometry(A, B, C)
+    loads = design_loads(num["Ps"], num["DAF"], num["theta"], num["phi"], num["fop"])
+    result = checks_from_geometry(geom, loads, B, num["fy"], num["twc"])
+    compat = shackle_compatibility(A, C, geom, num["dr"], num["min_spread"])
+
+    out = {}
+    if ID_COLUMN in df.columns:
+        out["Pad-Eye"] = df[ID_COLUMN].astype(str).to_numpy()
+    out["Shackle"] = keys
+    out["Auto-Selected"] = auto
+    for c in SCHEDULE_COLUMNS:
+        if c != "shackle":
+            out[c] = num[c]
+    out["Psh"] = Psh
+    if geometry:
+        for name, column in GEOMETRY_COLUMNS.items():
+            out[column] = geom[name]
+    out["Shackle OK"] = num["Ps"] <= Psh
+    for name in ("P", "Pv", "Ph", "Po"):
+        out[name] = result[name]
+    for name in CHECK_NAMES:
+        check = result["checks"][name]
+        out[f"{name} Actual"] = check["actual"]
+        out[f"{name} Allowable"] = check["allowable"]
+        out[f"{name} Passed"] = check["passed"]
+    out["Inside Length"] = compat["actual_inside_length"]
+    out["Min Inside Length"] = compat["min_inside_length_required"]
+    out["Clearance OK"] = compat["clearance_ok"]
+    out["Spread %"] = compat["actual_shackle_spread_pct"]
+    out["Spread OK"] = compat["spread_ok"]
+    out["All Passed"] = result["all_passed"] & out["Shackle OK"] & out["Clearance OK"] & out["Spread OK"] & found
+    return pd.DataFrame(out)
+
+
+def run_schedule(source, output, chunksize=DEFAULT_CHUNKSIZE, filename=None, progress=None):
+    """Check a whole schedule and stream the results to ``output``.
+
+    ``output`` is a path or writable binary file. Results go to a write-only
+    .xlsx workbook unless ``output`` is named ``*.csv``, which is several
+    times faster for very large schedules. ``progress``, if given, is called
+    with the running row count after each chunk. Returns a stats dict with
+    "rows", "failed", "seconds" and "rows_per_sec".
+    """
+    start = time.perf_counter()
+    to_csv = str(getattr(output, "name", output)).lower().endswith(".csv")
+    if not to_csv:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Results")
+    rows = failed = 0
+    for chunk in iter_schedule_chunks(source, chunksize, filename):
+        results = evaluate_schedule(chunk)
+        if to_csv:
+            results.to_csv(output, mode="w" if rows == 0 else "a", header=rows == 0, index=False)
+        else:
+            if rows == 0:
+                ws.append(list(results.columns))
+            # Blank cells rather than NaN, which Excel rejects
+            cells = results.astype(object).where(results.notna(), None)
+            for row in cells.itertuples(index=False, name=None):
+                ws.append(row)
+        rows += len(results)
+        failed += int(np.count_nonzero(~results["All Passed"].to_numpy()))
+        if progress is not None:
+            progress(rows)
+    if not to_csv:
+        wb.save(output)
+    seconds = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "failed": failed,
+        "seconds": seconds,
+        "rows_per_sec": rows / seconds if seconds > 0 else float("inf"),
+    }
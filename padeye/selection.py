@@ -0,0 +1,106 @@
+"""Automatic shackle selection from sorted per-series indexes.
+
+Each series (G209/G213/G2130/G2140) is indexed once, sorted on SWL and then
+pin diameter. A selection binary-searches the SWL column for the lightest
+shackle that carries the static sling load and the prefix-maximum inside
+length for the first one that clears 1.5 x the rope diameter; only the rare
+rows whose candidate then misses the spread requirement step forward. A
+whole schedule therefore costs O(n log m) instead of a scan per row.
+"""
+
+import numpy as np
+
+from padeye.core import inside_length_ok, min_inside_length
+from padeye.data import CONVERSION_FACTOR, SHACKLE_SERIES
+from padeye.engine import (
+    SHACKLE_KEYS, SHACKLE_SWL, SHACKLE_JAW_WIDTH, SHACKLE_PIN_DIAMETER,
+    SHACKLE_INSIDE_LENGTH, derive_geometry, evaluate_checks,
+)
+
+
+def shackle_series(key):
+    """Series prefix of a ``shackle_data`` key, e.g. "G2130" for "G2130 - 12T"."""
+    return key.split(" - ")[0].strip()
+
+
+def _build_index(series):
+    members = np.array([i for i, k in enumerate(SHACKLE_KEYS) if shackle_series(k) == series], dtype=np.intp)
+    order = np.lexsort((SHACKLE_PIN_DIAMETER[members], SHACKLE_SWL[members]))
+    members = members[order]
+    geom = derive_geometry(SHACKLE_JAW_WIDTH[members], SHACKLE_PIN_DIAMETER[members],
+                           SHACKLE_INSIDE_LENGTH[members])
+    jaw = SHACKLE_JAW_WIDTH[members]
+    return {
+        "members": members,
+        "capacity": SHACKLE_SWL[members] * CONVERSION_FACTOR,
+        # Inside length is not monotonic in SWL (e.g. G2130 120T vs 150T), but
+        # its running maximum is, and first exceeds a threshold exactly where
+        # the raw column does.
+        "inside_max": np.maximum.accumulate(SHACKLE_INSIDE_LENGTH[members]),
+        "inside": SHACKLE_INSIDE_LENGTH[members],
+        "spread_pct": (geom["T"] + 2*geom["t_val"]) / jaw * 100,
+    }
+
+
+SERIES_INDEX = {series: _build_index(series) for series in SHACKLE_SERIES}
+
+
+def _select_in_series(index, Ps, dr, min_spread):
+    m = len(index["members"])
+    pos = np.maximum(np.searchsorted(index["capacity"], Ps, side="left"),
+                     np.searchsorted(index["inside_max"], min_inside_length(dr), side="left"))
+    pending = pos < m
+    while pending.any():
+        rows = np.flatnonzero(pending)
+        cand = pos[rows]
+        ok = ((index["capacity"][cand] >= Ps[rows])
+              & inside_length_ok(index["inside"][cand], dr[rows])
+              & (index["spread_pct"][cand] >= min_spread[rows]))
+        pending[rows[ok]] = False
+        step = rows[~ok]
+        pos[step] += 1
+        pending[step[pos[step] >= m]] = False
+    return np.where(pos < m, index["members"][np.minimum(pos, m - 1)], -1)
+
+
+def select_shackle_indices(Ps, dr=0.0, min_spread=0.0, series="G2130"):
+    """Positions in ``SHACKLE_KEYS`` of the smallest adequate shackle for each load case.
+
+    The chosen shackle has SWL >= Ps (kN), passes ``core.inside_length_ok`` and
+    a pad-eye spread of at least ``min_spread`` percent. ``series`` may be a
+    single series name or one per row. Rows with no adequate shackle get -1.
+    """
+    Ps, dr, min_spread = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (Ps, dr, min_spread)))
+    Ps, dr, min_spread = (np.ravel(v) for v in (Ps, dr, min_spread))
+    series = np.broadcast_to(np.asarray(series, dtype=object), Ps.shape)
+    chosen = np.full(Ps.shape, -1, dtype=np.intp)
+    for name in np.unique(series):
+        if name not in SERIES_INDEX:
+            raise ValueError(f"Unknown shackle series: {name}")
+        rows = series == name
+        chosen[rows] = _select_in_series(SERIES_INDEX[name], Ps[rows], dr[rows], min_spread[rows])
+    return chosen
+
+
+def select_shackles(Ps, dr=0.0, min_spread=0.0, series="G2130"):
+    """Like ``select_shackle_indices`` but returns shackle keys (None where nothing fits)."""
+    return [SHACKLE_KEYS[i] if i >= 0 else None for i in select_shackle_indices(Ps, dr, min_spread, series)]
+
+
+def auto_select_and_check(Ps, DAF, theta, phi, fop, fy, twc, dr=0.0, min_spread=0.0, series="G2130"):
+    """Select a shackle per load case and run the pad-eye checks on it.
+
+    Returns ``(indices, result)`` where ``indices`` are positions in
+    ``SHACKLE_KEYS`` (-1 where nothing fits) and ``result`` is the
+    ``evaluate_checks`` dict for the selected shackles; rows without a
+    shackle evaluate to NaN stresses and never count as "all_passed".
+    """
+    idx = select_shackle_indices(Ps, dr, min_spread, series)
+    found = idx >= 0
+    take = np.where(found, idx, 0)
+    A = np.where(found, SHACKLE_JAW_WIDTH[take], np.nan)
+    B = np.where(found, SHACKLE_PIN_DIAMETER[take], np.nan)
+    C = np.where(found, SHACKLE_INSIDE_LENGTH[take], np.nan)
+    result = evaluate_checks(Ps, DAF, theta, phi, fop, A, B, C, fy, twc)
+    result["all_passed"] = result["all_passed"] & found
+    return idx, result
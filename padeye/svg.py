@@ -0,0 +1,58 @@
+"""Pad-eye schematic as SVG.
+
+Draws the same elements as ``padeye.diagram`` (main plate, hole, cheek
+plates, base plate and dimension labels) but in millimetre coordinates
+with a ``viewBox`` fitted to the geometry, so large shackles never overflow
+the frame and the browser scales the drawing to any size. Standard library
+only; a drawing is about 1 KB of text and takes tens of microseconds to
+build, which suits batch reports.
+"""
+
+SVG_SIZE = (500, 400)  # Nominal size in pixels, as the PNG; the viewBox scales to fit
+_FONT_FRACTION = 0.05  # label size relative to the larger drawing extent
+
+
+def _num(value):
+    return f"{value:.3f}".rstrip("0").rstrip(".")
+
+
+def diagram_svg(R, dh, r_val, t_val, l_val, T):
+    """The pad-eye schematic as an SVG document string."""
+    half_width = max(R + t_val, l_val / 2, R)
+    top = -max(R, r_val)
+    bottom = R + T
+    font = _FONT_FRACTION * max(2 * half_width, bottom - top)
+    margin = 2 * font
+    x0, y0 = -half_width - margin, top - margin
+    width, height = 2 * (half_width + margin), bottom - top + 2 * margin
+    n = _num
+
+    # Keep line widths in screen pixels whatever the scale
+    fixed = 'vector-effect="non-scaling-stroke"'
+    # Radius dimension line at 45° up and to the right
+    rx, ry = R * 0.7071, -R * 0.7071
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{SVG_SIZE[0]}" height="{SVG_SIZE[1]}" '
+        f'viewBox="{n(x0)} {n(y0)} {n(width)} {n(height)}" font-family="sans-serif" font-size="{n(font)}">'
+        '<title>Pad-Eye Schematic</title>'
+        f'<rect x="{n(-l_val / 2)}" y="{n(R)}" width="{n(l_val)}" height="{n(T)}" '
+        f'fill="lightgray" stroke="black" {fixed}/>'
+        f'<circle r="{n(R)}" fill="none" stroke="black" stroke-width="2" {fixed}/>'
+        f'<circle r="{n(dh / 2)}" fill="gray" stroke="black" {fixed}/>'
+        f'<rect x="{n(-R - t_val)}" y="{n(-r_val)}" width="{n(t_val)}" height="{n(2 * r_val)}" '
+        f'fill="none" stroke="blue" stroke-width="2" {fixed}/>'
+        f'<rect x="{n(R)}" y="{n(-r_val)}" width="{n(t_val)}" height="{n(2 * r_val)}" '
+        f'fill="none" stroke="blue" stroke-width="2" {fixed}/>'
+        f'<line x2="{n(rx)}" y2="{n(ry)}" stroke="black" {fixed}/>'
+        '<g text-anchor="middle">'
+        f'<text x="{n(rx)}" y="{n(ry - font * 0.4)}">R: {n(R)}</text>'
+        f'<text y="{n(dh / 2 + font * 1.2)}">dh: {n(dh)}</text>'
+        f'<text x="{n(-R - t_val / 2)}" y="{n(-r_val - font * 0.4)}">t: {n(t_val)}</text>'
+        f'<text y="{n(bottom + font * 1.2)}">l: {n(l_val)}</text>'
+        '</g></svg>'
+    )
+
+
+def render_diagram_svg(key):
+    """SVG text of the schematic for a ``padeye.diagram.diagram_key`` tuple."""
+    return diagram_svg(*key)
@@ -0,0 +1,97 @@
+"""Lightweight per-stage timing of a script run.
+
+``StageTimer.section`` starts a named top-level stage, closing the previous
+one, which suits the page's straight-line sections; ``StageTimer.stage`` is a
+context manager for timing a block nested inside the current section. When
+the timer is disabled both return immediately (``stage`` hands back a shared
+no-op context manager), so instrumented code costs under a microsecond
+per stage. ``trace`` and ``export`` turn one run into a JSON-lines record.
+"""
+
+import contextlib
+import json
+import time
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+class _Stage:
+    __slots__ = ("timer", "name", "index", "start")
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        timer = self.timer
+        self.index = timer._open(self.name, (timer._section is not None) + timer._nesting)
+        timer._nesting += 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timer.stages[self.index]["ms"] = (time.perf_counter() - self.start) * 1e3
+        self.timer._nesting -= 1
+        return False
+
+
+class StageTimer:
+    """Collects {"name", "ms", "depth"} records for the stages of one run."""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.stages = []
+        self._section = None
+        self._nesting = 0
+        self._started = time.perf_counter()
+        self._total = None
+
+    def _open(self, name, depth):
+        self.stages.append({"name": name, "ms": 0.0, "depth": depth})
+        return len(self.stages) - 1
+
+    def _close_section(self, now):
+        if self._section is not None:
+            index, start = self._section
+            self.stages[index]["ms"] = (now - start) * 1e3
+            self._section = None
+
+    def section(self, name):
+        """End the current top-level stage, if any, and start ``name``."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._close_section(now)
+        self._section = (self._open(name, 0), now)
+
+    def stage(self, name):
+        """Context manager timing a block; nested under the current section."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def finish(self):
+        """Close the last section and fix the run's total time."""
+        if not self.enabled or self._total is not None:
+            return
+        now = time.perf_counter()
+        self._close_section(now)
+        self._total = (now - self._started) * 1e3
+
+    @property
+    def total_ms(self):
+        if self._total is None:
+            return (time.perf_counter() - self._started) * 1e3
+        return self._total
+
+    def trace(self, **fields):
+        """One run as a JSON-serializable dict: timestamp, total, stages and ``fields``."""
+        self.finish()
+        return dict(fields, ts=time.time(), total_ms=round(self.total_ms, 3),
+                    stages=[dict(stage, ms=round(stage["ms"], 3)) for stage in self.stages])
+
+    def export(self, path, **fields):
+        """Append the run's ``trace`` to ``path`` as one JSON line."""
+        line = json.dumps(self.trace(**fields), ensure_ascii=False) + "\n"
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line)
@@ -0,0 +1,30 @@
+"""Command-line input errors exit with status 2 and a message, not a traceback."""
+
+import io
+
+import pytest
+
+from padeye.cli import main
+
+
+@pytest.mark.parametrize("text", ["[1]", "1", '[{"Ps": 1}]', "{"])
+def test_bad_json_input_exits_2(monkeypatch, capsys, text):
+    monkeypatch.setattr("sys.stdin", io.StringIO(text))
+    with pytest.raises(SystemExit) as exc:
+        main([])
+    assert exc.value.code == 2
+    assert "error:" in capsys.readouterr().err
+
+
+def test_single_design_round_trip(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO(
+        '{"Ps": 100, "DAF": 1.3, "theta": 60, "phi": 5, "shackle": "G2140 - 12.5T", "fy": 355}'))
+    assert main([]) == 0
+    assert '"all_passed"' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("extra, code", [("", 0), (', "dr": 200', 1), (', "min_spread": 150', 1)])
+def test_strict_fails_on_clearance_and_spread(monkeypatch, capsys, extra, code):
+    monkeypatch.setattr("sys.stdin", io.StringIO(
+        '{"Ps": 15, "DAF": 1.3, "theta": 60, "phi": 5, "shackle": "G2130 - 2T", "fy": 355, "twc": 6' + extra + "}"))
+    assert main(["--strict"]) == code
@@ -0,0 +1,66 @@
+"""The vectorized engine must reproduce the scalar ``padeye.core`` results.
+
+Loads and stresses may differ by rounding where NumPy's sin/cos are not
+libm's (SIMD builds), so they are compared within a few ulps; the pass/fail
+verdicts must match exactly.
+"""
+
+import numpy as np
+import pytest
+
+from padeye.core import CHECK_NAMES, check_design
+from padeye.data import shackle_data
+from padeye.engine import evaluate_checks, shackle_dimensions
+
+LOADS = ("P", "Pv", "Ph", "Po", "max_force")
+# Relative tolerance for loads (one sin/cos ulp) and the stresses derived from them
+RTOL = 8 * np.finfo(float).eps
+
+
+def close(a, b):
+    return a == b or abs(a - b) <= RTOL * max(abs(a), abs(b))
+
+
+def random_cases(n, seed):
+    rng = np.random.default_rng(seed)
+    keys = np.array(list(shackle_data), dtype=object)
+    return {
+        "Ps": rng.uniform(0.0, 5000.0, n),
+        "DAF": rng.uniform(1.0, 2.0, n),
+        "theta": rng.uniform(0.0, 90.0, n),
+        "phi": rng.uniform(0.0, 90.0, n),
+        "fop": rng.uniform(0.0, 10.0, n),
+        "shackle": keys[rng.integers(0, len(keys), n)],
+        "fy": rng.uniform(235.0, 460.0, n),
+        "twc": rng.choice([0.0, 4.0, 6.0, 8.5, 12.0], n),
+    }
+
+
+def assert_engine_matches_core(cases):
+    _, A, B, C = shackle_dimensions(cases["shackle"])
+    result = evaluate_checks(cases["Ps"], cases["DAF"], cases["theta"], cases["phi"], cases["fop"],
+                             A, B, C, cases["fy"], cases["twc"])
+    for i in range(len(cases["Ps"])):
+        scalar = check_design(**{name: values[i] for name, values in cases.items()})
+        for name in LOADS:
+            assert close(result[name][i], scalar["loads"][name]), (i, name)
+        for name in CHECK_NAMES:
+            check, expected = result["checks"][name], scalar["safety_checks"][name]
+            assert check["passed"][i] == expected["passed"], (i, name)
+            for field in ("allowable", "actual"):
+                assert close(check[field][i], expected[field]), (i, name, field)
+        assert result["all_passed"][i] == scalar["all_passed"], i
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_random_cases_match(seed):
+    assert_engine_matches_core(random_cases(5000, seed))
+
+
+def test_boundary_angles_and_no_weld():
+    cases = random_cases(8, 2)
+    cases["theta"] = np.array([0.0, 90.0, 0.0, 90.0, 45.0, 30.0, 60.0, 90.0])
+    cases["phi"] = np.array([0.0, 0.0, 90.0, 90.0, 0.0, 45.0, 90.0, 45.0])
+    cases["twc"] = np.zeros(8)
+    cases["fop"][::2] = 0.0
+    assert_engine_matches_core(cases)
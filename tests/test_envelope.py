@@ -0,0 +1,43 @@
+"""Capacity envelope queries must never return a load that fails the exact checks."""
+
+import numpy as np
+import pytest
+
+from padeye.core import check_design
+from padeye.data import shackle_data
+from padeye.envelope import build_envelope
+
+
+@pytest.mark.parametrize("fop", [0.0, 5.0])
+def test_max_static_load_passes_check_design(tmp_path, fop):
+    envelope = build_envelope(tmp_path / "envelope.bin", fop=fop)
+    rng = np.random.default_rng(0)
+    keys = list(shackle_data)
+    for _ in range(2000):
+        shackle = keys[rng.integers(len(keys))]
+        fy = float(rng.uniform(100.0, 700.0))
+        theta, phi = (float(v) for v in rng.uniform(0.0, 90.0, 2))
+        DAF, twc = float(rng.uniform(1.0, 2.0)), float(rng.choice([0.0, 4.0, 6.0, 8.5]))
+        max_Ps, _, _ = envelope.max_static_load(shackle, fy, theta, phi, DAF, twc)
+        result = check_design(max_Ps, DAF, theta, phi, fop, shackle, fy, twc)
+        assert result["all_passed"] and result["shackle_ok"], (shackle, fy, theta, phi, DAF, twc)
+
+
+def test_array_queries_match_scalar_queries(tmp_path):
+    envelope = build_envelope(tmp_path / "envelope.bin")
+    rng = np.random.default_rng(1)
+    keys = np.array(list(shackle_data), dtype=object)[rng.integers(len(shackle_data), size=50)]
+    theta, phi = rng.uniform(0.0, 90.0, 50), rng.uniform(0.0, 90.0, 50)
+    theta[:2] = 90.0
+    caps = envelope.capacities(list(keys), 420.0, theta, phi, 6.0)
+    for k, (shackle, t, p) in enumerate(zip(keys, theta, phi)):
+        scalar = envelope.capacities(shackle, 420.0, float(t), float(p), 6.0)
+        assert all(caps[name][k] == value for name, value in scalar.items())
+
+
+@pytest.mark.parametrize("DAF", [0.0, -1.0, np.array([1.3, 0.0])])
+def test_non_positive_daf_is_rejected_for_scalars_and_arrays(tmp_path, DAF):
+    envelope = build_envelope(tmp_path / "envelope.bin", theta_step=15.0, phi_step=15.0)
+    shackle = "G2130 - 2T" if np.ndim(DAF) == 0 else ["G2130 - 2T"] * 2
+    with pytest.raises(ValueError, match="DAF"):
+        envelope.max_static_load(shackle, 355.0, 60.0, 5.0, DAF)
@@ -0,0 +1,55 @@
+"""The incremental design graph must agree with ``check_design`` after any sequence of edits."""
+
+import random
+
+from padeye.core import check_design
+from padeye.data import shackle_data
+from padeye.graph import DesignGraph
+
+
+def random_value(rng, field):
+    if field == "shackle":
+        return rng.choice(list(shackle_data))
+    if field in ("theta", "phi"):
+        return rng.choice([0.0, 45.0, 90.0, round(rng.uniform(0.0, 90.0), 1)])
+    if field == "twc":
+        return rng.choice([0.0, 6.0, round(rng.uniform(0.0, 12.0), 1)])
+    return round(rng.uniform(0.0, 2000.0 if field == "Ps" else 10.0 if field != "fy" else 460.0), 2)
+
+
+def test_random_edits_match_check_design():
+    rng = random.Random(0)
+    fields = ("Ps", "DAF", "theta", "phi", "fop", "shackle", "fy", "twc", "dr", "min_spread")
+    design = {field: random_value(rng, field) for field in fields}
+    graph = DesignGraph()
+    graph.set_inputs(**design)
+    for _ in range(2000):
+        field = rng.choice(fields)
+        design[field] = random_value(rng, field)
+        graph.set_inputs(**{field: design[field]})
+        assert graph.result() == check_design(**design), design
+
+
+def design_graph():
+    graph = DesignGraph()
+    graph.set_inputs(Ps=100.0, DAF=1.3, theta=60.0, phi=5.0, fop=0.0, shackle="G2140 - 12.5T",
+                     fy=355.0, twc=6.0, dr=20.0, min_spread=0.0)
+    graph.result()
+    graph.take_report()
+    return graph
+
+
+def test_weld_size_change_reuses_everything_else():
+    graph = design_graph()
+    graph.set_inputs(twc=8.0)
+    graph.result()
+    assert set(graph.take_report()["recomputed"]) == {"tau_wc", "Weld", "all_passed"}
+
+
+def test_yield_strength_change_recomputes_only_allowables_and_verdicts():
+    graph = design_graph()
+    graph.set_inputs(fy=420.0)
+    graph.result()
+    assert set(graph.take_report()["recomputed"]) == {
+        "fby", "fv", "ft", "fte", "allowable_vm",
+        "Bearing", "Pull-Out Shear", "Tear Out", "Tensile", "Pad-Eye Base", "all_passed"}
@@ -0,0 +1,20 @@
+"""COG envelopes always start with the exact nominal lift."""
+
+import numpy as np
+import pytest
+
+from padeye.lift import cog_envelope, solve_lift
+
+
+@pytest.mark.parametrize("steps, positions", [(1, 1), (4, 17), (5, 25), (21, 441)])
+def test_nominal_cog_is_case_zero_at_every_hook_height(steps, positions):
+    cogs, hooks = cog_envelope((0.3, -0.1), (0.5, 0.25), steps, [10.0, 12.0])
+    assert len(cogs) == 2 * positions
+    assert cogs[0].tolist() == [0.3, -0.1] and cogs[positions].tolist() == [0.3, -0.1]
+    assert hooks[0] == 10.0 and hooks[positions] == 12.0
+    assert len(np.unique(cogs[:positions], axis=0)) == positions
+
+
+def test_coincident_two_point_padeyes_are_rejected():
+    with pytest.raises(ValueError, match="degenerate"):
+        solve_lift([[1.0, 2.0, 0.0], [1.0, 2.0, 0.0]], 100.0, (1.0, 2.0), 10.0)
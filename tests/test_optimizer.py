@@ -0,0 +1,16 @@
+"""Optimizer series filtering and search statistics."""
+
+from padeye.optimizer import optimize_padeye
+from padeye.selection import shackle_series
+
+
+def test_single_series_name_is_not_matched_as_substring():
+    result = optimize_padeye(200.0, 1.3, 60.0, 5.0, 5.0, 355.0, series="G2130")
+    assert shackle_series(result["design"]["shackle"]) == "G2130"
+
+
+def test_grid_points_split_into_pruned_and_searched():
+    result = optimize_padeye(200.0, 1.3, 60.0, 5.0, 5.0, 355.0, series=["G213", "G2130"])
+    assert result["pruned"] + result["searched"] == result["grid_size"]
+    assert 0 < result["evaluated"] < result["searched"]
+    assert all(check["passed"] for check in result["safety_checks"].values())
@@ -0,0 +1,23 @@
+"""Bulk reports: geometry from the schedule evaluation and a deterministic zip layout."""
+
+import io
+import zipfile
+
+from padeye.bench import make_cases
+from padeye.report import run_report
+
+
+def write_zip(schedule, workers):
+    buffer = io.BytesIO()
+    run_report(io.StringIO(schedule), buffer, fmt="zip", chunksize=40, workers=workers)
+    with zipfile.ZipFile(buffer) as archive:
+        return [(info.filename, archive.read(info)) for info in archive.infolist()]
+
+
+def test_zip_entries_do_not_depend_on_the_pool():
+    schedule = make_cases(120, seed=3).to_csv(index=False)
+    inline, pooled = write_zip(schedule, 1), write_zip(schedule, 2)
+    assert inline == pooled
+    names = [name for name, _ in inline]
+    diagrams = [name for name in names if name.startswith("diagrams/")]
+    assert names[-len(diagrams):] == sorted(diagrams)
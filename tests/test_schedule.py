@@ -0,0 +1,64 @@
+"""Schedule input validation: bad cells must stop the run, never pass as zero."""
+
+import io
+
+import pytest
+
+from padeye.core import derive_geometry, shackle_properties
+from padeye.schedule import evaluate_schedule, iter_schedule_chunks
+
+HEADER = "padeye,Ps,DAF,theta,phi,shackle,fy,twc\n"
+GOOD = "PE3,50,1.3,60,5,G2130 - 2T,355,6\n"
+
+
+def evaluate(text, chunksize=10_000):
+    return [evaluate_schedule(chunk) for chunk in iter_schedule_chunks(io.StringIO(HEADER + text), chunksize)]
+
+
+@pytest.mark.parametrize("row, column", [
+    ("PE1,abc,1.3,60,5,G2130 - 2T,355,6\n", "Ps"),
+    ("PE1,50,,60,5,G2130 - 2T,355,6\n", "DAF"),
+    ("PE1,50,1.3,60,5,G2130 - 2T,355,x\n", "twc"),
+    ("PE1,50,1.3,60,5,,355,6\n", "shackle"),
+])
+def test_bad_cells_are_rejected_with_row_number(row, column):
+    with pytest.raises(ValueError, match=rf"row\(s\) 3: .*{column}"):
+        evaluate(GOOD + row)
+
+
+def test_row_numbers_continue_across_chunks():
+    with pytest.raises(ValueError, match=r"row\(s\) 5:"):
+        evaluate(GOOD * 3 + "PE9,,1.3,60,5,G2130 - 2T,355,6\n", chunksize=2)
+
+
+def test_blank_optional_cell_defaults_to_zero():
+    (results,) = evaluate("PE1,50,1.3,60,5,G2130 - 2T,355,\n")
+    assert results["twc"].tolist() == [0.0]
+
+
+def test_auto_selected_shackles_pass_clearance():
+    rows = "".join(f"PE{i},{ps},1.3,60,5,G2130,355,6,{dr}\n"
+                   for i, (ps, dr) in enumerate([(10, 0), (50, 20), (100, 60), (300, 120), (5, 0.5)]))
+    chunk = next(iter_schedule_chunks(io.StringIO(HEADER.strip() + ",dr\n" + rows)))
+    results = evaluate_schedule(chunk)
+    assert results["Auto-Selected"].all()
+    assert results["Clearance OK"].all()
+
+
+def test_geometry_columns_match_core():
+    (chunk,) = iter_schedule_chunks(io.StringIO(HEADER + GOOD + "PE4,50,1.3,60,5,G2140 - 12.5T,355,6\n"))
+    results = evaluate_schedule(chunk, geometry=True)
+    for shackle, r, t in zip(results["Shackle"], results["R"], results["t"]):
+        geom = derive_geometry(*shackle_properties(shackle)[1:])
+        assert (r, t) == (geom["R"], geom["t_val"])
+
+
+def test_explicit_shackle_failing_clearance_or_spread_does_not_pass():
+    rows = ("PE1,15,1.3,60,5,G2130 - 2T,355,6,0,0\n"
+            "PE2,15,1.3,60,5,G2130 - 2T,355,6,200,0\n"
+            "PE3,15,1.3,60,5,G2130 - 2T,355,6,0,150\n")
+    (chunk,) = iter_schedule_chunks(io.StringIO(HEADER.strip() + ",dr,min_spread\n" + rows))
+    results = evaluate_schedule(chunk)
+    assert results["Clearance OK"].tolist() == [True, False, True]
+    assert results["Spread OK"].tolist() == [True, True, False]
+    assert results["All Passed"].tolist() == [True, False, False]
@@ -1,104 +1,397 @@
 import streamlit as st
-import math
-from PIL import Image, ImageDraw, ImageFont
-import io
-
-# Constants for calculations
-F_BY_FACTOR = 0.9   # Bearing stress factor
-F_V_FACTOR = 0.4    # Pull-out shear stress factor
-F_T_FACTOR = 0.45   # Tear-out stress factor
-F_TE_FACTOR = 0.6   # Tensile stress factor
-ALLOWABLE_WELD_STRESS = 0.3 * 70 * 6.895  # Approximately 144.8 MPa
-
-shackle_data = {
-    # G213 series (15 entries)
-    "G213 - 1/2T":   {"SWL": 0.50,  "Jaw Width": 11.9,   "Pin Diameter": 7.9,   "Inside Length": 28.7},
-    "G213 - 3/4T":   {"SWL": 0.75,  "Jaw Width": 13.5,   "Pin Diameter": 9.7,   "Inside Length": 31.0},
-    "G213 - 1T":     {"SWL": 1,     "Jaw Width": 16.8,   "Pin Diameter": 11.2,  "Inside Length": 36.6},
-    "G213 - 1-1/2T": {"SWL": 1.50,  "Jaw Width": 19.1,   "Pin Diameter": 12.7,  "Inside Length": 42.9},
-    "G213 - 2T":     {"SWL": 2,     "Jaw Width": 20.6,   "Pin Diameter": 16,    "Inside Length": 47.8},
-    "G213 - 3-1/4T": {"SWL": 3.25,  "Jaw Width": 26.9,   "Pin Diameter": 19.1,  "Inside Length": 60.5},
-    "G213 - 4-3/4T": {"SWL": 4.75,  "Jaw Width": 31.8,   "Pin Diameter": 22.4,  "Inside Length": 71.5},
-    "G213 - 6-1/2T": {"SWL": 6.50,  "Jaw Width": 36.6,   "Pin Diameter": 25.4,  "Inside Length": 84},
-    "G213 - 8-1/2T": {"SWL": 8.50,  "Jaw Width": 42.9,   "Pin Diameter": 28.7,  "Inside Length": 95.5},
-    "G213 - 9-1/2T": {"SWL": 9.50,  "Jaw Width": 46.0,   "Pin Diameter": 31.8,  "Inside Length": 108},
-    "G213 - 12T":    {"SWL": 12,    "Jaw Width": 51.5,   "Pin Diameter": 35.1,  "Inside Length": 119},
-    "G213 - 13-1/2T":{"SWL": 13.50, "Jaw Width": 57,     "Pin Diameter": 38.1,  "Inside Length": 133},
-    "G213 - 17T":    {"SWL": 17,    "Jaw Width": 60.5,   "Pin Diameter": 41.4,  "Inside Length": 146},
-    "G213 - 25T":    {"SWL": 25,    "Jaw Width": 73,     "Pin Diameter": 51,    "Inside Length": 178},
-    "G213 - 35T":    {"SWL": 35,    "Jaw Width": 82.5,   "Pin Diameter": 57,    "Inside Length": 197},
-
-    # G209 series (17 entries)
-    "G209 - 1/3T":   {"SWL": 0.33,  "Jaw Width": 9.65,   "Pin Diameter": 6.35,  "Inside Length": 22.4},
-    "G209 - 1/2T":   {"SWL": 0.50,  "Jaw Width": 11.9,   "Pin Diameter": 7.85,  "Inside Length": 28.7},
-    "G209 - 3/4T":   {"SWL": 0.75,  "Jaw Width": 13.5,   "Pin Diameter": 9.65,  "Inside Length": 31},
-    "G209 - 1T":     {"SWL": 1,     "Jaw Width": 16.8,   "Pin Diameter": 11.2,  "Inside Length": 36.6},
-    "G209 - 1-1/2T": {"SWL": 1.50,  "Jaw Width": 19.1,   "Pin Diameter": 12.7,  "Inside Length": 42.9},
-    "G209 - 2T":     {"SWL": 2,     "Jaw Width": 20.6,   "Pin Diameter": 16,    "Inside Length": 47.8},
-    "G209 - 3-1/4T": {"SWL": 3.25,  "Jaw Width": 26.9,   "Pin Diameter": 19.1,  "Inside Length": 60.5},
-    "G209 - 4-3/4T": {"SWL": 4.75,  "Jaw Width": 31.8,   "Pin Diameter": 22.4,  "Inside Length": 71.5},
-    "G209 - 6-1/2T": {"SWL": 6.50,  "Jaw Width": 36.6,   "Pin Diameter": 25.4,  "Inside Length": 84},
-    "G209 - 8-1/2T": {"SWL": 8.50,  "Jaw Width": 42.9,   "Pin Diameter": 28.7,  "Inside Length": 95.5},
-    "G209 - 9-1/2T": {"SWL": 9.50,  "Jaw Width": 46.0,   "Pin Diameter": 31.8,  "Inside Length": 108},
-    "G209 - 12T":    {"SWL": 12,    "Jaw Width": 51.5,   "Pin Diameter": 35.1,  "Inside Length": 119},
-    "G209 - 13-1/2T":{"SWL": 13.50, "Jaw Width": 57,     "Pin Diameter": 38.1,  "Inside Length": 133},
-    "G209 - 17T":    {"SWL": 17,    "Jaw Width": 60.5,   "Pin Diameter": 41.4,  "Inside Length": 146},
-    "G209 - 25T":    {"SWL": 25,    "Jaw Width": 73,     "Pin Diameter": 51,    "Inside Length": 178},
-    "G209 - 35T":    {"SWL": 35,    "Jaw Width": 82.5,   "Pin Diameter": 57,    "Inside Length": 197},
-    "G209 - 55T":    {"SWL": 55,    "Jaw Width": 105,    "Pin Diameter": 70,    "Inside Length": 267},
-
-    # G2130 series (20 entries)
-    "G2130 - 1/3T":   {"SWL": 0.33,  "Jaw Width": 9.65,  "Pin Diameter": 6.35,  "Inside Length": 22.4},
-    "G2130 - 1/2T":   {"SWL": 0.50,  "Jaw Width": 11.9,  "Pin Diameter": 7.85,  "Inside Length": 28.7},
-    "G2130 - 3/4T":   {"SWL": 0.75,  "Jaw Width": 13.5,  "Pin Diameter": 9.65,  "Inside Length": 31},
-    "G2130 - 1T":     {"SWL": 1,     "Jaw Width": 16.8,  "Pin Diameter": 11.2,  "Inside Length": 36.6},
-    "G2130 - 1-1/2T": {"SWL": 1.50,  "Jaw Width": 19.1,  "Pin Diameter": 12.7,  "Inside Length": 42.9},
-    "G2130 - 2T":     {"SWL": 2,     "Jaw Width": 20.6,  "Pin Diameter": 16,    "Inside Length": 47.8},
-    "G2130 - 3-1/4T": {"SWL": 3.25,  "Jaw Width": 26.9,  "Pin Diameter": 19.1,  "Inside Length": 60.5},
-    "G2130 - 4-3/4T": {"SWL": 4.75,  "Jaw Width": 31.8,  "Pin Diameter": 22.4,  "Inside Length": 71.5},
-    "G2130 - 6-1/2T": {"SWL": 6.50,  "Jaw Width": 36.6,  "Pin Diameter": 25.4,  "Inside Length": 84},
-    "G2130 - 8-1/2T": {"SWL": 8.50,  "Jaw Width": 42.9,  "Pin Diameter": 28.7,  "Inside Length": 95.5},
-    "G2130 - 9-1/2T": {"SWL": 9.50,  "Jaw Width": 46,    "Pin Diameter": 31.8,  "Inside Length": 108},
-    "G2130 - 12T":    {"SWL": 12,    "Jaw Width": 51.5,  "Pin Diameter": 35.1,  "Inside Length": 119},
-    "G2130 - 13-1/2T":{"SWL": 13.50, "Jaw Width": 57,    "Pin Diameter": 38.1,  "Inside Length": 133},
-    "G2130 - 17T":    {"SWL": 17,    "Jaw Width": 60.5,  "Pin Diameter": 41.4,  "Inside Length": 146},
-    "G2130 - 25T":    {"SWL": 25,    "Jaw Width": 73,    "Pin Diameter": 51,    "Inside Length": 178},
-    "G2130 - 35T":    {"SWL": 35,    "Jaw Width": 82.5,  "Pin Diameter": 57,    "Inside Length": 197},
-    "G2130 - 55T":    {"SWL": 55,    "Jaw Width": 105,   "Pin Diameter": 70,    "Inside Length": 267},
-    "G2130 - 85T":    {"SWL": 85,    "Jaw Width": 127,   "Pin Diameter": 82.5,  "Inside Length": 330},
-    "G2130 - 120T":   {"SWL": 120,   "Jaw Width": 133,   "Pin Diameter": 95.5,  "Inside Length": 372},
-    "G2130 - 150T":   {"SWL": 150,   "Jaw Width": 140,   "Pin Diameter": 108,   "Inside Length": 368},
-
-    # G2140 series (21 entries)
-    "G2140 - 2T":      {"SWL": 2,     "Jaw Width": 16.8,  "Pin Diameter": 11.2,  "Inside Length": 36.6},
-    "G2140 - 2.67T":   {"SWL": 2.67,  "Jaw Width": 19.1,  "Pin Diameter": 12.7,  "Inside Length": 42.9},
-    "G2140 - 3.33T":   {"SWL": 3.33,  "Jaw Width": 20.6,  "Pin Diameter": 16.3,  "Inside Length": 47.8},
-    "G2140 - 5T":      {"SWL": 5,     "Jaw Width": 26.9,  "Pin Diameter": 19.6,  "Inside Length": 60.5},
-    "G2140 - 7T":      {"SWL": 7,     "Jaw Width": 31.8,  "Pin Diameter": 22.6,  "Inside Length": 71.4},
-    "G2140 - 9.5T":    {"SWL": 9.5,   "Jaw Width": 36.6,  "Pin Diameter": 25.9,  "Inside Length": 84.1},
-    "G2140 - 12.5T":   {"SWL": 12.5,  "Jaw Width": 42.9,  "Pin Diameter": 29.2,  "Inside Length": 95.3},
-    "G2140 - 15T":     {"SWL": 15,    "Jaw Width": 46,    "Pin Diameter": 31.8,  "Inside Length": 108},
-    "G2140 - 18T":     {"SWL": 18,    "Jaw Width": 51.6,  "Pin Diameter": 35.6,  "Inside Length": 119.1},
-    "G2140 - 21T":     {"SWL": 21,    "Jaw Width": 57.2,  "Pin Diameter": 38.9,  "Inside Length": 133.4},
-    "G2140 - 30T":     {"SWL": 30,    "Jaw Width": 60.5,  "Pin Diameter": 41.4,  "Inside Length": 146},
-    "G2140 - 40T":     {"SWL": 40,    "Jaw Width": 73.2,  "Pin Diameter": 50.8,  "Inside Length": 178},
-    "G2140 - 55T":     {"SWL": 55,    "Jaw Width": 82.6,  "Pin Diameter": 57.2,  "Inside Length": 197},
-    "G2140 - 85T":     {"SWL": 85,    "Jaw Width": 105,   "Pin Diameter": 69.9,  "Inside Length": 267},
-    "G2140 - 120T":    {"SWL": 120,   "Jaw Width": 127,   "Pin Diameter": 82.6,  "Inside Length": 330},
-    "G2140 - 150T":    {"SWL": 150,   "Jaw Width": 133,   "Pin Diameter": 95.3,  "Inside Length": 372},
-    "G2140 - 175T":    {"SWL": 175,   "Jaw Width": 140,   "Pin Diameter": 108,   "Inside Length": 368},
-    "G2140 - 200T":    {"SWL": 200,   "Jaw Width": 184,   "Pin Diameter": 121,   "Inside Length": 386},
-    "G2140 - 250T":    {"SWL": 250,   "Jaw Width": 216,   "Pin Diameter": 127,   "Inside Length": 470},
-    "G2140 - 300T":    {"SWL": 300,   "Jaw Width": 213,   "Pin Diameter": 152,   "Inside Length": 475},
-    "G2140 - 400T":    {"SWL": 400,   "Jaw Width": 210,   "Pin Diameter": 178,   "Inside Length": 572}
-}
+import os
+import tempfile
+import uuid
+
+from padeye.core import CHECK_NAMES
+from padeye.data import SHACKLE_SERIES, shackle_data
+from padeye.graph import DesignGraph
+from padeye.timing import StageTimer
+
+# The batch, optimizer and reliability modes and the diagram pull in NumPy,
+# pandas and PIL; they are imported where used so the page starts quickly.
+
+DIAGRAM_CACHE_ENTRIES = 256
+
+
+@st.cache_data(max_entries=DIAGRAM_CACHE_ENTRIES, show_spinner=False)
+def cached_diagram_png(key):
+    from padeye.diagram import draw_diagram, encode_png
+    with timer.stage("Diagram draw"):
+        image = draw_diagram(*key)
+    with timer.stage("PNG encode"):
+        return encode_png(image)
+
+
+@st.cache_resource(show_spinner="Loading capacity tables...")
+def capacity_envelope(fop):
+    from padeye.envelope import load_envelope
+    return load_envelope(fop=fop)
+
+
+@st.cache_resource(show_spinner=False)
+def result_cache():
+    from padeye.cache import ResultCache
+    return ResultCache()
+
+
+# Stage timings are shown in the sidebar with ?debug=1 or PADEYE_DEBUG=1 and
+# appended as JSON lines to $PADEYE_TRACE_FILE; otherwise the timer is a no-op
+debug = os.environ.get("PADEYE_DEBUG", "") not in ("", "0") or st.query_params.get("debug") == "1"
+trace_file = os.environ.get("PADEYE_TRACE_FILE")
+timer = StageTimer(enabled=debug or bool(trace_file))
+timer.section("Page setup")
+
+
+def finish_run():
+    """Close the timer, show its stages with debug and append the run to the trace file."""
+    timer.finish()
+    if debug:
+        with st.sidebar.expander("Stage Timings", expanded=True):
+            st.table([{"Stage": "↳ " * stage["depth"] + stage["name"], "ms": f"{stage['ms']:.2f}"}
+                      for stage in timer.stages])
+            st.caption(f"Total script time: {timer.total_ms:.1f} ms")
+    if trace_file:
+        try:
+            timer.export(trace_file, session=st.session_state.setdefault("trace_session", uuid.uuid4().hex),
+                         mode=mode)
+        except OSError as e:
+            st.sidebar.warning(f"Could not write timing trace: {e}")
+
+
+def stop_run():
+    """``st.stop()`` for the modes that end early, after recording the run's timings."""
+    finish_run()
+    st.stop()
+
 
 st.title("Pad-Eye Design & Shackle Selection Tool")
+mode = st.sidebar.radio("Mode:", ["Single Design", "Batch Schedule", "Bulk Report", "Optimizer", "Reliability", "Capacity Envelope",
+                                  "Lift Arrangement"])
+timer.section(mode)
+
+# ---------------------------------------------------------
+# Batch Lift Schedule
+# ---------------------------------------------------------
+if mode == "Batch Schedule":
+    from padeye.schedule import SCHEDULE_COLUMNS, DEFAULT_CHUNKSIZE, run_schedule
+
+    st.header("Batch Lift Schedule")
+    st.markdown(
+        "Upload a CSV or Excel schedule with one row per pad-eye and the columns "
+        + ", ".join(f"`{c}`" for c in SCHEDULE_COLUMNS)
+        + " (an optional `padeye` column is used as the identifier). Put a series name such as `G2130` "
+        "in the `shackle` column to auto-select the smallest adequate shackle of that series."
+    )
+    uploaded = st.file_uploader("Lift schedule:", type=["csv", "xlsx"])
+    chunksize = st.number_input("Rows per chunk:", value=DEFAULT_CHUNKSIZE, min_value=100, step=1000)
+    csv_output = st.checkbox("Write results as CSV (faster for very large schedules)")
+
+    if uploaded is not None and st.button("Run Schedule Checks"):
+        suffix = ".csv" if csv_output else ".xlsx"
+        progress_text = st.empty()
+        with tempfile.TemporaryDirectory() as tmp:
+            out_path = os.path.join(tmp, "padeye_results" + suffix)
+            try:
+                stats = run_schedule(uploaded, out_path, chunksize=int(chunksize), filename=uploaded.name,
+                                     progress=lambda n: progress_text.write(f"Processed {n:,} rows..."))
+            except ValueError as e:
+                st.error(f"Could not process schedule: {str(e)}")
+                stop_run()
+            with open(out_path, "rb") as f:
+                result_bytes = f.read()
+
+        progress_text.empty()
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Rows checked", f"{stats['rows']:,}")
+        col2.metric("Rows failing", f"{stats['failed']:,}")
+        col3.metric("Rows / sec", f"{stats['rows_per_sec']:,.0f}")
+        st.download_button(
+            label="Download Results",
+            data=result_bytes,
+            file_name="padeye_results" + suffix,
+            mime="text/csv" if csv_output else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+    stop_run()
+
+# ---------------------------------------------------------
+# Bulk Calculation Report
+# ---------------------------------------------------------
+if mode == "Bulk Report":
+    from padeye.report import run_report
+
+    st.header("Bulk Calculation Report")
+    st.markdown("Upload a lift schedule (same columns as the batch schedule) to get a calculation sheet and "
+                "schematic for every pad-eye. Pad-eyes with the same geometry share one rendered schematic.")
+    uploaded = st.file_uploader("Lift schedule:", type=["csv", "xlsx"], key="report_upload")
+    report_kind = st.radio("Report format:", ["Zip of per-pad-eye HTML sheets", "Excel workbook (summary + diagrams)"])
+    report_diagrams = st.radio("Schematics in zip reports:", ["PNG", "SVG"], horizontal=True)
+    workers = st.number_input("Diagram rendering workers:", value=os.cpu_count() or 1, min_value=1, step=1)
+
+    if uploaded is not None and st.button("Generate Reports"):
+        suffix = ".zip" if report_kind.startswith("Zip") else ".xlsx"
+        progress_text = st.empty()
+        with tempfile.TemporaryDirectory() as tmp:
+            out_path = os.path.join(tmp, "padeye_reports" + suffix)
+            try:
+                stats = run_report(uploaded, out_path, filename=uploaded.name, workers=int(workers),
+                                   diagram_format=report_diagrams.lower() if suffix == ".zip" else "png",
+                                   progress=lambda n: progress_text.write(f"Processed {n:,} pad-eyes..."))
+            except ValueError as e:
+                st.error(f"Could not process schedule: {str(e)}")
+                stop_run()
+            with open(out_path, "rb") as f:
+                report_bytes = f.read()
+
+        progress_text.empty()
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Pad-eyes", f"{stats['rows']:,}")
+        col2.metric("Failing", f"{stats['failed']:,}")
+        col3.metric("Schematics rendered", f"{stats['diagrams']:,}")
+        st.caption(f"{stats['diagrams_reused']:,} schematics reused; {stats['seconds']:.2f} s.")
+        st.download_button(
+            label="Download Reports",
+            data=report_bytes,
+            file_name="padeye_reports" + suffix,
+            mime="application/zip" if suffix == ".zip" else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+    stop_run()
+
+# ---------------------------------------------------------
+# Minimum-Weight Optimizer
+# ---------------------------------------------------------
+if mode == "Optimizer":
+    from padeye.optimizer import optimize_padeye
+
+    st.header("Minimum-Weight Pad-Eye Optimizer")
+    st.markdown("Searches shackle, plate thicknesses, radius, base length and weld size "
+                "for the lightest pad-eye that passes every design check.")
+    col1, col2 = st.columns(2)
+    with col1:
+        opt_Ps    = st.number_input("Static sling load (Ps) in kN:", value=100.0, min_value=0.0, step=1.0, format="%.2f", key="opt_Ps")
+        opt_DAF   = st.number_input("Dynamic Amplification Factor, DAF (f):", value=1.3, min_value=0.0, step=0.1, format="%.2f", key="opt_DAF")
+        opt_theta = st.number_input("Loading angle with horizontal (θ) in degrees:", value=60.0, min_value=0.0, max_value=90.0, step=0.1, format="%.2f", key="opt_theta")
+        opt_phi   = st.number_input("Sling's out-of-plane angle with pad-eye (φ) in degrees:", value=0.0, min_value=0.0, max_value=90.0, step=0.1, format="%.2f", key="opt_phi")
+        opt_fop   = st.number_input("Additional out-of-plane load percentage (fop) in %:", value=5.0, min_value=0.0, step=0.1, format="%.2f", key="opt_fop")
+    with col2:
+        opt_fy    = st.number_input("Yield Strength of Pad-Eye Plate (fy) in MPa:", value=355.0, min_value=0.0, step=10.0, format="%.2f", key="opt_fy")
+        opt_dr    = st.number_input("Rope Diameter selected (dr) in mm:", value=0.0, min_value=0.0, step=0.1, format="%.2f", key="opt_dr")
+        opt_spread = st.number_input("Minimum Shackle Spread Percentage required (%):", value=0.0, min_value=0.0, step=0.1, format="%.2f", key="opt_spread")
+        opt_series = st.multiselect("Shackle Series:", SHACKLE_SERIES, default=list(SHACKLE_SERIES))
+
+    if st.button("Find Lightest Passing Pad-Eye"):
+        result = optimize_padeye(opt_Ps, opt_DAF, opt_theta, opt_phi, opt_fop, opt_fy,
+                                 dr=opt_dr, min_spread=opt_spread, series=opt_series)
+        design = result["design"]
+        if design is None:
+            st.error("❌ No geometry in the search space passes all design checks.")
+        else:
+            st.success(f"✅ Lightest passing design: {design['shackle']}, {design['weight_kg']:.2f} kg")
+            st.write(f"Pad-eye Hole Diameter (dh): {design['dh']:.2f} mm")
+            st.write(f"Radius of Main Plate (R): {design['R']:.2f} mm")
+            st.write(f"Main Plate Thickness (T): {design['T']:.2f} mm")
+            st.write(f"Cheek Plate Thickness (t): {design['t_val']:.2f} mm")
+            st.write(f"Pad-eye Base Length (l): {design['l_val']:.2f} mm")
+            st.write(f"Weld thickness (twc): {design['twc']:.2f} mm")
+            for check_name, values in result["safety_checks"].items():
+                status = "PASSED ✅" if values["passed"] else "FAILED ❌"
+                st.write(f"**{check_name}:** {status} (actual {values['actual']:.2f} / allowable {values['allowable']:.2f} MPa)")
+        st.caption(f"Of {result['grid_size']:,} grid points, {result['pruned']:,} were pruned and "
+                   f"{result['searched']:,} resolved by bisection with {result['evaluated']:,} "
+                   f"check evaluations, in {result['seconds']:.2f} s.")
+    stop_run()
+
+# ---------------------------------------------------------
+# Monte Carlo Reliability
+# ---------------------------------------------------------
+if mode == "Reliability":
+    from padeye.reliability import VARIABLES, DISTRIBUTIONS, run_reliability
+
+    st.header("Monte Carlo Reliability Analysis")
+    st.markdown("Distribution parameters: fixed → value; normal / lognormal → mean, standard deviation; "
+                "uniform → lower, upper bound.")
+    rel_labels = {
+        "Ps": ("Static sling load (Ps) in kN", 100.0, 10.0),
+        "DAF": ("Dynamic Amplification Factor (DAF)", 1.3, 0.1),
+        "theta": ("Loading angle with horizontal (θ) in degrees", 60.0, 5.0),
+        "phi": ("Out-of-plane angle (φ) in degrees", 5.0, 2.0),
+        "fop": ("Additional out-of-plane load (fop) in %", 5.0, 1.0),
+        "fy": ("Yield Strength (fy) in MPa", 355.0, 20.0),
+    }
+    distributions = {}
+    for name in VARIABLES:
+        label, mean, spread = rel_labels[name]
+        col1, col2, col3 = st.columns([2, 1, 1])
+        kind = col1.selectbox(f"{label}:", DISTRIBUTIONS, index=1, key=f"rel_kind_{name}")
+        p1 = col2.number_input("Value / mean / lower:", value=mean, step=0.1, format="%.2f", key=f"rel_p1_{name}")
+        if kind == "fixed":
+            distributions[name] = (kind, p1)
+        else:
+            p2 = col3.number_input("Std. dev. / upper:", value=spread, step=0.1, format="%.2f", key=f"rel_p2_{name}")
+            distributions[name] = (kind, p1, p2)
+
+    rel_shackle = st.selectbox("Select a Shackle Type:", list(shackle_data.keys()), key="rel_shackle")
+    rel_twc = st.number_input("Weld thickness between Cheek Plate and Pad-Eye Plate (twc) in mm:",
+                              value=6.0, min_value=0.0, step=0.1, format="%.2f", key="rel_twc")
+    n_samples = st.number_input("Number of samples:", value=1_000_000, min_value=1000, step=100_000)
+    workers = st.number_input("Worker processes:", value=os.cpu_count() or 1, min_value=1, step=1)
+
+    if st.button("Run Reliability Analysis"):
+        progress_bar = st.progress(0.0)
+        try:
+            result = run_reliability(distributions, rel_shackle, rel_twc, n_samples=int(n_samples),
+                                     workers=int(workers),
+                                     progress=lambda n: progress_bar.progress(n / int(n_samples)))
+        except ValueError as e:
+            st.error(f"Could not run reliability analysis: {str(e)}")
+            stop_run()
+        progress_bar.empty()
+        st.table([
+            {
+                "Check": name,
+                "Failures": result["failures"][name],
+                "Probability of failure": f"{result['pf'][name]:.3e}",
+                "95% CI": f"{result['ci'][name][0]:.3e} – {result['ci'][name][1]:.3e}",
+            }
+            for name in result["pf"]
+        ])
+        st.caption(f"{result['samples']:,} samples in {result['seconds']:.2f} s.")
+    stop_run()
+
+# ---------------------------------------------------------
+# Capacity Envelope
+# ---------------------------------------------------------
+if mode == "Capacity Envelope":
+    import numpy as np
+    import pandas as pd
+
+    st.header("Capacity Envelope")
+    st.markdown("Maximum static sling load Ps for a shackle's auto-sized pad-eye, looked up "
+                "conservatively from precomputed capacity tables.")
+    col1, col2 = st.columns(2)
+    with col1:
+        env_shackle = st.selectbox("Select a Shackle Type:", list(shackle_data.keys()), key="env_shackle")
+        env_fy    = st.number_input("Yield Strength of Pad-Eye Plate (fy) in MPa:", value=355.0, min_value=0.0, step=10.0, format="%.2f", key="env_fy")
+        env_DAF   = st.number_input("Dynamic Amplification Factor, DAF (f):", value=1.3, min_value=0.01, step=0.1, format="%.2f", key="env_DAF")
+        env_twc   = st.number_input("Weld thickness between Cheek Plate and Pad-Eye Plate (twc) in mm:", value=6.0, min_value=0.0, step=0.1, format="%.2f", key="env_twc")
+    with col2:
+        env_theta = st.number_input("Loading angle with horizontal (θ) in degrees:", value=60.0, min_value=0.0, max_value=90.0, step=0.1, format="%.2f", key="env_theta")
+        env_phi   = st.number_input("Sling's out-of-plane angle with pad-eye (φ) in degrees:", value=5.0, min_value=0.0, max_value=90.0, step=0.1, format="%.2f", key="env_phi")
+        env_fop   = st.number_input("Additional out-of-plane load percentage (fop) in %:", value=0.0, min_value=0.0, step=0.1, format="%.2f", key="env_fop")
+
+    envelope = capacity_envelope(env_fop)
+    max_Ps, governing, limits = envelope.max_static_load(env_shackle, env_fy, env_theta, env_phi, env_DAF, env_twc)
+    st.metric("Maximum static sling load (Ps)", f"{max_Ps:.2f} kN")
+    st.write(f"**Governing limit:** {governing}")
+    st.table([{"Limit": name, "Max Ps (kN)": f"{value:.2f}" if np.isfinite(value) else "—"}
+              for name, value in limits.items()])
+
+    # Envelope over θ at the selected φ; unbounded limits are left off the chart
+    _, _, curves = envelope.max_static_load([env_shackle] * len(envelope.theta), env_fy,
+                                            envelope.theta, env_phi, env_DAF, env_twc)
+    chart = pd.DataFrame({name: np.where(np.isfinite(values), values, np.nan) for name, values in curves.items()},
+                         index=pd.Index(envelope.theta, name="θ (degrees)"))
+    chart["Envelope"] = chart.min(axis=1)
+    st.line_chart(chart, y_label="Max Ps (kN)")
+    st.caption(f"Tables: {envelope.path} ({envelope.header['theta_step']:g}° grid; each cell gives the lowest "
+               f"capacity within it). Verify the final design with the full checks.")
+    stop_run()
+
+# ---------------------------------------------------------
+# Multi-Point Lift Arrangement
+# ---------------------------------------------------------
+if mode == "Lift Arrangement":
+    import numpy as np
+    import pandas as pd
+    from padeye.lift import check_lift, cog_envelope, envelope_summary, padeye_orientations
+
+    st.header("Lift Arrangement")
+    st.markdown("Sling loads of a 2- or 4-point lift with the hook above the centre of gravity, checked "
+                "over every COG shift and hook height. List 4-point pad-eyes around the perimeter; "
+                "coordinates in m, plates aligned with the slings at the nominal COG.")
+    lift_padeyes = st.data_editor(pd.DataFrame({
+        "Pad-Eye": ["PE-1", "PE-2", "PE-3", "PE-4"],
+        "x": [-5.0, 5.0, 5.0, -5.0],
+        "y": [-2.0, -2.0, 2.0, 2.0],
+        "z": [0.0, 0.0, 0.0, 0.0],
+        "Shackle": ["G2130 - 17T"] * 4,
+    }), num_rows="dynamic", key="lift_padeyes",
+        column_config={"Shackle": st.column_config.SelectboxColumn(options=list(shackle_data.keys()), required=True)})
+    col1, col2 = st.columns(2)
+    with col1:
+        lift_weight = st.number_input("Lift weight in kN:", value=400.0, min_value=0.01, step=10.0, format="%.2f", key="lift_weight")
+        lift_cog_x  = st.number_input("COG x in m:", value=0.0, step=0.1, format="%.2f", key="lift_cog_x")
+        lift_cog_y  = st.number_input("COG y in m:", value=0.0, step=0.1, format="%.2f", key="lift_cog_y")
+        lift_hook   = st.number_input("Hook height (z) in m:", value=8.0, min_value=0.01, step=0.5, format="%.2f", key="lift_hook")
+        lift_DAF    = st.number_input("Dynamic Amplification Factor, DAF (f):", value=1.3, min_value=0.01, step=0.1, format="%.2f", key="lift_DAF")
+        lift_fop    = st.number_input("Additional out-of-plane load percentage (fop) in %:", value=5.0, min_value=0.0, step=0.1, format="%.2f", key="lift_fop")
+    with col2:
+        lift_dx     = st.number_input("COG shift ± x in m:", value=0.5, min_value=0.0, step=0.1, format="%.2f", key="lift_dx")
+        lift_dy     = st.number_input("COG shift ± y in m:", value=0.25, min_value=0.0, step=0.1, format="%.2f", key="lift_dy")
+        lift_steps  = st.number_input("COG grid points per axis:", value=21, min_value=1, step=2, key="lift_steps")
+        lift_hook_max = st.number_input("Highest hook height in m:", value=12.0, min_value=0.01, step=0.5, format="%.2f", key="lift_hook_max")
+        lift_hook_steps = st.number_input("Hook heights:", value=9, min_value=1, step=1, key="lift_hook_steps")
+        lift_fy     = st.number_input("Yield Strength of Pad-Eye Plate (fy) in MPa:", value=355.0, min_value=0.0, step=10.0, format="%.2f", key="lift_fy")
+        lift_twc    = st.number_input("Weld thickness between Cheek Plate and Pad-Eye Plate (twc) in mm:", value=6.0, min_value=0.0, step=0.1, format="%.2f", key="lift_twc")
+
+    if st.button("Solve Lift & Check Pad-Eyes"):
+        table = lift_padeyes.dropna()
+        coords = table[["x", "y", "z"]].to_numpy(dtype=float)
+        cogs, hooks = cog_envelope((lift_cog_x, lift_cog_y), (lift_dx, lift_dy), int(lift_steps),
+                                   np.linspace(lift_hook, max(lift_hook, lift_hook_max), int(lift_hook_steps)))
+        try:
+            result = check_lift(coords, lift_weight, cogs, hooks, lift_DAF, lift_fop, table["Shackle"].to_numpy(dtype=object),
+                                lift_fy, lift_twc, padeye_orientations(coords, (lift_cog_x, lift_cog_y)))
+        except (ValueError, KeyError) as e:
+            st.error(f"Could not solve lift: {str(e)}")
+            stop_run()
+
+        # Case 0 is the nominal COG at the lowest hook height
+        st.subheader("Nominal Lift")
+        st.table(pd.DataFrame({
+            "Pad-Eye": table["Pad-Eye"].to_numpy(),
+            "Sling load Ps (kN)": result["tension"][0].round(2),
+            "θ (degrees)": result["theta"][0].round(2),
+            "φ (degrees)": result["phi"][0].round(2),
+            "Utilisation": result["utilisation"][0].round(3),
+            "Governing": result["governing"][0],
+            "Status": np.where(result["all_passed"][0], "PASS", "FAIL"),
+        }))
+        st.subheader("COG / Hook-Height Envelope")
+        summary = envelope_summary(result)
+        st.table(pd.DataFrame([{
+            "Pad-Eye": padeye,
+            "Max Ps (kN)": round(row["max_tension"], 2),
+            "Min θ (degrees)": round(row["min_theta"], 2),
+            "Max φ (degrees)": round(row["max_phi"], 2),
+            "Max utilisation": round(row["max_utilisation"], 3),
+            "Governing": row["governing"],
+            "Worst COG (x, y)": f"{cogs[row['worst_case'], 0]:.2f}, {cogs[row['worst_case'], 1]:.2f}",
+            "Worst hook height": round(float(hooks[row["worst_case"]]), 2),
+            "Failing cases": row["failing_cases"],
+        } for padeye, row in zip(table["Pad-Eye"], summary)]))
+        failing = int(np.count_nonzero(~result["all_passed"].all(axis=1)))
+        if failing:
+            st.error(f"{failing:,} of {len(cogs):,} lift cases fail a check, overload a shackle or slacken a sling.")
+        else:
+            st.success(f"All pad-eyes pass in all {len(cogs):,} lift cases.")
+        if len(coords) == 2 and result["unbalanced"].max() > 1e-6 * lift_weight:
+            st.warning("Some COG positions are off the line between the pad-eyes; the load would rotate "
+                       f"(up to {result['unbalanced'].max():.2f} kN unbalanced).")
+    stop_run()
+
+# SVG scales to fit any pad-eye and is a fraction of the PNG payload
+diagram_format = st.sidebar.radio("Schematic format:", ["PNG", "SVG"], horizontal=True)
+
+# Results shared on disk with teammates re-verifying the same standard pad-eyes
+use_cache = st.sidebar.checkbox("Use result cache", help="Look up and store check results in the SQLite result cache")
+
 st.markdown("Enter all design parameters:")
 
 # ---------------------------------------------------------
 # 1: Loading Inputs
 # ---------------------------------------------------------
+timer.section("1: Loading Inputs")
 st.header("1: Loading Inputs")
 Ps    = st.number_input("Static sling load (Ps) in kN:", value=0.0, min_value=0.0, step=1.0, format="%.2f")
 DAF   = st.number_input("Dynamic Amplification Factor, DAF (f):", value=0.0, min_value=0.0, step=0.1, format="%.2f")
@@ -109,23 +402,30 @@ fop   = st.number_input("Additional out-of-plane load percentage (fop) in %:", v
 # ---------------------------------------------------------
 # 2: Shackle Details
 # ---------------------------------------------------------
+timer.section("2: Shackle Details")
 st.header("2: Shackle Details")
-selected_shackle = st.selectbox("Select a Shackle Type:", list(shackle_data.keys()))
-
-# Conversion factor: 1 metric ton (MT) = 10 kN 
-conversion_factor = 10
-
-# Get SWL in MT from the dictionary and convert to kN.
-Psh_mt = shackle_data[selected_shackle]["SWL"]
-Psh = Psh_mt * conversion_factor
+auto_select = st.checkbox("Auto-select the smallest adequate shackle")
+if auto_select:
+    from padeye.selection import select_shackles
+
+    shackle_series = st.selectbox("Shackle Series:", SHACKLE_SERIES)
+    # dr and min spread are entered further down the page; use their current values
+    selected_shackle = select_shackles(Ps, st.session_state.get("dr", 0.0),
+                                       st.session_state.get("min_spread", 0.0), shackle_series)[0]
+    if selected_shackle is None:
+        st.error(f"No {shackle_series} shackle carries {Ps:.2f} kN with the required clearance and spread.")
+        stop_run()
+    st.write(f"**Selected Shackle:** {selected_shackle}")
+else:
+    selected_shackle = st.selectbox("Select a Shackle Type:", list(shackle_data.keys()))
 
-# Use the other parameters directly
-# [Previous code remains identical until the button click section]
+# The calculation is a dependency graph kept across reruns: reading a
+# quantity recomputes it only if an input it depends on has changed
+graph = st.session_state.setdefault("design_graph", DesignGraph())
+graph.set_inputs(Ps=Ps, DAF=DAF, theta=theta, phi=phi, fop=fop, shackle=selected_shackle)
 
-# Use the other parameters directly from the dictionary (they are in mm)
-B_val = shackle_data[selected_shackle]["Pin Diameter"]
-A_val = shackle_data[selected_shackle]["Jaw Width"]
-C_val = shackle_data[selected_shackle]["Inside Length"]
+# SWL converted from MT to kN; the other parameters are in mm
+Psh, A_val, B_val, C_val = graph["Psh"], graph["A_val"], graph["B_val"], graph["C_val"]
 
 # Display the auto-filled values
 st.write(f"**SWL of Shackle:** {Psh:.2f} kN")
@@ -136,23 +436,23 @@ st.write(f"**Inside Length (C):** {C_val:.2f} mm")
 # ---------------------------------------------------------
 # 3: Rope/Sling Details
 # ---------------------------------------------------------
+timer.section("3: Rope/Sling Details")
 st.header("3: Rope/Sling Details")
 fr  = st.number_input("FOS against MBL of rope (fr):", value=0.0, min_value=0.0, step=0.1, format="%.2f")
 MBL = st.number_input("MBL of rope required (MBL) in Kn:", value=0.0, min_value=0.0, step=0.1, format="%.2f")
-dr  = st.number_input("Rope Diameter selected (dr) in mm:", value=0.0, min_value=0.0, step=0.1, format="%.2f")
+dr  = st.number_input("Rope Diameter selected (dr) in mm:", value=0.0, min_value=0.0, step=0.1, format="%.2f", key="dr")
 
 # ---------------------------------------------------------
 # 4: Pad-Eye Dimensions and Shackle Compatibility
 # ---------------------------------------------------------
+timer.section("4: Pad-Eye Dimensions")
 st.header("4: Pad-Eye Dimensions and Shackle Compatibility")
 # --- Auto-calculate these values ---
-dh = B_val + 1.5              # Pad-eye hole diameter
-R = C_val + (dh / 2)          # Radius of main plate
-r_val = R                     # Radius of cheek plate
-T = round(0.75 * A_val, 2)    # Thickness of main plate
-t_val = round((A_val - T)/2, 2) # Thickness of cheek plate
-l_val = 2 * R                 # Base length of pad-eye
-e_val = R                     # Eccentricity from base
+graph.set_inputs(dr=dr)
+geometry = graph.geometry()
+dh, R, r_val = geometry["dh"], geometry["R"], geometry["r_val"]
+T, t_val = geometry["T"], geometry["t_val"]
+l_val, e_val = geometry["l_val"], geometry["e_val"]
 
 # Display for user's awareness
 st.subheader("Auto-Calculated Pad-Eye Dimensions")
@@ -164,130 +464,65 @@ st.write(f"Pad-eye Base Length (l): {l_val:.2f} mm")
 st.write(f"Eccentricity (e): {e_val:.2f} mm")
 
 fy   = st.number_input("Yield Strength of Pad-Eye Plate (fy) in MPa:", value=0.0, min_value=0.0, step=10.0, format="%.2f")
-min_spread = st.number_input("Minimum Shackle Spread Percentage required (%):", value=0.0, min_value=0.0, step=0.1, format="%.2f")
+min_spread = st.number_input("Minimum Shackle Spread Percentage required (%):", value=0.0, min_value=0.0, step=0.1, format="%.2f", key="min_spread")
 twc  = st.number_input("Weld thickness between Cheek Plate and Pad-Eye Plate (twc) in mm:", value=0.0, min_value=0.0, step=0.1, format="%.2f")
 
 # ---------------------------------------------------------
 # Derived Geometry Calculations
 # ---------------------------------------------------------
+timer.section("Derived Geometry")
 st.header("Derived Geometry Information")
-min_inside_length_required = 1.5 * dr
-actual_inside_length = C_val - (R - (dh / 2))
-jaw_width_clearance = A_val - (T + 2*t_val)
-actual_shackle_spread_pct = ((T + 2*t_val) / A_val) * 100 if A_val != 0 else 0
+graph.set_inputs(fy=fy, min_spread=min_spread, twc=twc)
+clearances = graph.clearances()
+min_inside_length_required = clearances["min_inside_length_required"]
+actual_inside_length = clearances["actual_inside_length"]
+jaw_width_clearance = clearances["jaw_width_clearance"]
+actual_shackle_spread_pct = clearances["actual_shackle_spread_pct"]
 
 if st.button("Compute Derived Geometry & Design Checks"):
     st.subheader("Derived Geometry Calculations")
     st.write(f"Minimum Inside Length Clearance Required: {min_inside_length_required:.2f} mm")
-    st.write(f"Actual Inside Length Clearance Provided: {actual_inside_length:.2f} mm")
+    st.write(f"Shackle Inside Length Provided: {actual_inside_length:.2f} mm")
     st.write(f"Jaw Width Clearance Provided: {jaw_width_clearance:.2f} mm")
     st.write(f"Actual Shackle Spread Percentage: {actual_shackle_spread_pct:.2f} %")
     
-    # Safety check flags initialization
-    safety_checks = {
-        "Bearing": {"passed": True, "allowable": 0, "actual": 0},
-        "Pull-Out Shear": {"passed": True, "allowable": 0, "actual": 0},
-        "Tear Out": {"passed": True, "allowable": 0, "actual": 0},
-        "Tensile": {"passed": True, "allowable": 0, "actual": 0},
-        "Pad-Eye Base": {"passed": True, "allowable": 0, "actual": 0},
-        "Weld": {"passed": True, "allowable": 0, "actual": 0}
-    }
-
     # ---------------------------------------------------------
     # Section 2: Design Calculations
     # ---------------------------------------------------------
+    timer.section("Load Decomposition")
     st.header("DESIGN CALCULATIONS")
-    rad_theta = math.radians(theta)
-    rad_phi = math.radians(phi)
-    P = Ps * DAF
-    Pv = P * math.sin(rad_theta)
-    Ph = P * math.cos(rad_theta) * math.cos(rad_phi)
-    Po = P * math.cos(rad_theta) * math.sin(rad_phi) + (fop / 100.0) * P
+    loads = graph.loads()
+    P, Pv, Ph, Po = loads["P"], loads["Pv"], loads["Ph"], loads["Po"]
 
     st.subheader("Computed Design Loads")
     st.write(f"Design Dynamic Load (P): {P:.2f} kN")
     st.write(f"In-plane Vertical Force (Pv): {Pv:.2f} kN")
     st.write(f"In-plane Horizontal Force (Ph): {Ph:.2f} kN")
     st.write(f"Out-of-plane Force (Po): {Po:.2f} kN")
-    max_force = max(abs(Pv), abs(Ph), abs(Po))
-    st.write(f"Maximum Applied Force Component: {max_force:.2f} kN")
-    
-    # 2.1 Bearing Check
-    Ab = B_val * (T + 2*t_val)  # in mm²
-    fby = F_BY_FACTOR * fy
-    Pb_kN = (Ab * fby) / 1000.0
-
-    # ✅ Actual load: bearing stress experienced = applied load / area
-    actual_bearing_stress = Pv * 1000 / Ab  # N/mm²
-    safety_checks["Bearing"]["actual"] = actual_bearing_stress  # in MPa
-    safety_checks["Bearing"]["allowable"] = fby  # in MPa
-    
-    # 2.2 Pull-Out Shear Check
-    Av = 2 * (((R - dh/2) * T) + (2 * (r_val - dh/2) * t_val))  # mm²
-    fv = F_V_FACTOR * fy
-    pullout_load_kN = Av * fv / 1000.0
-
-    # ✅ Actual shear stress experienced
-    actual_shear_stress = Ph * 1000 / Av
-    safety_checks["Pull-Out Shear"]["actual"] = actual_shear_stress
-    safety_checks["Pull-Out Shear"]["allowable"] = fv
-
+    st.write(f"Maximum Applied Force Component: {loads['max_force']:.2f} kN")
     
-    # 2.3 Tear Out Stress Check
-    At = (2 * R - dh) * T + 2 * (2 * r_val - dh) * t_val  # mm²
-    ft = F_T_FACTOR * fy
-    tear_load_kN = At * ft / 1000.0
+    # 2.1 Bearing, 2.2 Pull-Out Shear, 2.3 Tear Out, 2.4 Tensile,
+    # 2.6 Pad-Eye Base and 2.7 Weld checks
+    timer.section("Design Checks")
+    if use_cache:
+        with timer.stage("Result cache lookup"):
+            safety_checks = result_cache().check_design(
+                Ps=Ps, DAF=DAF, theta=theta, phi=phi, fop=fop, shackle=selected_shackle,
+                fy=fy, twc=twc, dr=dr, min_spread=min_spread)["safety_checks"]
+    else:
+        safety_checks = {}
+        for check_name in CHECK_NAMES:
+            with timer.stage(f"{check_name} Check"):
+                safety_checks[check_name] = graph[check_name]
 
-    # ✅ Actual tear stress experienced
-    actual_tear_stress = Po * 1000 / At
-    safety_checks["Tear Out"]["actual"] = actual_tear_stress
-    safety_checks["Tear Out"]["allowable"] = ft
+if use_cache:
+    stats = result_cache().stats()
+    st.sidebar.caption(f"Result cache: {stats['hits']} hits, {stats['misses']} misses "
+                       f"({stats['hit_rate']:.0%} hit rate)")
 
-    
-    # 2.4 Tensile Stress Check
-    Ate = 2 * R * T  # mm²
-    fte = F_TE_FACTOR * fy
-    tensile_load_kN = Ate * fte / 1000.0
-
-    # ✅ Actual tensile stress experienced
-    actual_tensile_stress = max_force * 1000 / Ate
-    safety_checks["Tensile"]["actual"] = actual_tensile_stress
-    safety_checks["Tensile"]["allowable"] = fte
-
-    
-    # 2.6 Pad-Eye Base Check (Simplified Calculation)
-    Aba = l_val * T
-    I_ip = (T * (l_val**3)) / 12.0
-    I_op = (l_val * (T**3)) / 12.0
-    Zip = I_ip / (l_val/2.0) if l_val != 0 else float('inf')
-    Zop = I_op / (T/2.0) if T != 0 else float('inf')
-    
-    fa = (Pv * 1000.0) / Aba
-    fbip = (Ph * 1000.0 * e_val) / Zip if Zip != 0 else float('inf')
-    fbop = (Po * 1000.0 * e_val) / Zop if Zop != 0 else float('inf')
-    tau_ip = (Ph * 1000.0) / Aba
-    tau_op = (Po * 1000.0) / Aba
-    tau_combined = tau_ip + tau_op
-    sigma_vm = math.sqrt(fa**2 + fbip**2 + fbop**2 + tau_combined**2)
-    allowable_vm = 0.7 * fy
-    safety_checks["Pad-Eye Base"]["passed"] = sigma_vm <= allowable_vm
-    safety_checks["Pad-Eye Base"]["allowable"] = allowable_vm
-    safety_checks["Pad-Eye Base"]["actual"] = sigma_vm
-    
-    # 2.7 Weld Check Between Pad-Eye and Cheek Plate
-    if (T + 2*t_val) != 0:
-        Pc = P * (t_val / (T + 2*t_val))
-    else:
-        Pc = 0
-    if r_val > 0 and twc > 0:
-        Awc = 0.5 * (2 * math.pi * r_val) * (0.707 * twc)
-        tau_wc = (Pc * 1000.0) / Awc
-        safety_checks["Weld"]["passed"] = tau_wc <= ALLOWABLE_WELD_STRESS
-        safety_checks["Weld"]["allowable"] = ALLOWABLE_WELD_STRESS
-        safety_checks["Weld"]["actual"] = tau_wc
-    
 
 # Header for safety check results
+timer.section("Safety Check Results")
 st.header("Safety Check Results")
 col1, col2 = st.columns(2)
 
@@ -295,7 +530,7 @@ if "safety_checks" in locals():
     with col1:
         for check_name, values in safety_checks.items():
             # Weld check exclusion
-            if check_name == "Weld" and (r_val <= 0 or twc <= 0):
+            if check_name == "Weld" and not graph["weld_applicable"]:
                 st.warning("Weld Check: Not applicable (r or twc ≤ 0)")
                 continue
 
@@ -312,53 +547,31 @@ if "safety_checks" in locals():
 
     with col2:
         try:
-            diagram = Image.new('RGB', (500, 400), 'white')
-            draw = ImageDraw.Draw(diagram)
-            scale = 2
-            center_x, center_y = 250, 200
-
-            # Main plate
-            draw.ellipse([(center_x - R * scale, center_y - R * scale),
-                          (center_x + R * scale, center_y + R * scale)],
-                         outline='black', width=2)
-
-            # Hole
-            draw.ellipse([(center_x - dh / 2 * scale, center_y - dh / 2 * scale),
-                          (center_x + dh / 2 * scale, center_y + dh / 2 * scale)],
-                         fill='gray', outline='black')
-
-            # Cheek plates
-            cheek_height = r_val * scale * 2
-            draw.rectangle([(center_x - R * scale - t_val * scale, center_y - cheek_height / 2),
-                            (center_x - R * scale, center_y + cheek_height / 2)],
-                           outline='blue', width=2)
-            draw.rectangle([(center_x + R * scale, center_y - cheek_height / 2),
-                            (center_x + R * scale + t_val * scale, center_y + cheek_height / 2)],
-                           outline='blue', width=2)
-
-            # Base plate
-            draw.rectangle([(center_x - l_val / 2 * scale, center_y + R * scale),
-                            (center_x + l_val / 2 * scale, center_y + R * scale + T * scale)],
-                           fill='lightgray', outline='black')
-
-            # Texts
-            font = ImageFont.load_default()
-            draw.text((center_x - R * scale, center_y + R * scale + 5), f'R: {R}', fill='black', font=font)
-            draw.text((center_x - dh / 2 * scale, center_y + 25), f'dh: {dh}', fill='black', font=font)
-            draw.text((center_x - l_val / 2 * scale, center_y + R * scale + T * scale + 5), f'l: {l_val}', fill='black', font=font)
-            draw.text((center_x - R * scale - t_val * scale - 15, center_y - cheek_height / 2), f't: {t_val}', fill='black', font=font)
+            if diagram_format == "SVG":
+                # A kilobyte of text, cheaper to build than to look up in a cache
+                from padeye.svg import diagram_svg
+
+                with timer.stage("Diagram"):
+                    diagram_data = diagram_svg(R, dh, r_val, t_val, l_val, T)
+                file_name, mime = "padeye_design.svg", "image/svg+xml"
+            else:
+                # Rendered and PNG-encoded once per geometry, shared across reruns and sessions
+                from padeye.diagram import diagram_key
+
+                with timer.stage("Diagram"):
+                    diagram_data = cached_diagram_png(diagram_key(R, dh, r_val, t_val, l_val, T))
+                file_name, mime = "padeye_design.png", "image/png"
 
             # Display and download
-            st.image(diagram, caption="Pad-Eye Schematic", use_container_width=True)
-            img_bytes = io.BytesIO()
-            diagram.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
-            st.download_button(
-                label="Download Diagram",
-                data=img_bytes.getvalue(),
-                file_name="padeye_design.png",
-                mime="image/png"
-            )
+            with timer.stage("Image display"):
+                st.image(diagram_data, caption="Pad-Eye Schematic", use_container_width=True)
+            with timer.stage("Download preparation"):
+                st.download_button(
+                    label="Download Diagram",
+                    data=diagram_data,
+                    file_name=file_name,
+                    mime=mime
+                )
         except Exception as e:
             st.warning(f"Could not generate diagram: {str(e)}")
 
@@ -368,7 +581,7 @@ if "safety_checks" in locals() and isinstance(safety_checks, dict):
         all_passed = all(
             isinstance(check, dict) and check.get("passed", False)
             for name, check in safety_checks.items()
-            if not (name == "Weld" and (r_val <= 0 or twc <= 0))
+            if not (name == "Weld" and not graph["weld_applicable"])
         )
         if all_passed:
             st.success("✅ ALL DESIGN CHECKS PASSED - DESIGN IS SAFE")
@@ -380,8 +593,17 @@ if "safety_checks" in locals() and isinstance(safety_checks, dict):
 
 
 # Shackle Selection Recommendation
+timer.section("Shackle Selection")
 st.header("Shackle Selection")
 if Ps <= Psh:
     st.success(f"Recommended Shackle: {selected_shackle} with SWL {Psh:.2f} kN is adequate for static sling load ({Ps:.2f} kN).")
 else:
-    st.error(f"Warning: {selected_shackle} with SWL {Psh:.2f} kN is NOT adequate for static sling load ({Ps:.2f} kN).")
\ No newline at end of file
+    st.error(f"Warning: {selected_shackle} with SWL {Psh:.2f} kN is NOT adequate for static sling load ({Ps:.2f} kN).")
+
+report = graph.take_report()
+with st.sidebar.expander("Recalculation"):
+    st.caption(f"Recomputed {len(report['recomputed'])} quantities, reused {len(report['reused'])}.")
+    if report["reused"]:
+        st.write("Reused: " + ", ".join(report["reused"]))
+
+finish_run()